@@ -7,16 +7,214 @@ Real Amazon Q Integration
 import boto3
 import json
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .analysis_cache import CACHE_DIR_NAME
+    from .response_cache import ResponseCache
+    from .file_index import FileIndex
+    from .code_analyzer import (CONTENT_INDEX_NAMES, DEFAULT_MAX_FILE_SIZE, default_ports, is_scan_target,
+                                memory_mib)
+    from .code_selection import DEFAULT_PROMPT_TOKENS, read_text, select_code, strip_code
+    from .response_stream import IncrementalJSONParser, stream_response
+    from .bedrock_shards import (DEFAULT_REQUESTS_PER_SECOND, DEFAULT_SHARD_TOKENS, DEFAULT_SHARD_WORKERS,
+                                 TokenBucket, call_with_backoff, cpu_millis, merge_results, plan_shards)
+except ImportError:
+    from analysis_cache import CACHE_DIR_NAME
+    from response_cache import ResponseCache
+    from file_index import FileIndex
+    from code_analyzer import (CONTENT_INDEX_NAMES, DEFAULT_MAX_FILE_SIZE, default_ports, is_scan_target,
+                               memory_mib)
+    from code_selection import DEFAULT_PROMPT_TOKENS, read_text, select_code, strip_code
+    from response_stream import IncrementalJSONParser, stream_response
+    from bedrock_shards import (DEFAULT_REQUESTS_PER_SECOND, DEFAULT_SHARD_TOKENS, DEFAULT_SHARD_WORKERS,
+                                TokenBucket, call_with_backoff, cpu_millis, merge_results, plan_shards)
+
+# Bedrock 분석 모델과 호출 파라미터
+MODEL_ID = 'anthropic.claude-3-5-sonnet-20241022-v2:0'
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+MAX_TOKENS = 4000
+
+# AI 응답에 리소스 값이 없을 때 사용할 기본값
+DEFAULT_RESOURCES = {
+    "cpu_request": "250m",
+    "cpu_limit": "500m",
+    "memory_request": "512Mi",
+    "memory_limit": "1Gi",
+    "replicas": 2
+}
+
+# 헤지 모드 지연 예산 (초) - 이 시간 안에 Bedrock 결과가 없으면 로컬 결과를 바로 반환
+DEFAULT_LATENCY_BUDGET = 20.0
+
+# 헤지 모드 로컬 분석의 스캔 예산 비율 (나머지는 스캔 후 감지기 계산 여유)
+LOCAL_BUDGET_SHARE = 0.8
+
+# 필드별 신뢰도 (로컬 휴리스틱, Bedrock) - 두 결과가 모두 있으면 필드마다 신뢰도가 높은 쪽 값을 사용
+# 매니페스트/설정 파일에서 직접 읽는 값은 로컬이, 코드 전체를 보고 판단하는 리소스 크기 등은 AI가 우세
+FIELD_CONFIDENCE = {
+    "app_type": (0.95, 0.85),
+    "framework": (0.9, 0.85),
+    "database": (0.85, 0.8),
+    "ports": (0.9, 0.7),
+    "environment": (0.7, 0.75),
+    "resources": (0.6, 0.8),
+    "dependencies": (0.75, 0.8),
+    "build_config": (0.9, 0.8)
+}
+
+# 예산 초과로 일부 파일만 스캔한 로컬 결과의 신뢰도 배율
+SAMPLED_LOCAL_FACTOR = 0.8
+
+# 감지하지 못해 기본값으로 채운 값(DB 불필요, 기본 포트, 빌드 도구 없음)의 신뢰도 배율
+DEFAULT_VALUE_FACTOR = 0.25
+
+# AI build_config의 language_version을 로컬 감지기 키(java_version/node_version)로 옮길 때 기준 (빌드 도구, app_type 접두사)
+VERSION_KEYS = {"maven": "java_version", "gradle": "java_version", "npm": "node_version", "yarn": "node_version"}
+APP_TYPE_VERSION_KEYS = {"java": "java_version", "nodejs": "node_version", "react": "node_version"}
+
+
+def field_confidence(field: str, value: Any, base: float) -> float:
+    """필드 값의 신뢰도 (값이 없거나 unknown이면 0)"""
+    if value in (None, "", "unknown", "none", [], {}):
+        return 0.0
+    if field == "database" and isinstance(value, dict) and value.get("required") and not value.get("type"):
+        return base / 2
+    if field == "build_config" and isinstance(value, dict) and value.get("build_tool") in (None, "", "unknown"):
+        return base * DEFAULT_VALUE_FACTOR
+    return base
+
+
+def is_local_default(field: str, local: Dict) -> bool:
+    """로컬 감지기가 아무것도 찾지 못해 기본값으로 채운 필드인지
+    
+    감지기가 보고한 _defaults를 우선 사용하고, 없으면(이전 버전 집계 캐시 등) 값이 기본값과 같은지로 판단한다.
+    """
+    if "_defaults" in local:
+        return field in local["_defaults"]
+    value = local.get(field)
+    if field == "database":
+        return isinstance(value, dict) and not value.get("required") and not value.get("type")
+    if field == "ports":
+        return isinstance(value, list) and sorted(value) == default_ports(local.get("framework"))
+    return False
+
+
+def _local_build_config(build_config: Dict, app_type: Optional[str]) -> Dict:
+    """AI build_config(language_version)를 로컬 감지기 형식(java_version/node_version)으로 변환"""
+    build_config = dict(build_config)
+    version = build_config.pop("language_version", None)
+    key = VERSION_KEYS.get(str(build_config.get("build_tool")).lower())
+    if key is None:
+        key = next((key for prefix, key in APP_TYPE_VERSION_KEYS.items() if str(app_type).startswith(prefix)), None)
+    if key and version is not None:
+        build_config[key] = str(version)
+    return build_config
+
+
+def _consistent_resources(resources: Dict) -> Dict:
+    """요청이 한도보다 크면 한도를 요청으로 올림 (로컬과 AI 값이 섞인 경우)"""
+    for request, limit, parse in (("cpu_request", "cpu_limit", cpu_millis),
+                                  ("memory_request", "memory_limit", memory_mib)):
+        try:
+            if parse(resources[request]) > parse(resources[limit]):
+                resources[limit] = resources[request]
+        except (KeyError, AttributeError, TypeError, ValueError):
+            continue
+    return resources
+
+
+def merge_by_confidence(local: Dict, ai: Dict) -> Dict:
+    """로컬 분석과 Bedrock 결과를 필드별 신뢰도로 병합 (로컬 전용 필드와 메타 정보는 로컬 결과 유지)"""
+    local_factor = SAMPLED_LOCAL_FACTOR if local.get("_sampling", {}).get("partial") else 1.0
+    ai_factor = ai.get("ai_confidence", 0.95) / 0.95
+    
+    merged = dict(local)
+    sources = {}
+    confidences = []
+    for field, (local_base, ai_base) in FIELD_CONFIDENCE.items():
+        local_confidence = field_confidence(field, local.get(field), local_base * local_factor)
+        if is_local_default(field, local):
+            local_confidence *= DEFAULT_VALUE_FACTOR
+        ai_confidence = field_confidence(field, ai.get(field), ai_base * ai_factor)
+        if ai_confidence > local_confidence:
+            value = ai[field]
+            if field == "build_config" and isinstance(value, dict):
+                value = _local_build_config(value, merged.get("app_type"))
+            # AI가 일부 키만 준 경우 나머지는 로컬 값 유지 (resources, build_config 등, AI가 비워 둔 키 포함)
+            if isinstance(value, dict) and isinstance(local.get(field), dict):
+                value = {**local[field], **{key: v for key, v in value.items() if v is not None}}
+            if field == "resources" and isinstance(value, dict):
+                value = _consistent_resources(value)
+            merged[field] = value
+            sources[field] = "bedrock"
+            confidences.append(ai_confidence)
+        else:
+            sources[field] = "local"
+            confidences.append(local_confidence)
+    
+    merged.pop("_defaults", None)
+    merged["ai_confidence"] = round(sum(confidences) / len(confidences), 3)
+    merged["ai_source"] = "hedged-local-bedrock"
+    merged["_hedge"] = {"fields": sources}
+    return merged
 
 class AmazonQAnalyzer:
     """실제 Amazon Q Developer API 연동 분석기"""
     
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, cache_dir: Optional[str] = None, bypass_cache: bool = False,
+                 sharded: bool = False, shard_tokens: int = DEFAULT_SHARD_TOKENS,
+                 shard_workers: int = DEFAULT_SHARD_WORKERS,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND, reduce: str = "local",
+                 prompt_tokens: int = DEFAULT_PROMPT_TOKENS, stream: bool = False,
+                 on_field: Optional[Callable[[str, Any], None]] = None, hedged: bool = False,
+                 latency_budget: float = DEFAULT_LATENCY_BUDGET,
+                 on_reconciled: Optional[Callable[[Dict], None]] = None):
         self.repo_path = Path(repo_path)
         self.q_client = None
         self.bedrock_client = None
+        self.analysis_result = {}
+        
+        # 단일 호출 프롬프트에 넣을 파일 내용 토큰 예산 (관련도 높은 파일부터 채움)
+        self.prompt_tokens = prompt_tokens
+        
+        # 스트리밍 모드: 응답 JSON의 최상위 필드를 완성되는 즉시 partial_result에 올리고 on_field(필드, 값) 호출
+        # (다른 스레드는 wait_for()로 필요한 필드만 기다렸다가 다음 단계를 시작할 수 있음)
+        self.stream = stream
+        self.on_field = on_field
+        self.partial_result = {}
+        self.stream_stats = {}
+        self._fields_ready = threading.Condition()
+        self._finished = False
+        self._run = 0
+        
+        # 헤지 모드: 로컬 분석과 Bedrock을 동시에 실행하여 latency_budget 안에 결과 반환
+        # (Bedrock이 늦으면 로컬 결과를 먼저 반환하고, 도착하면 병합하여 reconciled_result/on_reconciled로 전달)
+        self.hedged = hedged
+        self.latency_budget = latency_budget
+        self.on_reconciled = on_reconciled
+        self.reconciled_result = None
+        self._pending = None
+        
+        # 로컬 분석 결과 (분석마다 한 번만 실행하여 폴백과 헤지가 공유)
+        self._local_result = None
+        self._local_lock = threading.Lock()
+        
+        # 조각 분석 모드: 저장소 전체를 토큰 예산 단위 조각으로 나누어 동시에 분석 후 병합
+        # (reduce: "local"은 병합 함수, "bedrock"은 조각 결과를 한 번 더 호출하여 통합)
+        self.sharded = sharded
+        self.shard_tokens = shard_tokens
+        self.shard_workers = max(1, shard_workers)
+        self.requests_per_second = requests_per_second
+        self.reduce = reduce
+        
+        # 모델 ID/프롬프트/파라미터가 같으면 Bedrock을 다시 호출하지 않음 (bypass_cache: 캐시를 읽지 않고 새로 호출)
+        self.response_cache = ResponseCache(cache_dir or str(self.repo_path / CACHE_DIR_NAME),
+                                            bypass=bypass_cache)
         self._setup_clients()
     
     def _setup_clients(self):
@@ -35,95 +233,369 @@ class AmazonQAnalyzer:
     
     def analyze_with_amazon_q(self) -> Dict:
         """Amazon Q를 사용한 실제 AI 분석"""
+        with self._fields_ready:
+            self.analysis_result = {}
+            self.partial_result = {}
+            self._finished = False
+            self._run += 1
+        self._local_result = None
+        self.reconciled_result = None
+        self._pending = None
         
-        # 1. 코드 수집
-        code_content = self._collect_code_files()
+        try:
+            self._analyze()
+        finally:
+            # 최종 결과(표준 형식, 로컬 분석 또는 헤지 병합)로 필드를 교체하고 기다리는 스레드를 깨움
+            # (폴백/헤지 결과에 없는 스트리밍 AI 필드는 남기지 않으며, 이후 도착하는 필드는 공개하지 않음)
+            with self._fields_ready:
+                self.partial_result = dict(self.analysis_result)
+                self._finished = True
+                self._fields_ready.notify_all()
+        return self.analysis_result
+    
+    def wait_for(self, *fields: str, timeout: Optional[float] = None) -> Dict:
+        """필요한 필드가 모두 도착하거나 분석이 끝날 때까지 대기 후 도착한 필드 반환
         
-        # 2. Amazon Bedrock (Claude) 분석
-        if self.bedrock_client:
-            return self._analyze_with_bedrock(code_content)
+        예: TerraformGenerator는 framework, database, resources만 있으면 시작할 수 있음
+        """
+        with self._fields_ready:
+            self._fields_ready.wait_for(
+                lambda: self._finished or all(field in self.partial_result for field in fields), timeout)
+            return {field: self.partial_result[field] for field in fields if field in self.partial_result}
+    
+    def _publish_field(self, field: str, value: Any, run: int):
+        """스트리밍 필드 공개 (분석이 확정되었거나 이전 분석의 늦은 응답이면 무시)"""
+        with self._fields_ready:
+            if self._finished or run != self._run:
+                return
+            self.partial_result[field] = value
+            self._fields_ready.notify_all()
+        if self.on_field:
+            self.on_field(field, value)
+    
+    def _analyze(self):
+        """분석 방식 선택 후 실행 (결과는 self.analysis_result)"""
+        if not self.bedrock_client:
+            # 로컬 분석 (fallback)
+            self.analysis_result = self._analyze_locally()
+        elif self.hedged:
+            # 로컬 분석과 Bedrock을 동시에 실행
+            self.analysis_result = self._analyze_hedged()
         else:
-            # 3. 로컬 분석 (fallback)
-            return self._analyze_locally()
+            # Amazon Bedrock (Claude) 분석, 실패하면 로컬 분석
+            self.analysis_result = self._ai_result() or self._analyze_locally()
     
-    def _collect_code_files(self) -> Dict[str, str]:
-        """분석할 코드 파일들 수집"""
-        code_files = {}
-        
-        # 주요 설정 파일들
-        config_files = [
-            "pom.xml", "package.json", "requirements.txt", 
-            "build.gradle", "Dockerfile", "docker-compose.yml"
-        ]
-        
-        for config_file in config_files:
-            file_path = self.repo_path / config_file
-            if file_path.exists():
-                try:
-                    code_files[config_file] = file_path.read_text()[:2000]  # 처음 2KB만
-                except:
-                    continue
+    def _ai_result(self) -> Optional[Dict]:
+        """Bedrock 분석 결과 (조각 분석 모드 포함, 실패하면 None)"""
+        if self.sharded:
+            return self._sharded_result()
+        return self._bedrock_result(self._collect_code_files())
+    
+    def _analyze_hedged(self) -> Dict:
+        """로컬 분석과 Bedrock을 동시에 실행하여 지연 예산 안에 결과 반환
         
-        # 주요 소스 파일들 (샘플)
-        source_patterns = ["*.java", "*.js", "*.py", "*.ts"]
-        for pattern in source_patterns:
-            files = list(self.repo_path.rglob(pattern))[:3]  # 각 타입별 3개만
-            for file in files:
-                try:
-                    relative_path = str(file.relative_to(self.repo_path))
-                    code_files[relative_path] = file.read_text()[:1000]  # 처음 1KB만
-                except:
-                    continue
+        로컬 분석은 예산의 일부를 스캔 예산으로 쓰는 예산 모드로 실행하므로 큰 저장소에서도 예산 안에 끝난다.
+        Bedrock이 예산 안에 끝나면 필드별 신뢰도로 병합하고, 늦으면 로컬 결과를 먼저 반환한다.
+        예산 안에 어느 쪽도 결과가 없으면 기다리지 않고 기본값 결과를 반환하며, 늦게 끝난 결과는 reconcile()로 전달한다.
+        """
+        started = time.time()
+        executor = ThreadPoolExecutor(max_workers=2)
+        local = executor.submit(self._local_analysis)
+        ai = executor.submit(self._ai_result)
+        executor.shutdown(wait=False)
+        
+        # 두 작업 모두 남은 예산까지만 기다림
+        wait([local, ai], timeout=max(0.0, self.latency_budget - (time.time() - started)))
+        local_result = self._future_result(local, "Local analysis") if local.done() else None
+        ai_result = self._future_result(ai) if ai.done() else None
+        
+        if local_result is not None and ai_result is not None:
+            result = merge_by_confidence(local_result, ai_result)
+            result["_hedge"].update({"bedrock": "merged", "elapsed_seconds": round(time.time() - started, 3)})
+            return result
         
+        if local.done() and ai.done():
+            if local_result is not None:
+                return self._hedge_local(local_result, "failed", started)
+            if ai_result is None:
+                # 둘 다 실패하면 로컬 분석 오류를 그대로 전달
+                local.result()
+            ai_result["_hedge"] = {"local": "failed", "bedrock": "completed",
+                                   "elapsed_seconds": round(time.time() - started, 3)}
+            return ai_result
+        
+        if ai_result is not None:
+            # 로컬 분석이 늦으면 Bedrock 결과 반환 (로컬 결과는 도착하면 병합)
+            print(f"⏱️ Local analysis missed the {self.latency_budget:g}s latency budget, returning Bedrock analysis")
+            result = ai_result
+            result["_hedge"] = {"local": "pending", "bedrock": "completed"}
+        elif local_result is not None:
+            print(f"⏱️ Bedrock missed the {self.latency_budget:g}s latency budget, returning local analysis")
+            result = self._hedge_local(local_result, "pending", started)
+        else:
+            print(f"⏱️ No analysis finished within the {self.latency_budget:g}s latency budget, returning defaults")
+            result = self._standard_result({}, confidence=0.0)
+            result["ai_source"] = "defaults"
+            result["_hedge"] = {"local": "failed" if local.done() else "pending",
+                                "bedrock": "failed" if ai.done() else "pending"}
+        result["_hedge"]["elapsed_seconds"] = round(time.time() - started, 3)
+        
+        # 두 작업이 모두 끝나면 한 번만 병합 (local 콜백 안에서 ai 콜백을 등록)
+        pending = self._pending = threading.Event()
+        returned = dict(result["_hedge"])
+        local.add_done_callback(
+            lambda _: ai.add_done_callback(lambda _: self._reconcile(local, ai, returned, started, pending)))
+        return result
+    
+    @staticmethod
+    def _future_result(future: Future, label: str = "Bedrock analysis") -> Optional[Dict]:
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"❌ {label} failed: {e}")
+            return None
+    
+    def _hedge_local(self, local_result: Dict, bedrock: str, started: float) -> Dict:
+        result = self._tag_local(dict(local_result))
+        result["_hedge"] = {"bedrock": bedrock, "elapsed_seconds": round(time.time() - started, 3)}
+        return result
+    
+    def _reconcile(self, local: Future, ai: Future, returned: Dict, started: float, pending: threading.Event):
+        """예산을 넘겨 끝난 결과까지 모아 다시 병합 (반환한 결과보다 나아진 것이 없으면 reconciled_result는 None)"""
+        try:
+            late_local = returned.get("local") == "pending"
+            late_ai = returned.get("bedrock") == "pending"
+            local_result = self._future_result(local, "Local analysis") if late_local else self._done_result(local)
+            ai_result = self._future_result(ai) if late_ai else self._done_result(ai)
+            defaults = "local" in returned and returned["bedrock"] != "completed"
+            
+            if local_result is not None and ai_result is not None:
+                result = merge_by_confidence(local_result, ai_result)
+                result["_hedge"].update({"local": "late" if late_local else "completed",
+                                         "bedrock": "late" if late_ai else "completed"})
+            elif defaults and local_result is not None:
+                result = self._hedge_local(local_result, "failed", started)
+            elif defaults and ai_result is not None:
+                result = ai_result
+                result["_hedge"] = {"local": "failed", "bedrock": "late"}
+            else:
+                return
+            result["_hedge"]["elapsed_seconds"] = round(time.time() - started, 3)
+            self.reconciled_result = result
+            print(f"🔁 Late analysis finished after {time.time() - started:.1f}s, reconciled with the returned result")
+            if self.on_reconciled:
+                self.on_reconciled(result)
+        finally:
+            pending.set()
+    
+    @staticmethod
+    def _done_result(future: Future) -> Optional[Dict]:
+        """이미 보고한 작업 결과 (실패했으면 None)"""
+        return future.result() if future.exception() is None else None
+    
+    def reconcile(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """예산을 넘긴 Bedrock 호출이 끝날 때까지 기다린 후 병합 결과 반환 (기다릴 호출이 없거나 실패하면 None)"""
+        if self._pending is not None:
+            self._pending.wait(timeout)
+        return self.reconciled_result
+    
+    def _collect_code_files(self) -> Dict[str, str]:
+        """분석할 코드 파일들 수집 (빌드/설정/컨트롤러/엔티티 등 관련도 순으로 토큰 예산까지, 주석/import 제거)"""
+        index = FileIndex(str(self.repo_path)).build()
+        try:
+            code_files = select_code(index, self.prompt_tokens)
+        finally:
+            index.close()
+        
+        print(f"📚 Selected {len(code_files)} file(s) for the prompt (budget {self.prompt_tokens} tokens)")
         return code_files
     
-    def _analyze_with_bedrock(self, code_content: Dict[str, str]) -> Dict:
-        """Amazon Bedrock Claude를 사용한 분석"""
+    def _bedrock_result(self, code_content: Dict[str, str]) -> Optional[Dict]:
+        """Amazon Bedrock Claude 분석 결과 (호출/파싱에 실패하면 None)"""
         
         # 분석 프롬프트 생성
         prompt = self._create_analysis_prompt(code_content)
         
         try:
-            # Claude 3.5 Sonnet 호출
-            response = self.bedrock_client.invoke_model(
-                modelId='anthropic.claude-3-5-sonnet-20241022-v2:0',
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": 4000,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
-                })
-            )
+            # Claude 3.5 Sonnet 호출 (스트리밍 모드는 필드가 완성될 때마다 바로 공개)
+            on_text = self._field_publisher() if self.stream else None
+            result = self._invoke_model(MODEL_ID, self._request_body(prompt), on_text=on_text)
             
             # 응답 파싱
-            result = json.loads(response['body'].read())
             ai_analysis = result['content'][0]['text']
             
             print("✅ Amazon Bedrock analysis completed")
             
-            # AI 응답을 구조화된 데이터로 변환
-            return self._parse_ai_response(ai_analysis)
-            
         except Exception as e:
             print(f"❌ Bedrock analysis failed: {e}")
-            return self._analyze_locally()
+            return None
+        
+        # AI 응답을 구조화된 데이터로 변환
+        try:
+            return self._standard_result(self._extract_json(ai_analysis))
+        except Exception as e:
+            print(f"⚠️ AI response parsing failed: {e}")
+            return None
+    
+    def _field_publisher(self) -> Callable[[str], None]:
+        """응답 텍스트 조각을 받아 완성된 최상위 필드를 공개하는 콜백"""
+        parser = IncrementalJSONParser()
+        started = time.time()
+        run = self._run
+        self.stream_stats = {"fields": 0}
+        
+        def on_text(text: str):
+            for field, value in parser.feed(text):
+                if not self.stream_stats["fields"]:
+                    self.stream_stats["first_field_seconds"] = round(time.time() - started, 3)
+                self.stream_stats["fields"] += 1
+                self._publish_field(field, value, run)
+            if parser.done and "complete_seconds" not in self.stream_stats:
+                self.stream_stats["complete_seconds"] = round(time.time() - started, 3)
+        return on_text
+    
+    def _invoke_model(self, model_id: str, body: Dict, limiter: Optional[TokenBucket] = None,
+                      stats: Optional[Dict[str, int]] = None,
+                      on_text: Optional[Callable[[str], None]] = None) -> Dict:
+        """invoke_model 호출 후 응답 본문 JSON 반환 (응답 캐시 경유, limiter가 있으면 호출 제한/백오프 적용)
+        
+        on_text가 있으면 응답 스트림으로 받아 텍스트 조각마다 호출 (캐시된 응답이면 전체 텍스트로 한 번 호출)
+        """
+        def invoke() -> Dict:
+            if on_text is not None:
+                response = self.bedrock_client.invoke_model_with_response_stream(modelId=model_id, body=json.dumps(body))
+                return stream_response(response['body'], on_text)
+            response = self.bedrock_client.invoke_model(modelId=model_id, body=json.dumps(body))
+            return json.loads(response['body'].read())
+        
+        def call() -> Dict:
+            if limiter is None:
+                return invoke()
+            return call_with_backoff(invoke, limiter, stats=stats)
+        
+        result, hit = self.response_cache.get_or_call(model_id, body, call)
+        if hit:
+            print("♻️ Reusing cached Bedrock response (same model, prompt and parameters)")
+            if on_text is not None:
+                on_text(result['content'][0]['text'])
+        return result
     
-    def _create_analysis_prompt(self, code_content: Dict[str, str]) -> str:
-        """AI 분석용 프롬프트 생성"""
+    def _collect_repository_files(self) -> List[Tuple[str, str]]:
+        """조각 분석용 저장소 파일 수집 (ignore 규칙 적용, 스캔 대상/빌드 파일만, 바이너리/대용량 제외, 주석/import 제거)"""
+        index = FileIndex(str(self.repo_path)).build()
+        files = []
+        try:
+            for entry in index:
+                if entry.size > DEFAULT_MAX_FILE_SIZE or not (
+                        is_scan_target(entry.rel_path) or entry.name in CONTENT_INDEX_NAMES
+                        or entry.name == "docker-compose.yml"):
+                    continue
+                text = read_text(index, entry)
+                if text is not None:
+                    text = strip_code(entry.rel_path, text)
+                if text:
+                    files.append((entry.rel_path, text))
+        finally:
+            index.close()
+        return files
+    
+    def _sharded_result(self) -> Optional[Dict]:
+        """저장소 전체를 조각으로 나누어 동시에 분석 후 병합 (map-reduce, 모든 조각이 실패하면 None)"""
+        shards = plan_shards(self._collect_repository_files(), self.shard_tokens)
+        if not shards:
+            return None
+        
+        # 버스트는 동시 호출 수만큼 허용하여 조각이 적으면 한 번 호출한 것과 비슷한 시간에 끝남
+        limiter = TokenBucket(self.requests_per_second, capacity=self.shard_workers)
+        stats = {"throttled": 0}
+        print(f"🧩 Analyzing {len(shards)} shard(s) with {min(self.shard_workers, len(shards))} worker(s)")
+        
+        def analyze_shard(number: int) -> Optional[Dict]:
+            prompt = self._create_analysis_prompt(shards[number], shard=(number + 1, len(shards)))
+            try:
+                result = self._invoke_model(MODEL_ID, self._request_body(prompt), limiter, stats)
+                return self._extract_json(result['content'][0]['text'])
+            except Exception as e:
+                print(f"⚠️ Shard {number + 1}/{len(shards)} failed: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(self.shard_workers, len(shards))) as executor:
+            results = [r for r in executor.map(analyze_shard, range(len(shards))) if r is not None]
+        if not results:
+            print("❌ Bedrock sharded analysis failed")
+            return None
+        
+        merged, reduced_by = None, "local"
+        if self.reduce == "bedrock" and len(results) > 1:
+            merged = self._reduce_with_bedrock(results, limiter, stats)
+            reduced_by = "bedrock" if merged is not None else "local"
+        if merged is None:
+            merged = merge_results(results)
+        merged["resources"] = {**DEFAULT_RESOURCES, **merged.get("resources", {})}
+        
+        print("✅ Amazon Bedrock sharded analysis completed")
+        result = self._standard_result(merged, confidence=round(0.95 * len(results) / len(shards), 3))
+        result["_shards"] = {
+            "shards": len(shards),
+            "succeeded": len(results),
+            "files": len({name.split(" (part ")[0] for shard in shards for name in shard}),
+            "throttled": stats["throttled"],
+            "reduce": reduced_by
+        }
+        return result
+    
+    def _reduce_with_bedrock(self, results: List[Dict], limiter: TokenBucket,
+                             stats: Dict[str, int]) -> Optional[Dict]:
+        """조각별 결과를 한 번 더 호출하여 하나의 분석으로 통합 (실패하면 None, 로컬 병합 사용)"""
+        partials = {f"part {i}": json.dumps(r, ensure_ascii=False) for i, r in enumerate(results, 1)}
+        prompt = self._create_analysis_prompt(partials, merging=True)
+        try:
+            result = self._invoke_model(MODEL_ID, self._request_body(prompt), limiter, stats)
+            return self._extract_json(result['content'][0]['text'])
+        except Exception as e:
+            print(f"⚠️ Bedrock reduce failed, merging locally: {e}")
+            return None
+    
+    @staticmethod
+    def _request_body(prompt: str) -> Dict:
+        return {
+            "anthropic_version": ANTHROPIC_VERSION,
+            "max_tokens": MAX_TOKENS,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+    
+    def _create_analysis_prompt(self, code_content: Dict[str, str], shard: Optional[Tuple[int, int]] = None,
+                                merging: bool = False) -> str:
+        """AI 분석용 프롬프트 생성
+
+        code_content는 이미 토큰 예산에 맞춰 선택/정리된 내용이므로 그대로 넣는다.
+        shard: (번호, 전체 조각 수), merging: code_content가 조각별 분석 JSON이면 True (통합 요청)
+        """
         
         files_summary = "\n".join([
-            f"=== {filename} ===\n{content[:500]}...\n"
+            f"=== {filename} ===\n{content}\n"
             for filename, content in code_content.items()
         ])
         
+        scope = ""
+        if shard:
+            scope = (f"\nThis is part {shard[0]} of {shard[1]} of the repository. "
+                     "Report only what these files show; use \"unknown\" or empty lists for anything they do not.\n")
+        
+        task = "Analyze the following application code and provide infrastructure recommendations:"
+        if merging:
+            task = ("The application was analyzed in parts. Combine the following per-part analyses "
+                    "into one analysis of the whole application:")
+        
         prompt = f"""
 You are an expert DevOps engineer analyzing application code to recommend optimal AWS infrastructure.
-
-Analyze the following application code and provide infrastructure recommendations:
+{scope}
+{task}
 
 {files_summary}
 
@@ -176,69 +648,70 @@ Provide only the JSON response, no additional text.
 """
         return prompt
     
-    def _parse_ai_response(self, ai_response: str) -> Dict:
-        """AI 응답을 파싱하여 표준 형식으로 변환"""
-        try:
-            # JSON 부분만 추출
-            start_idx = ai_response.find('{')
-            end_idx = ai_response.rfind('}') + 1
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = ai_response[start_idx:end_idx]
-                ai_result = json.loads(json_str)
-                
-                # 표준 형식으로 변환
-                return {
-                    "app_type": ai_result.get("app_type", "unknown"),
-                    "framework": ai_result.get("framework", "unknown"),
-                    "database": ai_result.get("database", {"required": False}),
-                    "resources": ai_result.get("resources", {
-                        "cpu_request": "250m",
-                        "cpu_limit": "500m",
-                        "memory_request": "512Mi", 
-                        "memory_limit": "1Gi",
-                        "replicas": 2
-                    }),
-                    "ports": ai_result.get("ports", [8080]),
-                    "environment": ai_result.get("environment", []),
-                    "dependencies": ai_result.get("dependencies", {
-                        "external_services": [],
-                        "third_party_apis": [],
-                        "security_requirements": []
-                    }),
-                    "build_config": ai_result.get("build_config", {
-                        "build_tool": "unknown",
-                        "language_version": None,
-                        "docker_required": False
-                    }),
-                    "ai_confidence": 0.95,
-                    "ai_source": "amazon-bedrock-claude"
-                }
-            else:
-                raise ValueError("No valid JSON found in AI response")
-                
-        except Exception as e:
-            print(f"⚠️ AI response parsing failed: {e}")
-            return self._analyze_locally()
+    @staticmethod
+    def _extract_json(ai_response: str) -> Dict:
+        """AI 응답에서 JSON 부분만 추출"""
+        start_idx = ai_response.find('{')
+        end_idx = ai_response.rfind('}') + 1
+        
+        if start_idx != -1 and end_idx != 0:
+            return json.loads(ai_response[start_idx:end_idx])
+        raise ValueError("No valid JSON found in AI response")
+    
+    @staticmethod
+    def _standard_result(ai_result: Dict, confidence: float = 0.95) -> Dict:
+        """AI 분석 JSON을 표준 형식으로 변환"""
+        return {
+            "app_type": ai_result.get("app_type", "unknown"),
+            "framework": ai_result.get("framework", "unknown"),
+            "database": ai_result.get("database", {"required": False}),
+            "resources": ai_result.get("resources", dict(DEFAULT_RESOURCES)),
+            "ports": ai_result.get("ports", [8080]),
+            "environment": ai_result.get("environment", []),
+            "dependencies": ai_result.get("dependencies", {
+                "external_services": [],
+                "third_party_apis": [],
+                "security_requirements": []
+            }),
+            "build_config": ai_result.get("build_config", {
+                "build_tool": "unknown",
+                "language_version": None,
+                "docker_required": False
+            }),
+            "ai_confidence": confidence,
+            "ai_source": "amazon-bedrock-claude"
+        }
     
     def _analyze_locally(self) -> Dict:
         """로컬 분석 (fallback)"""
         print("🔄 Using local analysis as fallback")
-        
-        # 기존 로컬 분석기 사용
-        from .code_analyzer import ApplicationAnalyzer
-        local_analyzer = ApplicationAnalyzer(str(self.repo_path))
-        result = local_analyzer.analyze()
-        
+        return self._tag_local(self._local_analysis())
+    
+    def _local_analysis(self) -> Dict:
+        """기존 로컬 분석기 결과 (분석마다 한 번만 실행, 헤지 모드는 지연 예산의 일부를 스캔 예산으로 사용)"""
+        with self._local_lock:
+            if self._local_result is None:
+                try:
+                    from .code_analyzer import ApplicationAnalyzer
+                except ImportError:
+                    from code_analyzer import ApplicationAnalyzer
+                budget = self.latency_budget * LOCAL_BUDGET_SHARE if self.hedged else None
+                local_analyzer = ApplicationAnalyzer(str(self.repo_path), budget_seconds=budget)
+                self._local_result = local_analyzer.analyze()
+            return dict(self._local_result)
+    
+    @staticmethod
+    def _tag_local(result: Dict) -> Dict:
         # AI 소스 표시 추가
         result["ai_confidence"] = 0.85
         result["ai_source"] = "local-heuristic"
-        
         return result
     
     def generate_summary(self) -> str:
         """분석 결과 요약 생성"""
-        result = self.analyze_with_amazon_q()
+        if not self.analysis_result:
+            self.analyze_with_amazon_q()
+        result = self.analysis_result
         
         ai_source = result.get("ai_source", "unknown")
         confidence = result.get("ai_confidence", 0.0)
@@ -274,23 +747,63 @@ Provide only the JSON response, no additional text.
 
 def main():
     """테스트 실행"""
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Amazon Bedrock application analyzer")
+    parser.add_argument("repo_path", help="분석할 저장소 경로")
+    parser.add_argument("--cache-dir", help=f"Bedrock 응답 캐시 위치 (기본: <repo_path>/{CACHE_DIR_NAME})")
+    parser.add_argument("--bypass-cache", action="store_true",
+                        help="캐시된 응답을 사용하지 않고 Bedrock을 다시 호출 (새 응답은 캐시에 저장)")
+    parser.add_argument("--prompt-tokens", type=int, default=DEFAULT_PROMPT_TOKENS,
+                        help=f"단일 호출 프롬프트의 파일 내용 토큰 예산 (기본: {DEFAULT_PROMPT_TOKENS})")
+    parser.add_argument("--stream", action="store_true",
+                        help="응답 스트림으로 받아 결과 필드를 완성되는 즉시 출력")
+    parser.add_argument("--hedged", action="store_true",
+                        help="로컬 분석과 Bedrock을 동시에 실행하여 지연 예산 안에 결과 반환 (필드별 신뢰도로 병합)")
+    parser.add_argument("--latency-budget", type=float, default=DEFAULT_LATENCY_BUDGET,
+                        help=f"헤지 모드 지연 예산 (초, 기본: {DEFAULT_LATENCY_BUDGET:g})")
+    parser.add_argument("--sharded", action="store_true",
+                        help="저장소 전체를 토큰 예산 단위 조각으로 나누어 동시에 분석 후 병합")
+    parser.add_argument("--shard-tokens", type=int, default=DEFAULT_SHARD_TOKENS,
+                        help=f"조각당 파일 내용 토큰 예산 (기본: {DEFAULT_SHARD_TOKENS})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_SHARD_WORKERS,
+                        help=f"동시에 분석할 조각 수 (기본: {DEFAULT_SHARD_WORKERS})")
+    parser.add_argument("--rps", type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                        help=f"초당 Bedrock 호출 수 제한 (기본: {DEFAULT_REQUESTS_PER_SECOND})")
+    parser.add_argument("--reduce", choices=["local", "bedrock"], default="local",
+                        help="조각 결과 병합 방식 (local: 병합 함수, bedrock: 통합 호출 1회 추가)")
+    args = parser.parse_args()
+    
+    started = time.time()
     
-    if len(sys.argv) != 2:
-        print("Usage: python amazon_q_analyzer.py <repo_path>")
-        sys.exit(1)
+    def on_field(field: str, value: Any):
+        print(f"📨 {field} ready after {time.time() - started:.2f}s")
     
-    repo_path = sys.argv[1]
-    analyzer = AmazonQAnalyzer(repo_path)
+    analyzer = AmazonQAnalyzer(args.repo_path, cache_dir=args.cache_dir, bypass_cache=args.bypass_cache,
+                               sharded=args.sharded, shard_tokens=args.shard_tokens,
+                               shard_workers=args.workers, requests_per_second=args.rps,
+                               reduce=args.reduce, prompt_tokens=args.prompt_tokens,
+                               stream=args.stream, on_field=on_field if args.stream else None,
+                               hedged=args.hedged, latency_budget=args.latency_budget)
     
+    # 분석은 한 번만 실행하고 요약과 결과 파일이 같은 결과를 사용
+    result = analyzer.analyze_with_amazon_q()
     print(analyzer.generate_summary())
     
     # 결과 저장
-    result = analyzer.analyze_with_amazon_q()
     with open("amazon_q_analysis.json", 'w') as f:
         json.dump(result, f, indent=2)
     
     print(f"\n📄 Analysis saved to: amazon_q_analysis.json")
+    
+    # 헤지 모드에서 Bedrock이 예산을 넘기면 로컬 결과를 먼저 저장하고, 도착하면 병합 결과로 갱신
+    if result.get("_hedge", {}).get("bedrock") == "pending":
+        print("⏳ Waiting for the late Bedrock result to reconcile")
+        reconciled = analyzer.reconcile()
+        if reconciled:
+            with open("amazon_q_analysis.json", 'w') as f:
+                json.dump(reconciled, f, indent=2)
+            print(f"📄 Reconciled analysis saved to: amazon_q_analysis.json")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Incremental Analysis Cache
+파일 지문(경로, 크기, mtime, 내용 해시) 기반으로 파일별 감지 결과와 매니페스트 파싱 결과를 SQLite에 저장하는 영구 캐시
+(전체 집계 결과는 MessagePack으로 저장)
+"""
+
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, Mapping, Optional
+
+try:
+    from .packed import PackedMapping, packb
+except ImportError:
+    from packed import PackedMapping, packb
+
+# 기본 캐시 위치
+CACHE_DIR_NAME = ".kdt-cache"
+CACHE_DB_NAME = "analysis.sqlite"
+
+
+class AnalysisCache:
+    """파일별 감지 결과 및 전체 집계 결과 영구 캐시"""
+
+    def __init__(self, cache_dir: str, scanner_version: int):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.db_path = os.path.join(cache_dir, CACHE_DB_NAME)
+        self.scanner_version = scanner_version
+        self.conn = sqlite3.connect(self.db_path)
+        self._setup_schema()
+
+    def _setup_schema(self):
+        """테이블 생성 및 스캐너 버전이 바뀐 경우 캐시 초기화"""
+        cur = self.conn.cursor()
+        cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        cur.execute("""CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            digest TEXT NOT NULL,
+            findings TEXT NOT NULL
+        )""")
+        cur.execute("""CREATE TABLE IF NOT EXISTS aggregates (
+            root TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            result TEXT NOT NULL
+        )""")
+        cur.execute("""CREATE TABLE IF NOT EXISTS manifests (
+            digest TEXT PRIMARY KEY,
+            result TEXT NOT NULL
+        )""")
+
+        row = cur.execute("SELECT value FROM meta WHERE key = 'scanner_version'").fetchone()
+        if row is None or int(row[0]) != self.scanner_version:
+            cur.execute("DELETE FROM files")
+            cur.execute("DELETE FROM aggregates")
+            cur.execute("DELETE FROM manifests")
+            cur.execute("INSERT OR REPLACE INTO meta VALUES ('scanner_version', ?)",
+                        (str(self.scanner_version),))
+        self.conn.commit()
+
+    def lookup(self, path: str, size: int, mtime: float) -> Optional[Dict]:
+        """경로/크기/mtime이 모두 같으면 저장된 감지 결과 반환"""
+        row = self.conn.execute(
+            "SELECT findings FROM files WHERE path = ? AND size = ? AND mtime = ?",
+            (path, size, mtime)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def lookup_digest(self, path: str, size: int, mtime: float, digest: str) -> Optional[Dict]:
+        """mtime만 바뀌고 내용 해시가 같으면 저장된 결과 재사용 (mtime 갱신)"""
+        row = self.conn.execute(
+            "SELECT findings FROM files WHERE path = ? AND size = ? AND digest = ?",
+            (path, size, digest)).fetchone()
+        if row is None:
+            return None
+        self.conn.execute("UPDATE files SET mtime = ? WHERE path = ?", (mtime, path))
+        return json.loads(row[0])
+
+    def store(self, path: str, size: int, mtime: float, digest: str, findings: Dict):
+        """파일 감지 결과 저장"""
+        self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                          (path, size, mtime, digest, json.dumps(findings)))
+
+    def prune(self, root: str, present_paths: Iterable[str]):
+        """저장소에서 사라진 파일의 결과 삭제"""
+        present = set(present_paths)
+        prefix = os.path.join(root, "")
+        stale = [
+            (path,) for (path,) in self.conn.execute(
+                "SELECT path FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+            if path not in present
+        ]
+        self.conn.executemany("DELETE FROM files WHERE path = ?", stale)
+
+    def get_aggregate(self, root: str, fingerprint: str) -> Optional[Mapping]:
+        """트리 지문이 마지막 분석과 같으면 이전 집계 결과 반환 (저장된 버퍼를 복사하지 않고 읽은 필드만 디코딩)"""
+        row = self.conn.execute(
+            "SELECT result FROM aggregates WHERE root = ? AND fingerprint = ?",
+            (root, fingerprint)).fetchone()
+        if row is None:
+            return None
+        # 이전 버전이 JSON 문자열로 저장한 결과도 읽음
+        return json.loads(row[0]) if isinstance(row[0], str) else PackedMapping(row[0])
+
+    def put_aggregate(self, root: str, fingerprint: str, result: Dict):
+        """저장소별 마지막 집계 결과 저장 (MessagePack)"""
+        self.conn.execute("INSERT OR REPLACE INTO aggregates VALUES (?, ?, ?)",
+                          (root, fingerprint, packb(result)))
+
+    def get_manifest(self, digest: str) -> Optional[Dict]:
+        """내용 해시가 같은 매니페스트의 파싱 결과 (경로와 무관하게 공유)"""
+        row = self.conn.execute("SELECT result FROM manifests WHERE digest = ?", (digest,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_manifest(self, digest: str, result: Dict):
+        """매니페스트 파싱 결과 저장"""
+        self.conn.execute("INSERT OR REPLACE INTO manifests VALUES (?, ?)", (digest, json.dumps(result)))
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
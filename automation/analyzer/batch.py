@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Batch Repository Analyzer
+여러 저장소를 작업 프로세스 풀에서 동시에 분석하고, 끝나는 순서대로 저장소당 한 줄의 JSON(JSONL)
+또는 이어 붙인 MessagePack 레코드(packed.iter_unpack으로 읽음)로 출력
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .analysis_cache import CACHE_DIR_NAME
+    from .code_analyzer import ApplicationAnalyzer, DEFAULT_MAX_FILE_SIZE
+    from .content_cache import ContentCache
+    from .packed import packb
+except ImportError:
+    from analysis_cache import CACHE_DIR_NAME
+    from code_analyzer import ApplicationAnalyzer, DEFAULT_MAX_FILE_SIZE
+    from content_cache import ContentCache
+    from packed import packb
+
+# 작업 프로세스별 파일 내용 캐시 (같은 작업 프로세스가 맡은 저장소끼리 공유)
+_worker_content_cache = None
+
+
+def read_manifest(path: str) -> List[str]:
+    """저장소 목록 파일 읽기 (한 줄에 경로 하나, 빈 줄과 # 주석 무시)"""
+    repos = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                repos.append(line)
+    return repos
+
+
+def repo_cache_dir(cache_root: str, repo_path: str) -> str:
+    """공유 캐시 루트 아래 저장소별 캐시 디렉토리 (이름이 같은 저장소끼리 겹치지 않도록 경로 해시 포함)"""
+    repo_path = os.path.abspath(repo_path)
+    digest = hashlib.sha1(repo_path.encode("utf-8", "surrogateescape")).hexdigest()[:10]
+    return os.path.join(cache_root, f"{os.path.basename(repo_path) or 'root'}-{digest}")
+
+
+def _init_worker():
+    global _worker_content_cache
+    _worker_content_cache = ContentCache()
+
+
+def analyze_repo(repo_path: str, options: Dict, submitted_at: float) -> Dict:
+    """저장소 하나 분석 (작업 프로세스에서 실행, 실패해도 예외 대신 오류 레코드 반환)"""
+    started_at = time.time()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    record = {"repo": repo_path, "ref": options.get("ref"), "pid": os.getpid(),
+              "queued_ms": round(max(0.0, started_at - submitted_at) * 1000, 3)}
+
+    cache_root = options.get("cache_root")
+    try:
+        # 분석기 진행 메시지가 JSONL 출력에 섞이지 않도록 stderr로 보냄
+        with contextlib.redirect_stdout(sys.stderr):
+            if not os.path.isdir(repo_path):
+                raise FileNotFoundError(f"Repository not found: {repo_path}")
+            analyzer = ApplicationAnalyzer(
+                repo_path,
+                content_cache=_worker_content_cache,
+                cache_dir=repo_cache_dir(cache_root, repo_path) if cache_root else None,
+                incremental=options.get("incremental", True),
+                max_depth=options.get("max_depth"),
+                max_file_size=options.get("max_file_size", DEFAULT_MAX_FILE_SIZE),
+                ref=options.get("ref"),
+                budget_seconds=options.get("budget_seconds"),
+                budget_bytes=options.get("budget_bytes"))
+            result = analyzer.analyze()
+        record.update({"status": "ok", "result": result})
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}",
+                       "traceback": traceback.format_exc(limit=5)})
+
+    record["wall_ms"] = round((time.perf_counter() - wall_start) * 1000, 3)
+    record["cpu_ms"] = round((time.process_time() - cpu_start) * 1000, 3)
+    record["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    return record
+
+
+class BatchAnalyzer:
+    """저장소 목록을 프로세스 풀로 분석 (인터프리터/모듈 로딩은 작업 프로세스당 한 번)"""
+
+    def __init__(self, workers: Optional[int] = None, cache_root: Optional[str] = None,
+                 incremental: bool = True, max_depth: Optional[int] = None,
+                 max_file_size: Optional[int] = DEFAULT_MAX_FILE_SIZE, ref: Optional[str] = None,
+                 budget_seconds: Optional[float] = None, budget_bytes: Optional[int] = None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+
+        # 저장소별 ApplicationAnalyzer 옵션 (저장소 간 병렬화를 하므로 저장소 내부 스캔은 직렬)
+        self.options = {
+            "cache_root": cache_root,
+            "incremental": incremental,
+            "max_depth": max_depth,
+            "max_file_size": max_file_size,
+            "ref": ref,
+            "budget_seconds": budget_seconds,
+            "budget_bytes": budget_bytes
+        }
+
+    def run(self, repos: Iterable[str]) -> Iterable[Dict]:
+        """끝나는 순서대로 저장소별 결과 레코드 생성 (느린 저장소가 다른 저장소 출력을 막지 않음)"""
+        repos = list(dict.fromkeys(repos))
+        if not repos:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(repos)),
+                                 initializer=_init_worker) as pool:
+            futures = {pool.submit(analyze_repo, repo, self.options, time.time()): repo for repo in repos}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # 작업 프로세스 비정상 종료 등 analyze_repo 밖에서 난 오류
+                    yield {"repo": futures[future], "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Batch application analyzer (JSONL output)")
+    parser.add_argument("repos", nargs="*", help="분석할 저장소 경로")
+    parser.add_argument("--manifest", help="저장소 목록 파일 (한 줄에 경로 하나, # 주석)")
+    parser.add_argument("--workers", type=int, default=0, help="동시에 분석할 저장소 수 (0 = CPU 수)")
+    parser.add_argument("--output", help="결과 저장 경로 (기본: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "msgpack"], default="jsonl",
+                        help="레코드 형식 (msgpack: 레코드를 이어 붙인 바이너리 스트림)")
+    parser.add_argument("--no-cache", action="store_true", help="영구 분석 캐시 사용 안 함")
+    parser.add_argument("--cache-dir",
+                        help=f"저장소별 영구 캐시를 모아 둘 위치 (기본: 각 저장소의 {CACHE_DIR_NAME})")
+    parser.add_argument("--ref", help="작업 트리 대신 분석할 git 커밋/브랜치 (모든 저장소에 적용)")
+    parser.add_argument("--max-depth", type=int, help="순회할 최대 디렉토리 깊이 (0 = 루트만)")
+    parser.add_argument("--max-file-size", type=int, default=DEFAULT_MAX_FILE_SIZE,
+                        help=f"내용을 읽을 최대 파일 크기 (bytes, 기본: {DEFAULT_MAX_FILE_SIZE})")
+    parser.add_argument("--budget-seconds", type=float,
+                        help="저장소별 분석 시간 예산 (초과 시 표본 추정, 큰 저장소가 배치를 오래 붙잡지 않게 함)")
+    parser.add_argument("--budget-bytes", type=int, help="저장소별 새로 읽을 파일 바이트 예산")
+    args = parser.parse_args()
+
+    repos = list(args.repos)
+    if args.manifest:
+        repos.extend(read_manifest(args.manifest))
+    if not repos:
+        parser.error("no repositories given (pass paths or --manifest)")
+
+    batch = BatchAnalyzer(workers=args.workers,
+                          cache_root=args.cache_dir,
+                          incremental=not args.no_cache,
+                          max_depth=args.max_depth,
+                          max_file_size=args.max_file_size,
+                          ref=args.ref,
+                          budget_seconds=args.budget_seconds,
+                          budget_bytes=args.budget_bytes)
+
+    binary = args.format == "msgpack"
+    if args.output:
+        output = open(args.output, "wb" if binary else "w")
+    else:
+        output = sys.stdout.buffer if binary else sys.stdout
+    failed = 0
+    batch_start = time.perf_counter()
+    try:
+        for record in batch.run(repos):
+            failed += record["status"] != "ok"
+            output.write(packb(record) if binary else json.dumps(record) + "\n")
+            output.flush()
+            print(f"{'✅' if record['status'] == 'ok' else '❌'} {record['repo']}"
+                  f" ({record.get('wall_ms', 0):.0f} ms)", file=sys.stderr)
+    finally:
+        if args.output:
+            output.close()
+
+    print(f"\n📦 {len(set(repos))} repositories, {failed} failed, "
+          f"{time.perf_counter() - batch_start:.1f}s", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
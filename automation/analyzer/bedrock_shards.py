@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Sharded Bedrock Analysis
+저장소 파일을 토큰 예산 단위 조각(shard)으로 나누어 동시에 분석하고, 조각별 JSON 결과를
+표준 결과 형식으로 합치기 위한 도구 (조각 계획, 토큰 버킷 호출 제한, 스로틀링 백오프, 로컬 병합)
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .code_analyzer import memory_mib
+except ImportError:
+    from code_analyzer import memory_mib
+
+# 토큰 수 추정 (영문 코드 기준 약 4글자당 1토큰)
+CHARS_PER_TOKEN = 4
+
+# 조각당 프롬프트 토큰 예산 (지시문/응답 여유를 뺀 파일 내용 분량)
+DEFAULT_SHARD_TOKENS = 24000
+
+# 동시에 호출할 조각 수와 초당 호출 수 (버스트는 동시 호출 수만큼 허용)
+DEFAULT_SHARD_WORKERS = 4
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+
+# 스로틀링 재시도 횟수와 대기 시간 (지수 증가, 지터 적용)
+MAX_RETRIES = 6
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 20.0
+
+# 재시도할 Bedrock 오류 코드 (botocore ClientError.response["Error"]["Code"])
+THROTTLING_ERRORS = frozenset({
+    "ThrottlingException", "TooManyRequestsException",
+    "ServiceUnavailableException", "ModelNotReadyException"
+})
+
+# 병합 시 크기 순서
+SIZE_ORDER = ["small", "medium", "large"]
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _split_text(text: str, max_tokens: int) -> List[str]:
+    """예산을 넘는 파일을 줄 단위로 나눔 (한 줄이 예산보다 길면 글자 단위)"""
+    limit = max_tokens * CHARS_PER_TOKEN
+    parts, current, size = [], [], 0
+    for line in text.splitlines(keepends=True):
+        while len(line) > limit:
+            if current:
+                parts.append("".join(current))
+                current, size = [], 0
+            parts.append(line[:limit])
+            line = line[limit:]
+        if size + len(line) > limit and current:
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def plan_shards(files: Iterable[Tuple[str, str]], max_tokens: int = DEFAULT_SHARD_TOKENS) -> List[Dict[str, str]]:
+    """(상대 경로, 내용) 목록을 경로 순서대로 토큰 예산 단위 조각으로 묶음
+
+    같은 디렉토리 파일이 같은 조각에 모이도록 경로 순서를 유지하며,
+    예산을 넘는 파일은 "<경로> (part i/n)" 조각들로 나눈다.
+    """
+    shards: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    used = 0
+    for rel_path, text in files:
+        tokens = estimate_tokens(text)
+        if tokens > max_tokens:
+            parts = _split_text(text, max_tokens)
+            pieces = [(f"{rel_path} (part {i}/{len(parts)})", part) for i, part in enumerate(parts, 1)]
+        else:
+            pieces = [(rel_path, text)]
+
+        for name, piece in pieces:
+            tokens = estimate_tokens(piece)
+            if current and used + tokens > max_tokens:
+                shards.append(current)
+                current, used = {}, 0
+            current[name] = piece
+            used += tokens
+    if current:
+        shards.append(current)
+    return shards
+
+
+class TokenBucket:
+    """초당 호출 수 제한 (스로틀링되면 속도를 절반으로 줄이고 성공할 때마다 조금씩 회복)"""
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, capacity: float = DEFAULT_SHARD_WORKERS):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """호출 1회분 토큰을 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self):
+        with self._lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def speed_up(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 8)
+
+
+def is_throttling(error: Exception) -> bool:
+    """Bedrock 스로틀링/일시적 과부하 오류 여부 (botocore ClientError 형식)"""
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code") in THROTTLING_ERRORS
+    return type(error).__name__ in THROTTLING_ERRORS
+
+
+def call_with_backoff(call: Callable[[], Dict], limiter: TokenBucket, retries: int = MAX_RETRIES,
+                      stats: Optional[Dict[str, int]] = None) -> Dict:
+    """호출 제한을 지키며 call() 실행 (스로틀링되면 지수 백오프 후 재시도, 그 밖의 오류는 그대로 전달)"""
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        try:
+            result = call()
+        except Exception as e:
+            if not is_throttling(e) or attempt == retries:
+                raise
+            limiter.slow_down()
+            if stats is not None:
+                stats["throttled"] = stats.get("throttled", 0) + 1
+            time.sleep(random.uniform(0.5, 1.0) * min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+            continue
+        limiter.speed_up()
+        return result
+
+
+def _vote(values: Iterable, ignore: Tuple = (None, "", "unknown", "none")):
+    """가장 많이 나온 값 (동률이면 먼저 나온 값)"""
+    counts = Counter(value for value in values if isinstance(value, (str, int, float)) and value not in ignore)
+    return max(counts, key=counts.get) if counts else None
+
+
+def _union(lists: Iterable) -> List:
+    merged = []
+    for values in lists:
+        for value in values if isinstance(values, list) else ():
+            if value not in merged:
+                merged.append(value)
+    return merged
+
+
+def cpu_millis(quantity: str) -> float:
+    """쿠버네티스 CPU 수량(250m, 1 ...)을 밀리코어로 변환"""
+    quantity = str(quantity)
+    return float(quantity[:-1]) if quantity.endswith("m") else float(quantity) * 1000
+
+
+def _largest(values: Iterable, key: Callable) -> Optional[str]:
+    """수량 문자열 중 가장 큰 값 (형식이 맞지 않는 값은 무시)"""
+    best, best_key = None, None
+    for value in values:
+        try:
+            value_key = key(value)
+        except (AttributeError, TypeError, ValueError):
+            continue
+        if best_key is None or value_key > best_key:
+            best, best_key = value, value_key
+    return best
+
+
+def merge_results(results: List[Dict]) -> Dict:
+    """조각별 분석 JSON을 하나로 병합
+
+    분류 값(app_type, framework, 빌드 도구 등)은 다수결, 필요 여부는 하나라도 필요하면 필요,
+    리소스는 조각 중 가장 큰 값, 포트/환경 변수/외부 서비스는 합집합으로 합친다.
+    """
+    databases = [r.get("database") or {} for r in results]
+    required = [db for db in databases if db.get("required")]
+    resources = [r.get("resources") or {} for r in results]
+    dependencies = [r.get("dependencies") or {} for r in results]
+    builds = [r.get("build_config") or {} for r in results]
+
+    merged = {
+        "app_type": _vote(r.get("app_type") for r in results) or "unknown",
+        "framework": _vote(r.get("framework") for r in results) or "unknown",
+        "database": {"required": bool(required)},
+        "ports": [port for port in _union(r.get("ports") for r in results) if isinstance(port, int)],
+        "environment": _union(r.get("environment") for r in results),
+        "dependencies": {key: _union(d.get(key) for d in dependencies)
+                         for key in ("external_services", "third_party_apis", "security_requirements")},
+        "build_config": {
+            "build_tool": _vote(b.get("build_tool") for b in builds) or "unknown",
+            "language_version": _vote(b.get("language_version") for b in builds),
+            "docker_required": any(b.get("docker_required") for b in builds)
+        }
+    }
+    if required:
+        merged["database"]["type"] = _vote(db.get("type") for db in required) or "mysql"
+        sizes = [db.get("estimated_size") for db in required if db.get("estimated_size") in SIZE_ORDER]
+        if sizes:
+            merged["database"]["estimated_size"] = max(sizes, key=SIZE_ORDER.index)
+
+    sized = {}
+    for key, parse in (("cpu_request", cpu_millis), ("cpu_limit", cpu_millis),
+                       ("memory_request", memory_mib), ("memory_limit", memory_mib)):
+        value = _largest((r.get(key) for r in resources), parse)
+        if value is not None:
+            sized[key] = value
+    replicas = [r.get("replicas") for r in resources if isinstance(r.get("replicas"), int)]
+    if replicas:
+        sized["replicas"] = max(replicas)
+    if sized:
+        merged["resources"] = sized
+    return merged
@@ -7,54 +7,834 @@ Amazon Q Code Analyzer
 import os
 import json
 import re
+import fnmatch
+import hashlib
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    from .file_index import FileIndex, FileEntry
+    from .content_cache import ContentCache
+    from .analysis_cache import AnalysisCache, CACHE_DIR_NAME
+    from .indicators import get_scanner
+    from .git_source import GitTreeIndex, GitBlobReader
+    from .streaming import BinaryFileError, blob_digest, count_lines, looks_binary, read_file_bytes, stream_file_stats
+    from .profiler import DetectorProfiler
+    from .sampling import estimate_total, stratified_order, stratum_of
+    from .manifests import PARSER_VERSION, parser_for
+    from .packed import packb
+    from .content_index import ContentIndex
+except ImportError:
+    from file_index import FileIndex, FileEntry
+    from content_cache import ContentCache
+    from analysis_cache import AnalysisCache, CACHE_DIR_NAME
+    from indicators import get_scanner
+    from git_source import GitTreeIndex, GitBlobReader
+    from streaming import BinaryFileError, blob_digest, count_lines, looks_binary, read_file_bytes, stream_file_stats
+    from profiler import DetectorProfiler
+    from sampling import estimate_total, stratified_order, stratum_of
+    from manifests import PARSER_VERSION, parser_for
+    from packed import packb
+    from content_index import ContentIndex
+
+# 파일별 스캔 결과 형식이 바뀌면 증가시켜 영구 캐시를 무효화
+SCANNER_VERSION = 6
+
+# 감지기별 대상 파일
+COMPLEXITY_EXTS = [".java", ".js", ".ts", ".py"]
+DEPENDENCY_EXTS = ['.java', '.js', '.py', '.yml', '.properties']
+CONFIG_FILE_PATTERN = "application.*"
+
+# 이 크기를 넘는 파일은 내용을 읽지 않음 (생성/압축된 번들 등, 라인 수는 스트리밍으로 계산)
+DEFAULT_MAX_FILE_SIZE = 2 * 1024 * 1024
+
+# 다시 스캔할 파일이 이보다 적으면 병렬 모드에서도 직렬로 처리
+PARALLEL_MIN_FILES = 2000
+PARALLEL_CHUNK_MIN = 64
+
+# 예산 모드에서 표본과 무관하게 항상 스캔하는 Java 파일 수 (_detect_java_framework 검사 범위)
+SAMPLING_PINNED_JAVA_FILES = 10
+
+# 내용 인덱스에 스캔 대상과 함께 색인하는 파일 (감지기가 직접 읽는 파일, 임의 질의용)
+CONTENT_INDEX_NAMES = ("Dockerfile", "requirements.txt", "pom.xml", "build.gradle", "package.json")
+
+# 프레임워크 분류 (런타임 메모리 설정용)
+JAVA_FRAMEWORKS = ("spring-boot", "spring", "java")
+NODE_SERVER_FRAMEWORKS = ("express", "nextjs", "nodejs")
+
+# 이 이상이면 의존성 로딩 메모리를 고려해 메모리 단계를 올림
+HEAVY_MAVEN_DEPENDENCIES = 25
+HEAVY_NODE_PACKAGES = 800
+
+# 메모리 단계 (Terraform 노드 타입 선택이 이 값들을 기준으로 함)
+MEMORY_STEPS = ["128Mi", "256Mi", "512Mi", "768Mi", "1Gi", "1.5Gi", "2Gi"]
+
+# 컨테이너 메모리 한도 대비 힙 비율 (%)
+HEAP_PERCENTAGE = 75
+
+# 결과 필드별 감지기 메서드와 의존 필드 (의존 필드 값이 인자로 전달되며 필드마다 분석당 한 번만 계산)
+DETECTORS = {
+    "app_type": ("_detect_application_type", ()),
+    "framework": ("_detect_framework", ("app_type",)),
+    "database": ("_detect_database_requirements", ("app_type",)),
+    "resources": ("_estimate_resources", ("framework", "dependency_graph")),
+    "ports": ("_detect_ports", ("framework",)),
+    "environment": ("_detect_environment_variables", ("database",)),
+    "dependencies": ("_analyze_dependencies", ()),
+    "dependency_graph": ("_analyze_dependency_graph", ()),
+    "build_config": ("_analyze_build_configuration", ()),
+}
+
+
+def default_ports(framework: Optional[str]) -> List[int]:
+    """설정/Dockerfile에서 포트를 찾지 못했을 때 사용하는 프레임워크별 기본 포트"""
+    if framework in ["react", "vue", "angular", "express"]:
+        return [3000]
+    return [8080]
+
+
+def is_scan_target(rel_path: str) -> bool:
+    """파일별 스캔 대상 여부"""
+    name = rel_path.rsplit("/", 1)[-1]
+    ext = os.path.splitext(name)[1]
+    return (ext in COMPLEXITY_EXTS or ext in DEPENDENCY_EXTS
+            or fnmatch.fnmatchcase(name, CONFIG_FILE_PATTERN))
+
+
+def needs_content(rel_path: str) -> bool:
+    """라인 수 외에 내용 스캔이 필요한 파일인지 여부"""
+    name = rel_path.rsplit("/", 1)[-1]
+    ext = os.path.splitext(name)[1]
+    return (ext == ".java" or ext in DEPENDENCY_EXTS
+            or fnmatch.fnmatchcase(name, CONFIG_FILE_PATTERN))
+
+
+def counts_lines(rel_path: str) -> bool:
+    """코드 복잡도 라인 수 대상 여부"""
+    return os.path.splitext(rel_path)[1] in COMPLEXITY_EXTS
+
+
+def is_config_file(rel_path: str) -> bool:
+    """application.yml/properties 등 설정 파일 여부"""
+    return fnmatch.fnmatchcase(rel_path.rsplit("/", 1)[-1], CONFIG_FILE_PATTERN)
+
+
+def scan_groups(rel_path: str) -> Tuple[str, ...]:
+    """파일 종류에 해당하는 지표 분류"""
+    ext = os.path.splitext(rel_path.rsplit("/", 1)[-1])[1]
+    groups = []
+    if ext == ".java":
+        groups += ["java_framework", "orm"]
+    if is_config_file(rel_path):
+        groups.append("database")
+    if ext in DEPENDENCY_EXTS:
+        groups.append("service")
+    return tuple(groups)
+
+
+def scan_file_content(rel_path: str, content: str) -> Dict:
+    """파일 하나에 대한 감지 결과 (캐시 가능한 순수 함수)"""
+    # 파일 종류에 해당하는 지표만 한 번에 스캔
+    groups = scan_groups(rel_path)
+    matches = get_scanner(*groups).scan(content) if groups else {}
+    lines = count_lines(content) if counts_lines(rel_path) else None
+    return build_findings(rel_path, matches, lines, content)
+
+
+def build_findings(rel_path: str, matches: Dict[str, List[str]], lines: Optional[int],
+                   content: Optional[str]) -> Dict:
+    """지표 매칭 결과로 파일 감지 결과 구성 (content는 설정 파일의 포트/환경변수 추출에만 사용)"""
+    is_config = is_config_file(rel_path)
+    findings = {}
+    
+    # 코드 복잡도용 라인 수
+    if lines is not None:
+        findings["lines"] = lines
+    
+    # Java 프레임워크/ORM 단서
+    java_framework = matches.get("java_framework", [])
+    if "spring-boot" in java_framework:
+        findings["spring_boot_app"] = True
+    elif "spring" in java_framework:
+        findings["controller"] = True
+    if matches.get("orm"):
+        findings["orm"] = matches["orm"][0]
+    
+    # application.yml/properties 설정
+    if is_config:
+        databases = matches.get("database", [])
+        if databases:
+            findings["db"] = True
+            if "mysql" in databases:
+                findings["db_type"] = "mysql"
+            elif "postgresql" in databases:
+                findings["db_type"] = "postgresql"
+        findings["ports"] = [int(p) for p in re.findall(r'port[:\s]*(\d+)', content)]
+        findings["env"] = re.findall(r'\$\{([^}]+)\}', content)
+    
+    # Redis, Elasticsearch 등 외부 서비스
+    if matches.get("service"):
+        findings["services"] = matches["service"]
+    
+    return findings
+
+
+def memory_mib(quantity: str) -> float:
+    """쿠버네티스 메모리 수량(Mi/Gi)을 MiB로 변환"""
+    if quantity.endswith("Gi"):
+        return float(quantity[:-2]) * 1024
+    if quantity.endswith("Mi"):
+        return float(quantity[:-2])
+    raise ValueError(f"Unsupported memory quantity: {quantity}")
+
+
+def raise_memory(resources: Dict, request: str, limit: str):
+    """메모리 요청/한도를 최소 request/limit 이상으로 올림"""
+    for key, minimum in (("memory_request", request), ("memory_limit", limit)):
+        if memory_mib(resources[key]) < memory_mib(minimum):
+            resources[key] = minimum
+
+
+def count_matches(findings: Dict) -> int:
+    """파일 감지 결과에 포함된 지표/정규식 매칭 수 (프로파일링용)"""
+    matches = 0
+    for key, value in findings.items():
+        if key in ("ports", "env", "services"):
+            matches += len(value)
+        elif key in ("spring_boot_app", "controller", "orm", "db"):
+            matches += 1
+    return matches
+
+
+# 작업 프로세스별 git blob 리더 (저장소 루트별)
+_worker_blob_readers = {}
+
+
+def scan_file_shard(repo_root: str, shard: List[Tuple[str, str, Optional[str], bool]]) -> List[Tuple[str, Optional[str], Dict]]:
+    """프로세스 풀 작업 단위: 파일 묶음을 읽고 스캔하여 (경로, 해시, 결과) 목록 반환"""
+    results = []
+    for rel_path, path, blob_sha, streamable in shard:
+        try:
+            if streamable:
+                digest, lines = stream_file_stats(path)
+                results.append((rel_path, digest, {"lines": lines}))
+                continue
+            if blob_sha:
+                if repo_root not in _worker_blob_readers:
+                    _worker_blob_readers[repo_root] = GitBlobReader(repo_root)
+                data = _worker_blob_readers[repo_root].read(blob_sha)
+                if looks_binary(data):
+                    raise BinaryFileError(rel_path)
+            else:
+                data = read_file_bytes(path)
+            content = data.decode("utf-8")
+        except BinaryFileError:
+            results.append((rel_path, None, {"binary": True}))
+            continue
+        except:
+            results.append((rel_path, None, {"unreadable": True}))
+            continue
+        results.append((rel_path, blob_sha or blob_digest(data), scan_file_content(rel_path, content)))
+    return results
+
+class AnalysisView(Mapping):
+    """분석 결과 dict처럼 사용하되 접근한 필드(와 의존 필드)만 계산하는 지연 결과"""
+    
+    def __init__(self, analyzer: "ApplicationAnalyzer"):
+        self._analyzer = analyzer
+    
+    def __getitem__(self, field: str) -> Any:
+        if field not in DETECTORS:
+            raise KeyError(field)
+        return self._analyzer.get(field)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(DETECTORS)
+    
+    def __len__(self) -> int:
+        return len(DETECTORS)
 
 class ApplicationAnalyzer:
     """애플리케이션 코드 분석기"""
     
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, content_cache: Optional[ContentCache] = None,
+                 cache_dir: Optional[str] = None, incremental: bool = True,
+                 max_depth: Optional[int] = None,
+                 max_file_size: Optional[int] = DEFAULT_MAX_FILE_SIZE,
+                 ref: Optional[str] = None, jobs: int = 1,
+                 profiler: Optional[DetectorProfiler] = None,
+                 budget_seconds: Optional[float] = None,
+                 budget_bytes: Optional[int] = None,
+                 file_index: Optional[FileIndex] = None,
+                 content_index: bool = False):
         self.repo_path = Path(repo_path)
         self.analysis_result = {}
+        
+        # ref가 주어지면 작업 트리 대신 해당 커밋을 .git에서 직접 분석
+        self.ref = ref
+        
+        # 파일 스캔 병렬 프로세스 수 (1 = 직렬)
+        self.jobs = max(1, jobs)
+        self._file_index = None
+        
+        # 이미 구축된 인덱스가 주어지면 (멀티 서비스 분석의 서비스별 하위 인덱스) 다시 순회하지 않고 사용
+        self._shared_index = file_index
+        self.content_cache = content_cache or ContentCache()
+        
+        # 순회 범위 제한 (.gitignore/.dockerignore 및 기본 제외 디렉토리는 항상 적용)
+        self.max_depth = max_depth
+        self.max_file_size = max_file_size
+        
+        # 파일별 감지 결과 영구 캐시 (.kdt-cache/analysis.sqlite)
+        self.cache_dir = cache_dir or str(self.repo_path / CACHE_DIR_NAME)
+        self.incremental = incremental
+        self._store = None
+        self._findings = None
+        self.scan_stats = {}
+        
+        # 감지기 결과 메모 (None이면 아직 분석 시작 전)
+        self._values = None
+        self._computing = set()
+        
+        # 지연 결과가 사용하는 이전 집계 결과 (트리가 그대로이면 감지기 대신 필요한 필드만 디코딩)
+        self._aggregate = None
+        
+        # 감지기별 계측 (기본 비활성)
+        self.profiler = profiler or DetectorProfiler()
+        
+        # 예산 모드: 분석 시작부터의 시간 또는 새로 읽은 바이트가 예산을 넘으면 나머지 파일은 표본에서 제외하고 추정
+        self.budget_seconds = budget_seconds
+        self.budget_bytes = budget_bytes
+        self.sampling_stats = {}
+        self._started = None
+        
+        # 매니페스트 파싱 결과 (분석마다 경로별 메모)
+        self._manifests = {}
+        
+        # 내용 인덱스 모드: 내용 스캔 대상 파일을 FTS 인덱스(.kdt-cache/content.sqlite) 질의로 감지 (예산 모드에서는 사용 안 함)
+        self.content_index = content_index
+    
+    @property
+    def file_index(self) -> FileIndex:
+        """저장소 파일 인덱스 (최초 접근 시 한 번만 순회)"""
+        if self._file_index is None:
+            with self.profiler.span("index"):
+                if self._shared_index is not None:
+                    self._file_index = self._shared_index
+                elif self.ref:
+                    self._file_index = GitTreeIndex(self.repo_path, self.ref, max_depth=self.max_depth).build()
+                else:
+                    self._file_index = FileIndex(self.repo_path, max_depth=self.max_depth).build()
+                self.profiler.count("files_visited", len(self._file_index))
+        return self._file_index
+    
+    def _read_text(self, entry) -> str:
+        """파일 내용 읽기 (FileEntry 또는 상대 경로, 캐시 공유)"""
+        if not isinstance(entry, FileEntry):
+            rel_path = entry
+            entry = self.file_index.get(rel_path)
+            if entry is None:
+                raise FileNotFoundError(self.repo_path / rel_path)
+        key = entry.blob_sha or (entry.path, entry.mtime)
+        if not self.profiler.enabled:
+            return self.content_cache.read_text(key, lambda: self.file_index.read_bytes(entry), entry.size)
+        
+        hits = self.content_cache.hits
+        text = self.content_cache.read_text(key, lambda: self.file_index.read_bytes(entry), entry.size)
+        self.profiler.count("files_visited")
+        if self.content_cache.hits > hits:
+            self.profiler.count("cache_hits")
+        else:
+            self.profiler.count("bytes_read", entry.size)
+        return text
+    
+    def _visit(self, files: List[FileEntry]) -> List[FileEntry]:
+        """감지기가 살펴보는 파일 수 계측"""
+        self.profiler.count("files_visited", len(files))
+        return files
+    
+    def _reset(self):
+        """새 분석 준비: 인덱스를 새로 구축하고 모든 감지기가 공유"""
+        if self._file_index is not None:
+            self._file_index.close()
+        self._file_index = None
+        self._findings = None
+        self._manifests = {}
+        self._aggregate = None
+        self._reset_values()
+    
+    def _reset_values(self):
+        """감지기 결과와 분석별 통계 초기화 (인덱스와 파일별 감지 결과는 유지)"""
+        self._values = {}
+        self._computing = set()
+        self.profiler.reset()
+        self.content_cache.reset_stats()
+        self.scan_stats = {"files_reused": 0, "files_rescanned": 0,
+                           "files_skipped_large": 0, "aggregate_hit": False}
+        self.sampling_stats = {}
+        # 감지하지 못해 기본값으로 채운 결과 필드 (DB 불필요, 기본 포트 - 헤지 병합에서 낮은 신뢰도로 취급)
+        self._defaulted = set()
+        self._started = time.perf_counter()
+    
+    @property
+    def sampling(self) -> bool:
+        """시간/바이트 예산 기반 표본 분석 여부"""
+        return self.budget_seconds is not None or self.budget_bytes is not None
+    
+    def get(self, field: str) -> Any:
+        """결과 필드 하나를 의존 필드부터 계산하여 반환 (분석당 한 번만 계산)"""
+        if self._values is None:
+            self._reset()
+        if field in self._values:
+            return self._values[field]
+        if self._aggregate is not None and field in self._aggregate:
+            self._values[field] = self._aggregate[field]
+            return self._values[field]
+        if field in self._computing:
+            raise RuntimeError(f"Detector dependency cycle at '{field}'")
+        
+        method, deps = DETECTORS[field]
+        self._computing.add(field)
+        try:
+            args = [self.get(dep) for dep in deps]
+            with self.profiler.span(field):
+                value = getattr(self, method)(*args)
+        finally:
+            self._computing.discard(field)
+        self._values[field] = value
+        return value
+    
+    def lazy_result(self) -> AnalysisView:
+        """필요한 필드만 계산하는 지연 분석 결과 (예: Terraform/K8s 생성기는 framework/database/resources/ports만 사용)
+        
+        이전 전체 분석 결과는 버리며, 트리가 집계 캐시에 저장된 분석과 같으면 감지기 대신 저장된 결과에서
+        필요한 필드만 디코딩한다. 사용 후 close()로 git blob 리더 등을 정리한다.
+        """
+        self._reset()
+        self.analysis_result = {}
+        with self._store_session() as store:
+            if store:
+                self._aggregate = store.get_aggregate(self.file_index.root, self._tree_fingerprint())
+        return AnalysisView(self)
+    
+    def is_current(self, lazy: bool = False) -> bool:
+        """마지막 분석 이후 저장소가 바뀌지 않았는지 (표본 추정 결과는 다시 분석하여 보완)
+        
+        lazy=True이면 전체 결과 대신 lazy_result()로 계산해 둔 필드나 take_result()로 넘긴 결과가
+        여전히 유효한지 확인한다.
+        """
+        analyzed = self._values is not None if lazy else bool(self.analysis_result)
+        return (analyzed and self._file_index is not None
+                and not self.sampling_stats.get("partial") and self._file_index.is_current())
+    
+    def take_result(self) -> Dict:
+        """분석 결과를 넘겨주고 분석기의 결과/감지기 메모는 비움 (상주 세션이 결과를 다른 형식으로 보관할 때)
+        
+        파일 인덱스는 유지하므로 is_current(lazy=True)로 트리 변경 여부를 계속 확인할 수 있다.
+        """
+        result = self.analysis_result
+        self.analysis_result = {}
+        self._values = {}
+        return result
+    
+    def close(self):
+        """파일 인덱스가 연 리소스 정리"""
+        if self._file_index is not None:
+            self._file_index.close()
     
     def analyze(self) -> Dict:
         """전체 분석 실행"""
-        print(f"🔍 Analyzing repository: {self.repo_path}")
-        
-        self.analysis_result = {
-            "app_type": self._detect_application_type(),
-            "framework": self._detect_framework(),
-            "database": self._detect_database_requirements(),
-            "resources": self._estimate_resources(),
-            "ports": self._detect_ports(),
-            "environment": self._detect_environment_variables(),
-            "dependencies": self._analyze_dependencies(),
-            "build_config": self._analyze_build_configuration()
-        }
+        print(f"🔍 Analyzing repository: {self.repo_path}" + (f" @ {self.ref}" if self.ref else ""))
+        
+        self._reset()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        self._store = self._open_store()
+        try:
+            # 트리가 마지막 분석과 동일하면 저장된 집계 결과를 그대로 사용
+            with self.profiler.span("fingerprint"):
+                fingerprint = self._tree_fingerprint() if self._store else None
+                cached_result = self._store.get_aggregate(self.file_index.root, fingerprint) if self._store else None
+            
+            if cached_result is not None:
+                self.scan_stats["aggregate_hit"] = True
+                self.profiler.count("cache_hits")
+                self._values.update(cached_result)
+                self.analysis_result = dict(cached_result)
+            else:
+                self.analysis_result = {field: self.get(field) for field in DETECTORS}
+                self.analysis_result["_defaults"] = sorted(self._defaulted)
+                if self._store:
+                    self._store.prune(self.file_index.root, (e.path for e in self.file_index))
+                    # 표본 추정 결과는 다음 실행에서 더 많은 파일을 스캔할 수 있도록 집계 캐시에 저장하지 않음
+                    if not self.sampling_stats.get("partial"):
+                        self._store.put_aggregate(self.file_index.root, fingerprint, self.analysis_result)
+        finally:
+            if self._store:
+                self._store.close()
+                self._store = None
+            self.file_index.close()
+        
+        self.analysis_result["_cache"] = {**self.content_cache.stats(), "incremental": self.scan_stats}
+        self.analysis_result["_index"] = dict(self.file_index.stats)
+        if self.sampling:
+            self.analysis_result["_sampling"] = {"budget_seconds": self.budget_seconds,
+                                                 "budget_bytes": self.budget_bytes,
+                                                 **self.sampling_stats}
+        
+        perf = self.profiler.report()
+        if perf is not None:
+            perf["total"] = {"wall_ms": round((time.perf_counter() - wall_start) * 1000, 3),
+                             "cpu_ms": round((time.process_time() - cpu_start) * 1000, 3)}
+            self.analysis_result["_perf"] = perf
         
         return self.analysis_result
     
+    def refresh(self, changed_paths: Iterable[str]) -> Dict:
+        """변경된 파일만 인덱스와 파일별 감지 결과에 반영하고 결과 필드를 다시 계산 (watch 모드)
+        
+        이전 분석이 없거나, 커밋/예산 모드이거나, 순회 범위가 바뀌어 인덱스를 증분 갱신할 수 없으면 전체 분석을 실행한다.
+        """
+        changed = list(dict.fromkeys(changed_paths))
+        if not self.analysis_result or self.ref or self.sampling or not self.file_index.update(changed):
+            return self.analyze()
+        
+        self._reset_values()
+        with self._store_session():
+            if self._findings is not None:
+                for rel_path in changed:
+                    self._findings.pop(rel_path, None)
+                    entry = self.file_index.get(rel_path)
+                    if entry is None or not is_scan_target(rel_path):
+                        continue
+                    file_findings = self._cached_findings(entry)
+                    self._findings[rel_path] = file_findings if file_findings is not None else self._scan_entry(entry)
+            for rel_path in changed:
+                self._manifests.pop(rel_path, None)
+            
+            self.analysis_result = {field: self.get(field) for field in DETECTORS}
+            self.analysis_result["_defaults"] = sorted(self._defaulted)
+        
+        self.analysis_result["_cache"] = {**self.content_cache.stats(), "incremental": self.scan_stats}
+        self.analysis_result["_index"] = dict(self.file_index.stats)
+        return self.analysis_result
+    
+    def _open_store(self) -> Optional[AnalysisCache]:
+        """영구 캐시 열기 (실패 시 캐시 없이 진행)"""
+        if not self.incremental:
+            return None
+        try:
+            return AnalysisCache(self.cache_dir, SCANNER_VERSION)
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Analysis cache disabled: {e}")
+            return None
+    
+    @contextmanager
+    def _store_session(self):
+        """분석 중이면 열려 있는 영구 캐시를 쓰고, 지연 계산 중이면 사용하는 동안만 연다"""
+        if self._store is not None:
+            yield self._store
+            return
+        self._store = self._open_store()
+        try:
+            yield self._store
+        finally:
+            if self._store:
+                self._store.close()
+            self._store = None
+    
+    def _manifest(self, rel_path: str) -> Optional[Dict]:
+        """pom.xml/package.json/package-lock.json 파싱 결과 (내용 해시별 영구 캐시, 읽을 수 없으면 None)"""
+        if rel_path in self._manifests:
+            return self._manifests[rel_path]
+        
+        entry = self.file_index.get(rel_path)
+        parser = parser_for(rel_path)
+        result = None
+        if entry is not None and parser is not None:
+            try:
+                # 작업 트리 파일은 스트리밍으로 해시만 계산하고, 캐시에 없을 때만 파싱
+                digest = entry.blob_sha or stream_file_stats(entry.path)[0]
+                key = f"{parser.__name__}:{PARSER_VERSION}:{digest}"
+                with self._store_session() as store:
+                    result = store.get_manifest(key) if store else None
+                    if result is None:
+                        with self.file_index.open(entry) as stream:
+                            result = parser(stream)
+                        self.profiler.count("bytes_read", entry.size)
+                        if store:
+                            store.put_manifest(key, result)
+                    else:
+                        self.profiler.count("cache_hits")
+            except:
+                result = None
+        
+        self._manifests[rel_path] = result
+        return result
+    
+    def _tree_fingerprint(self) -> str:
+        """파일 경로/크기/mtime 전체에 대한 트리 지문"""
+        digest = hashlib.sha1(f"v{SCANNER_VERSION}:{self.max_depth}:{self.max_file_size}:"
+                              f"{self.budget_seconds}:{self.budget_bytes}\n".encode())
+        for entry in self.file_index:
+            version = entry.blob_sha or entry.mtime
+            digest.update(f"{entry.rel_path}\0{entry.size}\0{version}\n".encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+    
+    def _scan_files(self) -> Dict[str, Dict]:
+        """스캔 대상 파일별 감지 결과 (변경된 파일만 다시 스캔)"""
+        if self._findings is not None:
+            return self._findings
+        
+        with self._store_session(), self.profiler.span("scan"):
+            findings = self._collect_findings()
+        
+        self._findings = findings
+        return findings
+    
+    def _collect_findings(self) -> Dict[str, Dict]:
+        findings = {}
+        pending = []
+        indexed = []
+        use_index = self.content_index and not self.sampling
+        self.profiler.count("files_visited", len(self.file_index))
+        for entry in self.file_index:
+            if not is_scan_target(entry.rel_path):
+                continue
+            
+            # 내용 인덱스 모드에서는 내용 스캔 대상을 인덱스 질의로 감지
+            if use_index and needs_content(entry.rel_path) and not self._is_oversized(entry):
+                indexed.append(entry)
+                continue
+            
+            file_findings = self._cached_findings(entry)
+            if file_findings is None:
+                pending.append(entry)
+            else:
+                findings[entry.rel_path] = file_findings
+        
+        if self.sampling:
+            self._scan_sampled(pending, findings)
+        # 다시 스캔할 파일이 많으면 프로세스 풀로 분산 스캔
+        elif self.jobs > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            self._scan_parallel(pending, findings)
+        else:
+            for entry in pending:
+                findings[entry.rel_path] = self._scan_entry(entry)
+        
+        if indexed:
+            findings.update(self._indexed_findings(indexed))
+        return findings
+    
+    def _content_targets(self) -> List[FileEntry]:
+        """내용 인덱스에 색인할 파일 (내용 스캔 대상과 CONTENT_INDEX_NAMES, 큰 파일 제외)"""
+        return [entry for entry in self.file_index
+                if not self._is_oversized(entry)
+                and (needs_content(entry.rel_path) or entry.name in CONTENT_INDEX_NAMES)]
+    
+    def _open_content_index(self) -> Optional[ContentIndex]:
+        """내용 인덱스 열기 (FTS5/trigram을 지원하지 않는 SQLite 등 실패 시 None)"""
+        try:
+            return ContentIndex(self.cache_dir)
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Content index disabled: {e}")
+            return None
+    
+    def update_content_index(self) -> ContentIndex:
+        """내용 인덱스를 현재 트리에 맞춰 갱신하고 연 채로 반환 (질의 CLI용, 사용 후 close())"""
+        index = ContentIndex(self.cache_dir)
+        index.sync(self.file_index.root, self._content_targets(), self._read_text)
+        return index
+    
+    def _indexed_findings(self, entries: List[FileEntry]) -> Dict[str, Dict]:
+        """내용 인덱스를 증분 갱신한 뒤 지표 문자열별 질의 결과로 파일별 감지 결과 구성
+        
+        파일은 새로 색인할 때만 읽으며, 질의 비용은 저장소 크기가 아니라 매칭된 파일 수에 비례한다.
+        설정 파일만 포트/환경변수 추출을 위해 색인된 본문을 가져온다.
+        """
+        index = self._open_content_index()
+        if index is None:
+            findings = {}
+            for entry in entries:
+                file_findings = self._cached_findings(entry)
+                findings[entry.rel_path] = file_findings if file_findings is not None else self._scan_entry(entry)
+            return findings
+        
+        root = self.file_index.root
+        try:
+            with self.profiler.span("content_index"):
+                docs = index.sync(root, self._content_targets(), self._read_text)
+                
+                # 상대 경로 -> (찾은 대소문자 구분 문자열, 찾은 대소문자 무시 문자열)
+                found = {}
+                for literal, ignore_case in get_scanner("java_framework", "orm", "database", "service").literals():
+                    for rel_path in index.search(root, literal, ignore_case):
+                        found.setdefault(rel_path, ([], []))[ignore_case].append(literal)
+                
+                findings = {}
+                for entry in entries:
+                    doc = docs[entry.path]
+                    if doc.state != "text":
+                        findings[entry.rel_path] = {doc.state: True}
+                        continue
+                    exact, folded = found.get(entry.rel_path, ((), ()))
+                    groups = scan_groups(entry.rel_path)
+                    matches = get_scanner(*groups).resolve(exact, folded) if groups else {}
+                    content = index.text(doc.id) if is_config_file(entry.rel_path) else None
+                    lines = doc.lines if counts_lines(entry.rel_path) else None
+                    findings[entry.rel_path] = build_findings(entry.rel_path, matches, lines, content)
+                    if self.profiler.enabled:
+                        self.profiler.count("regex_matches", count_matches(findings[entry.rel_path]))
+        finally:
+            index.close()
+        
+        self.scan_stats["files_reused"] += index.stats["reused"]
+        self.scan_stats["files_rescanned"] += index.stats["indexed"]
+        self.scan_stats["content_index"] = dict(index.stats)
+        return findings
+    
+    def _cached_findings(self, entry: FileEntry) -> Optional[Dict]:
+        """읽지 않고 알 수 있는 감지 결과 (큰 파일 건너뜀 또는 영구 캐시), 스캔해야 하면 None"""
+        # 큰 파일은 내용을 스캔하지 않음 (작업 트리 파일의 라인 수는 스트리밍으로 계산)
+        if self._is_oversized(entry):
+            self.scan_stats["files_skipped_large"] += 1
+            if entry.blob_sha or not counts_lines(entry.rel_path):
+                return {"skipped": "size"}
+        
+        # git blob은 SHA가 곧 내용 해시이므로 읽기 전에 조회 가능
+        file_findings = None
+        if self._store:
+            if entry.blob_sha:
+                file_findings = self._store.lookup_digest(entry.path, entry.size, entry.mtime, entry.blob_sha)
+            else:
+                file_findings = self._store.lookup(entry.path, entry.size, entry.mtime)
+        
+        if file_findings is not None:
+            self.scan_stats["files_reused"] += 1
+            self.profiler.count("cache_hits")
+        return file_findings
+    
+    def _scan_sampled(self, pending: List[FileEntry], findings: Dict[str, Dict]):
+        """예산 안에서 층화 무작위 순서로 스캔 (프레임워크 판단용 파일은 항상 먼저 스캔)
+        
+        예산이 끝나면 남은 파일은 findings에 넣지 않으며, 라인 수는 _complexity_estimate에서 외삽한다.
+        """
+        pinned = {e.rel_path for e in self.file_index.files_with_ext(".java")[:SAMPLING_PINNED_JAVA_FILES]}
+        pinned.update(e.rel_path for e in self.file_index.files_named(CONFIG_FILE_PATTERN))
+        first = [e for e in pending if e.rel_path in pinned]
+        ordered = first + stratified_order([e for e in pending if e.rel_path not in pinned])
+        
+        bytes_read = 0
+        scanned = 0
+        for entry in ordered:
+            if scanned >= len(first) and self._budget_exhausted(bytes_read):
+                break
+            findings[entry.rel_path] = self._scan_entry(entry)
+            bytes_read += entry.size
+            scanned += 1
+        
+        self.sampling_stats.update({
+            "files_pending": len(pending),
+            "files_sampled": scanned,
+            "bytes_sampled": bytes_read,
+            "partial": scanned < len(ordered)
+        })
+    
+    def _budget_exhausted(self, bytes_read: int) -> bool:
+        if self.budget_bytes is not None and bytes_read >= self.budget_bytes:
+            return True
+        return (self.budget_seconds is not None
+                and time.perf_counter() - self._started >= self.budget_seconds)
+    
+    def _is_oversized(self, entry: FileEntry) -> bool:
+        return self.max_file_size is not None and entry.size > self.max_file_size
+    
+    def _is_streamable(self, entry: FileEntry) -> bool:
+        """디코딩 없이 라인 수만 스트리밍으로 계산할 파일인지 여부"""
+        return (not entry.blob_sha and counts_lines(entry.rel_path)
+                and (self._is_oversized(entry) or not needs_content(entry.rel_path)))
+    
+    def _scan_entry(self, entry: FileEntry) -> Dict:
+        """파일 하나 스캔 (내용 캐시 공유)"""
+        content = None
+        try:
+            if self._is_streamable(entry):
+                digest, lines = stream_file_stats(entry.path)
+                self.profiler.count("bytes_read", entry.size)
+            else:
+                content = self._read_text(entry)
+                digest = entry.blob_sha or blob_digest(content.encode("utf-8"))
+        except BinaryFileError:
+            return {"binary": True}
+        except:
+            return {"unreadable": True}
+        
+        file_findings = None
+        if self._store and not entry.blob_sha:
+            file_findings = self._store.lookup_digest(entry.path, entry.size, entry.mtime, digest)
+        
+        if file_findings is None:
+            if content is None:
+                file_findings = {"lines": lines}
+            else:
+                file_findings = scan_file_content(entry.rel_path, content)
+                if self.profiler.enabled:
+                    self.profiler.count("regex_matches", count_matches(file_findings))
+            self.scan_stats["files_rescanned"] += 1
+            if self._store:
+                self._store.store(entry.path, entry.size, entry.mtime, digest, file_findings)
+        else:
+            self.scan_stats["files_reused"] += 1
+            self.profiler.count("cache_hits")
+        
+        return file_findings
+    
+    def _scan_parallel(self, pending: List[FileEntry], findings: Dict[str, Dict]):
+        """파일 목록을 묶음 단위로 나누어 프로세스 풀에서 스캔하고 결과를 합침"""
+        chunk_size = max(PARALLEL_CHUNK_MIN, len(pending) // (self.jobs * 4) + 1)
+        shards = [
+            [(e.rel_path, e.path, e.blob_sha, self._is_streamable(e)) for e in pending[i:i + chunk_size]]
+            for i in range(0, len(pending), chunk_size)
+        ]
+        entries = {e.rel_path: e for e in pending}
+        self.scan_stats["parallel_jobs"] = self.jobs
+        
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            for results in pool.map(scan_file_shard, [self.file_index.root] * len(shards), shards):
+                for rel_path, digest, file_findings in results:
+                    findings[rel_path] = file_findings
+                    if digest is None:
+                        continue
+                    self.scan_stats["files_rescanned"] += 1
+                    if self.profiler.enabled:
+                        self.profiler.count("bytes_read", entries[rel_path].size)
+                        self.profiler.count("regex_matches", count_matches(file_findings))
+                    if self._store:
+                        entry = entries[rel_path]
+                        self._store.store(entry.path, entry.size, entry.mtime, digest, file_findings)
+    
     def _detect_application_type(self) -> str:
         """애플리케이션 타입 감지"""
-        if (self.repo_path / "pom.xml").exists():
+        if self.file_index.exists("pom.xml"):
             return "java-maven"
-        elif (self.repo_path / "build.gradle").exists():
+        elif self.file_index.exists("build.gradle"):
             return "java-gradle"
-        elif (self.repo_path / "package.json").exists():
+        elif self.file_index.exists("package.json"):
             return "nodejs"
-        elif (self.repo_path / "requirements.txt").exists():
+        elif self.file_index.exists("requirements.txt"):
             return "python"
-        elif (self.repo_path / "go.mod").exists():
+        elif self.file_index.exists("go.mod"):
             return "golang"
-        elif (self.repo_path / "Cargo.toml").exists():
+        elif self.file_index.exists("Cargo.toml"):
             return "rust"
         else:
             return "unknown"
     
-    def _detect_framework(self) -> str:
+    def _detect_framework(self, app_type: str) -> str:
         """프레임워크 감지"""
-        app_type = self.analysis_result.get("app_type", self._detect_application_type())
-        
         if app_type in ["java-maven", "java-gradle"]:
             return self._detect_java_framework()
         elif app_type == "nodejs":
@@ -67,67 +847,61 @@ class ApplicationAnalyzer:
     def _detect_java_framework(self) -> str:
         """Java 프레임워크 감지"""
         # pom.xml 또는 build.gradle 분석
-        if (self.repo_path / "pom.xml").exists():
-            pom_content = (self.repo_path / "pom.xml").read_text()
-            if "spring-boot" in pom_content.lower():
+        pom = self._manifest("pom.xml")
+        if pom:
+            artifacts = [pom["parent"] or {}] + pom["dependencies"] + pom["plugins"]
+            coordinates = "\n".join(f"{a.get('groupId', '')}:{a.get('artifactId', '')}" for a in artifacts)
+            build_framework = get_scanner("build_framework").scan(coordinates).get("build_framework", [])
+            if "spring-boot" in build_framework:
                 return "spring-boot"
-            elif "spring" in pom_content.lower():
+            elif "spring" in build_framework:
                 return "spring"
         
         # 소스 코드 분석
-        java_files = list(self.repo_path.rglob("*.java"))
-        for java_file in java_files[:10]:  # 처음 10개 파일만 검사
-            try:
-                content = java_file.read_text()
-                if "@SpringBootApplication" in content:
-                    return "spring-boot"
-                elif "@RestController" in content or "@Controller" in content:
-                    return "spring"
-            except:
-                continue
+        findings = self._scan_files()
+        java_files = self.file_index.files_with_ext(".java")
+        for java_file in self._visit(java_files[:10]):  # 처음 10개 파일만 검사
+            file_findings = findings.get(java_file.rel_path, {})
+            if file_findings.get("spring_boot_app"):
+                return "spring-boot"
+            elif file_findings.get("controller"):
+                return "spring"
         
         return "java"
     
     def _detect_nodejs_framework(self) -> str:
         """Node.js 프레임워크 감지"""
-        if (self.repo_path / "package.json").exists():
-            try:
-                package_json = json.loads((self.repo_path / "package.json").read_text())
-                dependencies = {**package_json.get("dependencies", {}), 
-                              **package_json.get("devDependencies", {})}
-                
-                if "react" in dependencies:
-                    return "react"
-                elif "vue" in dependencies:
-                    return "vue"
-                elif "angular" in dependencies:
-                    return "angular"
-                elif "express" in dependencies:
-                    return "express"
-                elif "next" in dependencies:
-                    return "nextjs"
-            except:
-                pass
+        package = self._manifest("package.json")
+        if package:
+            dependencies = {**package["dependencies"], **package["dev_dependencies"]}
+            
+            if "react" in dependencies:
+                return "react"
+            elif "vue" in dependencies:
+                return "vue"
+            elif "angular" in dependencies:
+                return "angular"
+            elif "express" in dependencies:
+                return "express"
+            elif "next" in dependencies:
+                return "nextjs"
         
         return "nodejs"
     
     def _detect_python_framework(self) -> str:
         """Python 프레임워크 감지"""
-        if (self.repo_path / "requirements.txt").exists():
+        if self.file_index.exists("requirements.txt"):
             try:
-                requirements = (self.repo_path / "requirements.txt").read_text()
-                if "django" in requirements.lower():
-                    return "django"
-                elif "flask" in requirements.lower():
-                    return "flask"
-                elif "fastapi" in requirements.lower():
-                    return "fastapi"
+                requirements = self._read_text("requirements.txt")
+                python_framework = get_scanner("python_framework").scan(requirements).get("python_framework", [])
+                if python_framework:
+                    return python_framework[0]
             except:
                 pass
         
         return "python"
     
-    def _detect_database_requirements(self) -> Dict:
+    def _detect_database_requirements(self, app_type: str) -> Dict:
         """데이터베이스 요구사항 분석"""
         db_config = {
             "required": False,
@@ -136,49 +910,36 @@ class ApplicationAnalyzer:
         }
         
         # Java 애플리케이션 DB 분석
-        if self.analysis_result.get("app_type", "").startswith("java"):
+        if app_type.startswith("java"):
             db_config.update(self._analyze_java_database())
         
         # application.yml/properties 분석
-        config_files = list(self.repo_path.rglob("application.*"))
-        for config_file in config_files:
-            try:
-                content = config_file.read_text().lower()
-                if any(db in content for db in ["mysql", "postgresql", "oracle", "h2"]):
-                    db_config["required"] = True
-                    if "mysql" in content:
-                        db_config["type"] = "mysql"
-                    elif "postgresql" in content:
-                        db_config["type"] = "postgresql"
-            except:
-                continue
+        findings = self._scan_files()
+        config_files = self.file_index.files_named(CONFIG_FILE_PATTERN)
+        for config_file in self._visit(config_files):
+            file_findings = findings.get(config_file.rel_path, {})
+            if file_findings.get("db"):
+                db_config["required"] = True
+                if file_findings.get("db_type"):
+                    db_config["type"] = file_findings["db_type"]
         
+        if not db_config["required"]:
+            self._defaulted.add("database")
         return db_config
     
     def _analyze_java_database(self) -> Dict:
         """Java 애플리케이션의 데이터베이스 사용 분석"""
-        db_indicators = {
-            "jpa": ["@Entity", "@Repository", "JpaRepository"],
-            "mybatis": ["@Mapper", "mybatis"],
-            "jdbc": ["JdbcTemplate", "DataSource"]
-        }
-        
-        java_files = list(self.repo_path.rglob("*.java"))
-        for java_file in java_files:
-            try:
-                content = java_file.read_text()
-                for orm, indicators in db_indicators.items():
-                    if any(indicator in content for indicator in indicators):
-                        return {"required": True, "orm": orm}
-            except:
-                continue
+        findings = self._scan_files()
+        java_files = self.file_index.files_with_ext(".java")
+        for java_file in self._visit(java_files):
+            orm = findings.get(java_file.rel_path, {}).get("orm")
+            if orm:
+                return {"required": True, "orm": orm}
         
         return {"required": False}
     
-    def _estimate_resources(self) -> Dict:
+    def _estimate_resources(self, framework: str, dependency_graph: Dict) -> Dict:
         """리소스 요구사항 추정"""
-        framework = self.analysis_result.get("framework", self._detect_framework())
-        
         # 기본 리소스 설정
         resources = {
             "cpu_request": "250m",
@@ -204,90 +965,106 @@ class ApplicationAnalyzer:
                 "memory_limit": "256Mi"
             })
         
+        # 의존성 그래프 규모 기반 조정 (JVM 클래스 메타데이터, Node 모듈 로딩)
+        maven = dependency_graph.get("maven")
+        if framework in JAVA_FRAMEWORKS and maven and maven["dependencies"] >= HEAVY_MAVEN_DEPENDENCIES:
+            raise_memory(resources, "1Gi", "2Gi")
+        node_packages = sum(lock["runtime_packages"] for lock in dependency_graph.get("npm", []))
+        if framework in NODE_SERVER_FRAMEWORKS and node_packages >= HEAVY_NODE_PACKAGES:
+            raise_memory(resources, "768Mi", "1.5Gi")
+        
         # 코드 복잡도 기반 조정
-        complexity = self._calculate_complexity()
+        # 표본 추정이면 신뢰구간 상한으로 판단 (경계값 근처에서는 큰 쪽 리소스 배정)
+        complexity = self._complexity_estimate()["high"]
         if complexity > 100:
             resources["replicas"] = 3
             resources["memory_limit"] = "2Gi"
         
+        # 런타임 힙 크기를 컨테이너 메모리 한도에 맞춤
+        if framework in JAVA_FRAMEWORKS:
+            resources["runtime_env"] = {"JAVA_TOOL_OPTIONS": f"-XX:MaxRAMPercentage={HEAP_PERCENTAGE}.0"}
+        elif framework in NODE_SERVER_FRAMEWORKS:
+            heap_mib = int(memory_mib(resources["memory_limit"]) * HEAP_PERCENTAGE / 100)
+            resources["runtime_env"] = {"NODE_OPTIONS": f"--max-old-space-size={heap_mib}"}
+        
         return resources
     
     def _calculate_complexity(self) -> int:
         """코드 복잡도 계산"""
+        return self._complexity_estimate()["value"]
+    
+    def _complexity_estimate(self) -> Dict:
+        """코드 복잡도 추정 (예산 안에 모두 스캔하지 못했으면 95% 신뢰구간 포함, 아니면 low == value == high)"""
+        findings = self._scan_files()
+        partial = self.sampling_stats.get("partial", False)
         total_lines = 0
-        total_files = 0
+        # 파일 수는 인덱스의 확장자 열에서 바로 계산
+        total_files = self.file_index.count_with_ext(*COMPLEXITY_EXTS)
+        units = []
         
-        for ext in ["*.java", "*.js", "*.ts", "*.py"]:
-            files = list(self.repo_path.rglob(ext))
-            total_files += len(files)
-            for file in files:
-                try:
-                    total_lines += len(file.read_text().splitlines())
-                except:
-                    continue
+        for ext in COMPLEXITY_EXTS:
+            for file in self._visit(self.file_index.files_with_ext(ext)):
+                file_findings = findings.get(file.rel_path)
+                if partial:
+                    lines = None if file_findings is None else file_findings.get("lines", 0)
+                    units.append((stratum_of(file.rel_path), file.size, lines))
+                elif file_findings:
+                    total_lines += file_findings.get("lines", 0)
         
-        return total_lines + (total_files * 10)
+        if not partial:
+            complexity = total_lines + (total_files * 10)
+            return {"value": complexity, "low": complexity, "high": complexity}
+        
+        lines = estimate_total(units)
+        complexity = {key: lines[key] + (total_files * 10) for key in ("value", "low", "high")}
+        self.sampling_stats["estimates"] = {"lines": lines, "complexity": {**complexity, "confidence": lines["confidence"]}}
+        return complexity
     
-    def _detect_ports(self) -> List[int]:
+    def _detect_ports(self, framework: str) -> List[int]:
         """애플리케이션 포트 감지"""
         ports = []
         
         # application.yml/properties에서 포트 찾기
-        config_files = list(self.repo_path.rglob("application.*"))
-        for config_file in config_files:
-            try:
-                content = config_file.read_text()
-                port_matches = re.findall(r'port[:\s]*(\d+)', content)
-                ports.extend([int(p) for p in port_matches])
-            except:
-                continue
+        findings = self._scan_files()
+        config_files = self.file_index.files_named(CONFIG_FILE_PATTERN)
+        for config_file in self._visit(config_files):
+            ports.extend(findings.get(config_file.rel_path, {}).get("ports", []))
         
         # Dockerfile에서 EXPOSE 찾기
-        dockerfile = self.repo_path / "Dockerfile"
-        if dockerfile.exists():
+        if self.file_index.exists("Dockerfile"):
             try:
-                content = dockerfile.read_text()
+                content = self._read_text("Dockerfile")
                 expose_matches = re.findall(r'EXPOSE\s+(\d+)', content)
+                self.profiler.count("regex_matches", len(expose_matches))
                 ports.extend([int(p) for p in expose_matches])
             except:
                 pass
         
         # 기본 포트 설정
         if not ports:
-            framework = self.analysis_result.get("framework", self._detect_framework())
-            if framework == "spring-boot":
-                ports = [8080]
-            elif framework in ["react", "vue", "angular"]:
-                ports = [3000]
-            elif framework == "express":
-                ports = [3000]
-            else:
-                ports = [8080]
+            ports = default_ports(framework)
+            self._defaulted.add("ports")
         
-        return list(set(ports))
+        return sorted(set(ports))
     
-    def _detect_environment_variables(self) -> List[str]:
+    def _detect_environment_variables(self, database: Dict) -> List[str]:
         """환경변수 요구사항 감지"""
         env_vars = []
         
         # application.yml에서 환경변수 찾기
-        config_files = list(self.repo_path.rglob("application.*"))
-        for config_file in config_files:
-            try:
-                content = config_file.read_text()
-                env_matches = re.findall(r'\$\{([^}]+)\}', content)
-                env_vars.extend(env_matches)
-            except:
-                continue
+        findings = self._scan_files()
+        config_files = self.file_index.files_named(CONFIG_FILE_PATTERN)
+        for config_file in self._visit(config_files):
+            env_vars.extend(findings.get(config_file.rel_path, {}).get("env", []))
         
         # 데이터베이스 관련 환경변수 추가
-        if self.analysis_result.get("database", {}).get("required"):
+        if database.get("required"):
             env_vars.extend([
                 "DB_HOST", "DB_PORT", "DB_NAME", 
                 "DB_USER", "DB_PASSWORD"
             ])
         
-        return list(set(env_vars))
+        return sorted(set(env_vars))
     
     def _analyze_dependencies(self) -> Dict:
         """의존성 분석"""
@@ -298,25 +1075,44 @@ class ApplicationAnalyzer:
         }
         
         # Redis, Elasticsearch 등 외부 서비스 감지
-        all_files = list(self.repo_path.rglob("*"))
-        for file in all_files:
-            if file.is_file() and file.suffix in ['.java', '.js', '.py', '.yml', '.properties']:
-                try:
-                    content = file.read_text().lower()
-                    if "redis" in content:
-                        dependencies["external_services"].append("redis")
-                    if "elasticsearch" in content:
-                        dependencies["external_services"].append("elasticsearch")
-                    if "kafka" in content:
-                        dependencies["external_services"].append("kafka")
-                except:
-                    continue
-        
-        # 중복 제거
-        dependencies["external_services"] = list(set(dependencies["external_services"]))
+        findings = self._scan_files()
+        all_files = self.file_index.files_with_ext(*DEPENDENCY_EXTS)
+        for file in self._visit(all_files):
+            dependencies["external_services"].extend(findings.get(file.rel_path, {}).get("services", []))
+        
+        # 중복 제거 (refresh 결과를 비교할 수 있도록 정렬)
+        dependencies["external_services"] = sorted(set(dependencies["external_services"]))
         
         return dependencies
     
+    def _analyze_dependency_graph(self) -> Dict:
+        """매니페스트/lockfile 기반 의존성 그래프 요약"""
+        graph = {
+            "maven": None,
+            "npm": [],
+            "total_packages": 0
+        }
+        
+        pom = self._manifest("pom.xml")
+        if pom:
+            parent = pom["parent"]
+            graph["maven"] = {
+                "parent": f"{parent.get('groupId')}:{parent.get('artifactId')}:{parent.get('version')}" if parent else None,
+                "dependencies": len(pom["dependencies"]),
+                "managed_dependencies": len(pom["managed_dependencies"]),
+                "plugins": len(pom["plugins"])
+            }
+            graph["total_packages"] += len(pom["dependencies"])
+        
+        # 하위 프로젝트(frontend/ 등)의 lockfile 포함
+        for lockfile in self._visit(self.file_index.files_named("package-lock.json")):
+            summary = self._manifest(lockfile.rel_path)
+            if summary:
+                graph["npm"].append({"path": lockfile.rel_path, **summary})
+                graph["total_packages"] += summary["packages"]
+        
+        return graph
+    
     def _analyze_build_configuration(self) -> Dict:
         """빌드 설정 분석"""
         build_config = {
@@ -327,81 +1123,145 @@ class ApplicationAnalyzer:
         }
         
         # Maven/Gradle 분석
-        if (self.repo_path / "pom.xml").exists():
+        if self.file_index.exists("pom.xml"):
             build_config["build_tool"] = "maven"
-            try:
-                pom_content = (self.repo_path / "pom.xml").read_text()
-                java_version_match = re.search(r'<java\.version>([^<]+)</java\.version>', pom_content)
-                if java_version_match:
-                    build_config["java_version"] = java_version_match.group(1)
-            except:
-                pass
+            pom = self._manifest("pom.xml")
+            if pom and pom["properties"].get("java.version"):
+                build_config["java_version"] = pom["properties"]["java.version"]
         
-        elif (self.repo_path / "build.gradle").exists():
+        elif self.file_index.exists("build.gradle"):
             build_config["build_tool"] = "gradle"
         
         # Node.js 버전 분석
-        if (self.repo_path / "package.json").exists():
-            try:
-                package_json = json.loads((self.repo_path / "package.json").read_text())
-                if "engines" in package_json and "node" in package_json["engines"]:
-                    build_config["node_version"] = package_json["engines"]["node"]
-            except:
-                pass
+        package = self._manifest("package.json")
+        if package and "node" in package["engines"]:
+            build_config["node_version"] = package["engines"]["node"]
         
         # Dockerfile 존재 여부
-        if (self.repo_path / "Dockerfile").exists():
+        if self.file_index.exists("Dockerfile"):
             build_config["docker_required"] = True
         
         return build_config
     
-    def generate_summary(self) -> str:
-        """분석 결과 요약 생성"""
-        if not self.analysis_result:
-            self.analyze()
+    def generate_summary(self, result: Optional[Mapping] = None) -> str:
+        """분석 결과 요약 생성 (result가 없으면 이 분석기의 결과)"""
+        if result is None:
+            if not self.analysis_result:
+                self.analyze()
+            result = self.analysis_result
         
         summary = f"""
 🔍 Application Analysis Summary
 ================================
 
-📱 Application Type: {self.analysis_result['app_type']}
-🚀 Framework: {self.analysis_result['framework']}
-🗄️  Database Required: {self.analysis_result['database']['required']}
-🔌 Ports: {', '.join(map(str, self.analysis_result['ports']))}
-💾 Memory Limit: {self.analysis_result['resources']['memory_limit']}
-🔄 Replicas: {self.analysis_result['resources']['replicas']}
-🌍 Environment Variables: {len(self.analysis_result['environment'])}
+📱 Application Type: {result['app_type']}
+🚀 Framework: {result['framework']}
+🗄️  Database Required: {result['database']['required']}
+🔌 Ports: {', '.join(map(str, result['ports']))}
+💾 Memory Limit: {result['resources']['memory_limit']}
+🔄 Replicas: {result['resources']['replicas']}
+🌍 Environment Variables: {len(result['environment'])}
 
 Recommended Infrastructure:
-- EKS Cluster with {self.analysis_result['resources']['replicas']} replicas
-- Memory: {self.analysis_result['resources']['memory_limit']} per pod
-- CPU: {self.analysis_result['resources']['cpu_limit']} per pod
+- EKS Cluster with {result['resources']['replicas']} replicas
+- Memory: {result['resources']['memory_limit']} per pod
+- CPU: {result['resources']['cpu_limit']} per pod
 """
         
-        if self.analysis_result['database']['required']:
-            db_type = self.analysis_result['database'].get('type', 'mysql')
+        if result['database']['required']:
+            db_type = result['database'].get('type', 'mysql')
             summary += f"- RDS {db_type.upper()} database\n"
         
         return summary
 
 def main():
     """메인 실행 함수"""
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Application code analyzer")
+    parser.add_argument("repo_path", help="분석할 저장소 경로")
+    parser.add_argument("--no-cache", action="store_true", help="영구 분석 캐시 사용 안 함")
+    parser.add_argument("--cache-dir", help=f"영구 분석 캐시 위치 (기본: <repo_path>/{CACHE_DIR_NAME})")
+    parser.add_argument("--ref", help="작업 트리 대신 분석할 git 커밋/브랜치 (체크아웃 불필요)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help=f"파일 스캔 병렬 프로세스 수 (0 = CPU 수, 스캔할 파일이 {PARALLEL_MIN_FILES}개 미만이면 직렬)")
+    parser.add_argument("--max-depth", type=int, help="순회할 최대 디렉토리 깊이 (0 = 루트만)")
+    parser.add_argument("--max-file-size", type=int, default=DEFAULT_MAX_FILE_SIZE,
+                        help=f"내용을 읽을 최대 파일 크기 (bytes, 기본: {DEFAULT_MAX_FILE_SIZE})")
+    parser.add_argument("--budget-seconds", type=float,
+                        help="분석 시간 예산 (초과 시 층화 표본으로 라인 수 등을 추정)")
+    parser.add_argument("--budget-bytes", type=int, help="새로 읽을 파일 바이트 예산 (초과 시 표본 추정)")
+    parser.add_argument("--profile", action="store_true", help="감지기별 실행 시간/파일/바이트 계측 출력 (결과의 _perf)")
+    parser.add_argument("--trace", help="Chrome trace-event JSON 저장 경로 (--profile 포함)")
+    parser.add_argument("--content-index", action="store_true",
+                        help="내용 스캔 대상 파일을 SQLite FTS5 내용 인덱스로 질의 (변경된 파일만 다시 색인)")
+    parser.add_argument("--format", choices=["json", "msgpack"], default="json",
+                        help="결과 저장 형식 (msgpack: analysis_result.msgpack, AnalysisResult.from_bytes로 로드)")
+    parser.add_argument("--watch", action="store_true",
+                        help="파일 변경을 감시하며 결과 필드가 바뀔 때만 결과 JSON을 다시 저장")
+    parser.add_argument("--debounce-ms", type=int, default=200, help="--watch 변경 묶음 대기 시간 (ms)")
+    parser.add_argument("--generate-dir", help="--watch 결과가 바뀔 때 Terraform/K8s 파일도 다시 생성할 위치")
+    parser.add_argument("--generator-config", help="--generate-dir 생성기 설정 JSON 파일 (PROJECT_NAME 등)")
+    args = parser.parse_args()
     
-    if len(sys.argv) != 2:
-        print("Usage: python code_analyzer.py <repo_path>")
-        sys.exit(1)
+    profiler = DetectorProfiler(enabled=args.profile or bool(args.trace), trace=bool(args.trace))
+    
+    analyzer = ApplicationAnalyzer(args.repo_path, cache_dir=args.cache_dir,
+                                   incremental=not args.no_cache,
+                                   max_depth=args.max_depth,
+                                   max_file_size=args.max_file_size,
+                                   ref=args.ref,
+                                   jobs=args.jobs or os.cpu_count() or 1,
+                                   profiler=profiler,
+                                   budget_seconds=args.budget_seconds,
+                                   budget_bytes=args.budget_bytes,
+                                   content_index=args.content_index)
+    output_file = f"analysis_result.{args.format}"
+    
+    def save_result(result: Dict):
+        if args.format == "msgpack":
+            with open(output_file, 'wb') as f:
+                f.write(packb(result))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(result, f, indent=2)
+    
+    if args.watch:
+        try:
+            from .watcher import watch
+            from .daemon import generate_infrastructure
+        except ImportError:
+            from watcher import watch
+            from daemon import generate_infrastructure
+        
+        generator_config = {}
+        if args.generator_config:
+            with open(args.generator_config) as f:
+                generator_config = json.load(f)
+        
+        def on_change(result: Dict, fields: List[str]):
+            save_result(result)
+            print(f"📄 {output_file} updated")
+            if args.generate_dir:
+                generate_infrastructure(result, args.generate_dir, generator_config)
+                print(f"🏗️ Manifests regenerated in {args.generate_dir}")
+        
+        watch(analyzer, on_change, debounce=args.debounce_ms / 1000)
+        return
     
-    repo_path = sys.argv[1]
-    analyzer = ApplicationAnalyzer(repo_path)
     result = analyzer.analyze()
     
     print(analyzer.generate_summary())
     
-    # JSON 결과 저장
-    output_file = "analysis_result.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    if profiler.enabled:
+        print("⏱️ Detector profile")
+        print(profiler.format_table())
+    if args.trace:
+        profiler.write_chrome_trace(args.trace)
+        print(f"📈 Chrome trace saved to: {args.trace}")
+    
+    # 결과 저장
+    save_result(result)
     
     print(f"\n📄 Detailed analysis saved to: {output_file}")
 
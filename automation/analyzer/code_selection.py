@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Prompt Code Selection
+Bedrock 프롬프트에 넣을 파일을 인프라 관련도(빌드 매니페스트, 설정, 컨트롤러, 엔티티, Dockerfile ...)로
+점수화하고, 주석/import/공백을 제거한 내용을 점수 순으로 토큰 예산에 맞춰 채우는 선택기
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .file_index import FileEntry, FileIndex
+    from .code_analyzer import DEFAULT_MAX_FILE_SIZE, is_config_file
+    from .bedrock_shards import CHARS_PER_TOKEN, estimate_tokens
+except ImportError:
+    from file_index import FileEntry, FileIndex
+    from code_analyzer import DEFAULT_MAX_FILE_SIZE, is_config_file
+    from bedrock_shards import CHARS_PER_TOKEN, estimate_tokens
+
+# 프롬프트에 넣을 파일 내용 토큰 예산 (지시문/응답 여유 제외)
+DEFAULT_PROMPT_TOKENS = 6000
+
+# 남은 예산이 이보다 적으면 잘린 파일을 더 넣지 않음
+MIN_EXCERPT_TOKENS = 150
+
+# 파일명별 점수 (빌드 매니페스트와 컨테이너 설정)
+NAME_SCORES = {
+    "pom.xml": 100,
+    "build.gradle": 100,
+    "build.gradle.kts": 100,
+    "package.json": 100,
+    "requirements.txt": 100,
+    "pyproject.toml": 90,
+    "go.mod": 90,
+    "Dockerfile": 80,
+    "docker-compose.yml": 80,
+    "docker-compose.yaml": 80
+}
+
+# application.yml/properties 등 설정 파일 점수
+CONFIG_SCORE = 90
+
+# 내용을 읽어 점수화할 소스 파일과 기본 점수
+SOURCE_EXTS = (".java", ".kt", ".js", ".ts", ".py", ".go")
+SOURCE_SCORE = 1
+
+# 소스 파일 점수 상한 (신호가 많아도 매니페스트/설정 파일보다 앞서지 않음)
+MAX_SOURCE_SCORE = 75
+
+# 소스 내용 신호 (지표 문자열, 점수) - 리소스/데이터베이스/포트 결정에 쓰이는 코드일수록 높음
+CONTENT_SIGNALS = [
+    ("@SpringBootApplication", 60),
+    ("@RestController", 50),
+    ("@Controller", 40),
+    ("@Entity", 40),
+    ("JpaRepository", 40),
+    ("@Repository", 35),
+    ("@Mapper", 30),
+    ("JdbcTemplate", 30),
+    ("@KafkaListener", 30),
+    ("@RabbitListener", 30),
+    ("@Configuration", 20),
+    ("@Value(", 15),
+    ("app.listen(", 40),
+    ("express()", 40),
+    ("FastAPI(", 40),
+    ("Flask(", 40),
+    ("urlpatterns", 20),
+    ("http.ListenAndServe", 40),
+    ("process.env", 25),
+    ("os.environ", 25),
+    ("os.Getenv", 25)
+]
+
+# 테스트 코드와 DTO는 인프라 판단에 거의 쓸모가 없으므로 점수를 낮춤
+TEST_PATH = re.compile(r"(^|/)(tests?|__tests__|spec|testdata)/|(Test|Tests|IT|_test|\.test|\.spec)\.[a-z]+$")
+DTO_NAME = re.compile(r"(Dto|DTO|Request|Response|Vo|VO)\.[a-z]+$")
+TEST_FACTOR = 0.1
+DTO_FACTOR = 0.3
+
+# 주석/import 제거 규칙 (문자열 리터럴 안의 // 등은 유지)
+_C_STYLE = re.compile(r'("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`)|/\*.*?\*/|//[^\n]*', re.S)
+_XML_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_IMPORT_LINE = re.compile(r"^\s*(import|package|from\s+\S+\s+import)\b.*$|^\s*(const|let|var)\s+\w+\s*=\s*require\(.*$", re.M)
+_HASH_COMMENT = re.compile(r"^\s*#(?!!).*$", re.M)
+
+C_STYLE_EXTS = (".java", ".kt", ".js", ".ts", ".go", ".gradle", ".kts", ".groovy")
+HASH_COMMENT_EXTS = (".py", ".yml", ".yaml", ".properties", ".toml", ".txt", ".cfg")
+
+# 들여쓰기가 의미를 갖는 파일 (앞 공백 유지)
+INDENTED_EXTS = (".py", ".yml", ".yaml")
+
+
+def _file_kind(rel_path: str) -> str:
+    name = rel_path.rsplit("/", 1)[-1]
+    return ".dockerfile" if name == "Dockerfile" else os.path.splitext(name)[1]
+
+
+def strip_code(rel_path: str, text: str) -> str:
+    """주석, import/package 문, 빈 줄과 불필요한 공백 제거 (들여쓰기가 의미 없는 언어는 들여쓰기도 제거)"""
+    ext = _file_kind(rel_path)
+    if ext in C_STYLE_EXTS:
+        text = _C_STYLE.sub(lambda m: m.group(1) or "", text)
+    elif ext == ".xml":
+        text = _XML_COMMENT.sub("", text)
+    elif ext in HASH_COMMENT_EXTS or ext == ".dockerfile":
+        text = _HASH_COMMENT.sub("", text)
+    if ext in SOURCE_EXTS:
+        text = _IMPORT_LINE.sub("", text)
+
+    keep_indent = ext in INDENTED_EXTS
+    lines = [line.rstrip() if keep_indent else line.strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def score_file(rel_path: str, text: Optional[str] = None) -> float:
+    """인프라 관련도 점수 (0이면 프롬프트 대상 아님, 소스 파일은 내용 신호 포함)"""
+    name = rel_path.rsplit("/", 1)[-1]
+    if name in NAME_SCORES:
+        score = NAME_SCORES[name]
+    elif is_config_file(rel_path):
+        score = CONFIG_SCORE
+    elif rel_path.endswith(SOURCE_EXTS):
+        score = min(MAX_SOURCE_SCORE,
+                    SOURCE_SCORE + sum(weight for literal, weight in CONTENT_SIGNALS if text and literal in text))
+    else:
+        return 0
+
+    # 하위 모듈 매니페스트보다 루트 매니페스트를 먼저 (깊이당 감점)
+    score -= rel_path.count("/") * 0.5
+    if TEST_PATH.search(rel_path):
+        score *= TEST_FACTOR
+    elif DTO_NAME.search(name):
+        score *= DTO_FACTOR
+    return max(score, 0.01)
+
+
+def select_code(index: FileIndex, max_tokens: int = DEFAULT_PROMPT_TOKENS) -> Dict[str, str]:
+    """점수 순으로 정리된 파일 내용을 토큰 예산까지 채움 (예산을 넘는 파일은 앞부분만)"""
+    candidates: List[Tuple[float, str, str]] = []
+    for entry in index:
+        if entry.size > DEFAULT_MAX_FILE_SIZE or not score_file(entry.rel_path):
+            continue
+        text = read_text(index, entry)
+        if text is None:
+            continue
+        stripped = strip_code(entry.rel_path, text)
+        if stripped:
+            candidates.append((score_file(entry.rel_path, text), entry.rel_path, stripped))
+    candidates.sort(key=lambda c: (-c[0], c[1]))
+
+    selected = {}
+    remaining = max_tokens
+    for score, rel_path, text in candidates:
+        tokens = estimate_tokens(text)
+        if tokens <= remaining:
+            selected[rel_path] = text
+            remaining -= tokens
+        elif remaining >= MIN_EXCERPT_TOKENS:
+            # 줄 단위로 자른 앞부분 (매니페스트/설정은 앞부분에 핵심이 몰려 있음)
+            excerpt = text[:remaining * CHARS_PER_TOKEN]
+            excerpt = excerpt[:excerpt.rfind("\n")] if "\n" in excerpt else excerpt
+            selected[rel_path] = excerpt + "\n... (truncated)"
+            remaining -= estimate_tokens(selected[rel_path])
+        if remaining < MIN_EXCERPT_TOKENS:
+            break
+    return selected
+
+
+def read_text(index: FileIndex, entry: FileEntry) -> Optional[str]:
+    """파일 내용 (바이너리이거나 읽을 수 없으면 None)"""
+    try:
+        return index.read_bytes(entry).decode("utf-8", errors="replace")
+    except:
+        return None
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Analyzer Content Cache
+경로+mtime (또는 blob SHA) 키 기반으로 파일 내용을 한 번만 읽고 디코딩하여 공유하는 LRU 캐시
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+# 기본 캐시 한도 (총 바이트)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ContentCache:
+    """총 바이트 수 기준 LRU 파일 내용 캐시"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[str, int]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def read_text(self, key: Hashable, loader: Callable[[], bytes], size: int = None) -> str:
+        """파일 내용을 캐시에서 반환 (없으면 loader로 읽고 디코딩하여 저장)
+
+        key는 작업 트리 파일이면 (경로, mtime), git blob이면 blob SHA.
+        """
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        text = loader().decode("utf-8")
+
+        nbytes = size if size is not None else len(text)
+        if nbytes <= self.max_bytes:
+            self._entries[key] = (text, nbytes)
+            self.total_bytes += nbytes
+            self._evict()
+
+        return text
+
+    def _evict(self):
+        """한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        while self.total_bytes > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.total_bytes -= nbytes
+            self.evictions += 1
+
+    def reset_stats(self):
+        """히트/미스 카운터 초기화 (캐시 내용은 유지)"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes
+        }
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Repository Content Index
+파일 내용을 SQLite FTS5(trigram) 전문 검색 인덱스에 경로/내용 해시별로 저장하고 변경된 파일만 다시 색인하여,
+감지기가 파일을 읽는 대신 "@Entity를 포함한 파일" 같은 부분 문자열 질의로 지표를 찾도록 하는 영구 인덱스
+"""
+
+import fnmatch
+import os
+import sqlite3
+import sys
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    from .file_index import FileEntry
+    from .streaming import BinaryFileError, blob_digest, count_lines
+except ImportError:
+    from file_index import FileEntry
+    from streaming import BinaryFileError, blob_digest, count_lines
+
+# 인덱스 저장 형식이 바뀌면 증가시켜 다시 색인
+INDEX_VERSION = 1
+CONTENT_DB_NAME = "content.sqlite"
+
+# trigram 토크나이저가 인덱스로 찾을 수 있는 최소 길이 (더 짧으면 전체 검색)
+MIN_INDEXED_LENGTH = 3
+
+
+class IndexedDocument(NamedTuple):
+    """색인된 파일 정보 (state: text, binary, unreadable)"""
+    id: int
+    size: int
+    mtime: float
+    digest: Optional[str]
+    state: str
+    lines: int
+
+
+def _like_pattern(literal: str) -> str:
+    return "%" + literal.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class ContentIndex:
+    """저장소 파일 내용 전문 검색 인덱스 (<cache_dir>/content.sqlite)
+
+    trigram 토크나이저는 3글자 이상 문자열을 대소문자 구분 없이 부분 문자열로 찾으므로,
+    대소문자를 구분하는 지표는 인덱스로 후보를 찾은 뒤 instr()로 한 번 더 확인한다.
+    """
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.db_path = os.path.join(cache_dir, CONTENT_DB_NAME)
+        self.conn = sqlite3.connect(self.db_path)
+        self.stats = {"indexed": 0, "reused": 0, "removed": 0, "queries": 0, "matches": 0}
+        self._setup_schema()
+
+    def _setup_schema(self):
+        """테이블 생성 및 인덱스 형식이 바뀐 경우 초기화 (FTS5/trigram이 없는 SQLite면 sqlite3.Error)"""
+        cur = self.conn.cursor()
+        cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = cur.execute("SELECT value FROM meta WHERE key = 'index_version'").fetchone()
+        if row is None or int(row[0]) != INDEX_VERSION:
+            cur.execute("DROP TABLE IF EXISTS docs")
+            cur.execute("DROP TABLE IF EXISTS content")
+            cur.execute("INSERT OR REPLACE INTO meta VALUES ('index_version', ?)", (str(INDEX_VERSION),))
+        cur.execute("""CREATE TABLE IF NOT EXISTS docs (
+            id INTEGER PRIMARY KEY,
+            path TEXT UNIQUE NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            digest TEXT,
+            state TEXT NOT NULL,
+            lines INTEGER NOT NULL
+        )""")
+        # rowid = docs.id
+        cur.execute("CREATE VIRTUAL TABLE IF NOT EXISTS content USING fts5(body, tokenize='trigram')")
+        self.conn.commit()
+
+    @staticmethod
+    def _prefix(root: str) -> str:
+        return os.path.join(os.path.abspath(root), "")
+
+    def documents(self, root: str) -> Dict[str, IndexedDocument]:
+        """저장소 루트 아래 색인된 파일 (절대 경로별)"""
+        prefix = self._prefix(root)
+        return {path: IndexedDocument(*row) for path, *row in self.conn.execute(
+            "SELECT path, id, size, mtime, digest, state, lines FROM docs WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix))}
+
+    def sync(self, root: str, entries: Iterable[FileEntry],
+             read_text: Callable[[FileEntry], str]) -> Dict[str, IndexedDocument]:
+        """인덱스를 파일 목록과 맞춤 (크기/mtime 또는 blob SHA가 바뀐 파일만 읽음, 목록에 없는 파일은 삭제)
+
+        read_text는 텍스트가 아니면 BinaryFileError, 그 밖에 읽을 수 없으면 다른 예외를 낸다.
+        """
+        known = self.documents(root)
+        docs = {}
+        for entry in entries:
+            doc = known.pop(entry.path, None)
+            if doc is not None and doc.size == entry.size and (
+                    doc.digest == entry.blob_sha if entry.blob_sha else doc.mtime == entry.mtime):
+                docs[entry.path] = doc
+                self.stats["reused"] += 1
+                continue
+            docs[entry.path] = self._index(entry, doc, read_text)
+
+        for doc in known.values():
+            self._delete(doc.id)
+        self.stats["removed"] += len(known)
+        self.conn.commit()
+        return docs
+
+    def _index(self, entry: FileEntry, doc: Optional[IndexedDocument],
+               read_text: Callable[[FileEntry], str]) -> IndexedDocument:
+        text = None
+        try:
+            text = read_text(entry)
+            state = "text"
+        except BinaryFileError:
+            state = "binary"
+        except:
+            state = "unreadable"
+        digest = entry.blob_sha or (blob_digest(text.encode("utf-8")) if text is not None else None)
+
+        # mtime만 바뀌고 내용이 같으면 본문은 다시 색인하지 않음
+        if doc is not None and text is not None and doc.state == "text" and doc.digest == digest:
+            self.conn.execute("UPDATE docs SET size = ?, mtime = ? WHERE id = ?", (entry.size, entry.mtime, doc.id))
+            self.stats["reused"] += 1
+            return doc._replace(size=entry.size, mtime=entry.mtime)
+
+        if doc is not None:
+            self._delete(doc.id)
+        lines = count_lines(text) if text is not None else 0
+        doc_id = self.conn.execute(
+            "INSERT INTO docs (path, size, mtime, digest, state, lines) VALUES (?, ?, ?, ?, ?, ?)",
+            (entry.path, entry.size, entry.mtime, digest, state, lines)).lastrowid
+        if text is not None:
+            self.conn.execute("INSERT INTO content (rowid, body) VALUES (?, ?)", (doc_id, text))
+        self.stats["indexed"] += 1
+        return IndexedDocument(doc_id, entry.size, entry.mtime, digest, state, lines)
+
+    def _delete(self, doc_id: int):
+        self.conn.execute("DELETE FROM content WHERE rowid = ?", (doc_id,))
+        self.conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def search(self, root: str, literal: str, ignore_case: bool = False,
+               pattern: Optional[str] = None) -> List[str]:
+        """literal을 포함한 파일의 상대 경로 (pattern: 파일명/상대 경로 glob)"""
+        prefix = self._prefix(root)
+        conditions = ["substr(d.path, 1, ?) = ?"]
+        params: List = [len(prefix), prefix]
+        if len(literal) >= MIN_INDEXED_LENGTH:
+            conditions.append("content MATCH ?")
+            params.append('"' + literal.replace('"', '""') + '"')
+        elif ignore_case:
+            conditions.append("c.body LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(literal))
+        if not ignore_case:
+            conditions.append("instr(c.body, ?) > 0")
+            params.append(literal)
+
+        rows = self.conn.execute(
+            "SELECT d.path FROM content c JOIN docs d ON d.id = c.rowid WHERE " + " AND ".join(conditions),
+            params)
+        paths = [path[len(prefix):] for (path,) in rows]
+        if pattern:
+            paths = [p for p in paths if fnmatch.fnmatchcase(p, pattern)
+                     or fnmatch.fnmatchcase(p.rsplit("/", 1)[-1], pattern)]
+        self.stats["queries"] += 1
+        self.stats["matches"] += len(paths)
+        return sorted(paths)
+
+    def text(self, doc_id: int) -> Optional[str]:
+        """색인된 본문"""
+        row = self.conn.execute("SELECT body FROM content WHERE rowid = ?", (doc_id,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def main():
+    """임의 질의 CLI (질의 전에 변경된 파일만 다시 색인)"""
+    import argparse
+
+    try:
+        from .code_analyzer import ApplicationAnalyzer
+        from .indicators import INDICATORS
+    except ImportError:
+        from code_analyzer import ApplicationAnalyzer
+        from indicators import INDICATORS
+
+    groups = sorted({indicator.group for indicator in INDICATORS})
+    parser = argparse.ArgumentParser(description="Query the repository content index")
+    parser.add_argument("repo_path", help="저장소 경로")
+    parser.add_argument("text", nargs="?", help="찾을 문자열 (부분 문자열)")
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="대소문자 무시")
+    parser.add_argument("--glob", help="파일명 또는 상대 경로 glob (예: 'application.*', '*.java')")
+    parser.add_argument("--group", action="append", choices=groups,
+                        help="지표 분류의 모든 지표로 질의 (예: orm, service)")
+    parser.add_argument("--count", action="store_true", help="파일 목록 대신 개수만 출력")
+    parser.add_argument("--cache-dir", help="인덱스 위치 (기본: <repo_path>/.kdt-cache)")
+    parser.add_argument("--max-depth", type=int, help="순회할 최대 디렉토리 깊이")
+    parser.add_argument("--no-update", action="store_true", help="다시 색인하지 않고 기존 인덱스로 질의")
+    args = parser.parse_args()
+    if not args.text and not args.group:
+        parser.error("give a search text or --group")
+
+    analyzer = ApplicationAnalyzer(args.repo_path, cache_dir=args.cache_dir,
+                                   max_depth=args.max_depth, content_index=True)
+    if args.no_update:
+        index = ContentIndex(analyzer.cache_dir)
+    else:
+        index = analyzer.update_content_index()
+        print(f"🗂️ Indexed {index.stats['indexed']} file(s), reused {index.stats['reused']}, "
+              f"removed {index.stats['removed']}", file=sys.stderr)
+    root = os.path.abspath(args.repo_path)
+
+    queries = []
+    if args.text:
+        queries.append((args.text, args.text, args.ignore_case))
+    for indicator in INDICATORS:
+        if args.group and indicator.group in args.group:
+            queries.append((f"{indicator.group}:{indicator.label} ({indicator.literal})",
+                            indicator.literal, indicator.ignore_case))
+
+    try:
+        for title, literal, ignore_case in queries:
+            paths = index.search(root, literal, ignore_case, args.glob)
+            if len(queries) > 1 or args.count:
+                print(f"{title}: {len(paths)}")
+            if not args.count:
+                for path in paths:
+                    print(f"  {path}" if len(queries) > 1 else path)
+    finally:
+        index.close()
+        analyzer.close()
+
+
+if __name__ == "__main__":
+    main()
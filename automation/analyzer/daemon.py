@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Analyzer Daemon
+저장소별 ApplicationAnalyzer(파일 인덱스, 내용 캐시, 분석 결과)를 메모리에 유지하며
+Unix 도메인 소켓으로 analyze/summary/generate 요청을 처리하는 상주 프로세스와 클라이언트
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional
+
+try:
+    from .code_analyzer import ApplicationAnalyzer, DEFAULT_MAX_FILE_SIZE
+    from .result_model import AnalysisResult
+except ImportError:
+    from code_analyzer import ApplicationAnalyzer, DEFAULT_MAX_FILE_SIZE
+    from result_model import AnalysisResult
+
+# 기본 소켓 위치 (사용자별)
+DEFAULT_SOCKET = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or "/tmp", f"kdt-analyzer-{os.getuid()}.sock")
+
+# 메모리에 유지할 최대 저장소 세션 수 (가장 오래 사용하지 않은 세션부터 정리)
+MAX_SESSIONS = 16
+
+# 세션을 구분하는 분석 옵션 (옵션이 다르면 별도 세션)
+SESSION_OPTIONS = ("ref", "max_depth", "max_file_size", "budget_seconds", "budget_bytes", "incremental")
+
+# generate 요청 기본 대상
+GENERATE_TARGETS = ("terraform", "k8s")
+
+# generator 패키지 위치 (automation/)
+AUTOMATION_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def generate_infrastructure(analysis_result: Mapping, output_dir: str, config: Dict,
+                            targets=GENERATE_TARGETS) -> Dict:
+    """분석 결과(dict 또는 지연 결과)로 Terraform/K8s 파일 생성 (output_dir/terraform, output_dir/k8s)"""
+    # generator 패키지는 automation/ 기준으로 import (상주 프로세스이므로 경로는 한 번만 추가)
+    if AUTOMATION_DIR not in sys.path:
+        sys.path.append(AUTOMATION_DIR)
+    from generator.terraform_generator import TerraformGenerator
+    from generator.k8s_generator import KubernetesGenerator
+
+    files = {}
+    if "terraform" in targets:
+        files["terraform"] = TerraformGenerator(analysis_result, config).generate_all(
+            os.path.join(output_dir, "terraform"))
+    if "k8s" in targets:
+        files["k8s"] = KubernetesGenerator(analysis_result, config).generate_all(
+            os.path.join(output_dir, "k8s"))
+    return files
+
+
+class RepoSession:
+    """저장소 하나에 대한 상주 분석기 (같은 저장소 요청은 순서대로 처리)"""
+
+    def __init__(self, repo_path: str, options: Dict):
+        self.analyzer = ApplicationAnalyzer(
+            repo_path,
+            incremental=options.get("incremental", True),
+            max_depth=options.get("max_depth"),
+            max_file_size=options.get("max_file_size", DEFAULT_MAX_FILE_SIZE),
+            ref=options.get("ref"),
+            budget_seconds=options.get("budget_seconds"),
+            budget_bytes=options.get("budget_bytes"))
+        self.lock = threading.Lock()
+        # 전체 분석 결과 (slots 모델로 보관, 분석기의 dict는 비움)와 generate가 계산한 지연 결과 (둘 중 하나만 유지)
+        self.result: Optional[AnalysisResult] = None
+        self.lazy = None
+        self.analyses = 0
+        self.reuses = 0
+
+    def analyze(self) -> Dict:
+        """트리가 마지막 분석과 같으면 (디렉토리/파일 stat만 확인) 메모리의 결과를 그대로 반환"""
+        with self.lock:
+            return self._analyze().to_dict()
+
+    def _current(self, held) -> bool:
+        return held is not None and self.analyzer.is_current(lazy=True)
+
+    def _analyze(self) -> AnalysisResult:
+        if self._current(self.result):
+            self.reuses += 1
+        else:
+            self.analyzer.analyze()
+            self.analyses += 1
+            self.result = AnalysisResult.from_dict(self.analyzer.take_result())
+            self.lazy = None
+        return self.result
+
+    def summary(self) -> str:
+        """분석 요약 (같은 세션의 다른 요청이 결과를 바꾸지 않도록 잠금 안에서 생성)"""
+        with self.lock:
+            return self.analyzer.generate_summary(self._analyze().to_dict())
+
+    def generate(self, output_dir: str, config: Dict, targets=GENERATE_TARGETS) -> Dict:
+        """Terraform/K8s 파일 생성 (트리가 그대로면 메모리의 결과, 아니면 생성기가 읽는 필드만 지연 계산)
+
+        지연 결과는 세션에 남겨 두므로 트리가 그대로인 동안 다음 generate는 계산된 필드를 그대로 사용한다.
+        """
+        with self.lock:
+            if self._current(self.result):
+                self.reuses += 1
+                result = self.result.to_dict()
+            elif self._current(self.lazy):
+                self.reuses += 1
+                result = self.lazy
+            else:
+                # 생성기는 environment/dependencies/build_config를 읽지 않으므로 해당 감지기는 실행되지 않음
+                self.analyses += 1
+                result = self.lazy = self.analyzer.lazy_result()
+                self.result = None
+            try:
+                return generate_infrastructure(result, output_dir, config, targets)
+            finally:
+                # git blob 리더 등은 다음 읽기에서 다시 열림
+                self.analyzer.close()
+
+    def close(self):
+        with self.lock:
+            self.analyzer.close()
+
+
+class AnalyzerService:
+    """요청 처리기 (세션 관리와 명령 실행)"""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self.sessions: "OrderedDict[tuple, RepoSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def session(self, repo_path: str, options: Dict) -> RepoSession:
+        key = (os.path.abspath(repo_path),) + tuple(options.get(name) for name in SESSION_OPTIONS)
+        with self._lock:
+            session = self.sessions.get(key)
+            if session is None:
+                if not os.path.isdir(key[0]):
+                    raise FileNotFoundError(f"Repository not found: {repo_path}")
+                session = self.sessions[key] = RepoSession(key[0], options)
+                while len(self.sessions) > self.max_sessions:
+                    _, evicted = self.sessions.popitem(last=False)
+                    evicted.close()
+            self.sessions.move_to_end(key)
+            return session
+
+    def handle(self, request: Dict) -> Dict:
+        """요청 하나 처리: {"command": ..., "repo": ..., "options": {...}}"""
+        command = request.get("command")
+        start = time.perf_counter()
+        if command == "ping":
+            result = {"pid": os.getpid(), "sessions": len(self.sessions),
+                      "uptime_s": round(time.time() - self.started, 1)}
+        elif command == "stats":
+            result = [{"repo": key[0], "ref": key[1], "analyses": s.analyses, "reuses": s.reuses}
+                      for key, s in self.sessions.items()]
+        elif command == "analyze":
+            result = self._session(request).analyze()
+        elif command == "summary":
+            result = self._session(request).summary()
+        elif command == "generate":
+            result = self._generate(request)
+        else:
+            raise ValueError(f"Unknown command: {command}")
+        return {"ok": True, "result": result, "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    def _session(self, request: Dict) -> RepoSession:
+        if not request.get("repo"):
+            raise ValueError("'repo' is required")
+        return self.session(request["repo"], request.get("options") or {})
+
+    def _generate(self, request: Dict) -> Dict:
+        return self._session(request).generate(request.get("output_dir") or ".",
+                                               request.get("config") or {},
+                                               request.get("targets") or GENERATE_TARGETS)
+
+    def close(self):
+        with self._lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """연결당 여러 요청 처리 (요청/응답 모두 한 줄 JSON)"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                shutdown = request.get("command") == "shutdown"
+                response = {"ok": True, "result": "shutting down"} if shutdown else self.server.service.handle(request)
+            except Exception as e:
+                shutdown = False
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if shutdown:
+                # 응답을 보낸 뒤에 종료 (shutdown()은 serve_forever 루프가 끝날 때까지 기다리므로 별도 스레드)
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class AnalyzerDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix 도메인 소켓 서버 (연결마다 스레드)"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, max_sessions: int = MAX_SESSIONS):
+        self.socket_path = socket_path
+        self.service = AnalyzerService(max_sessions)
+        # 이전 데몬이 남긴 소켓 파일 정리 (응답하는 데몬이 있으면 중복 실행하지 않음)
+        if os.path.exists(socket_path):
+            if ping(socket_path):
+                raise RuntimeError(f"Analyzer daemon already running on {socket_path}")
+            os.unlink(socket_path)
+        super().__init__(socket_path, _RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        self.service.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class AnalyzerClient:
+    """데몬 클라이언트 (연결 하나로 여러 요청 전송)"""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: Optional[float] = None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path)
+        self.reader = self.sock.makefile("rb")
+
+    def request(self, command: str, **params) -> Dict:
+        """요청 전송 후 응답 결과 반환 (데몬 쪽 오류는 RuntimeError)"""
+        self.sock.sendall(json.dumps({"command": command, **params}).encode() + b"\n")
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Analyzer daemon closed the connection")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self) -> "AnalyzerClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def ping(socket_path: str = DEFAULT_SOCKET) -> bool:
+    """데몬 응답 여부"""
+    try:
+        with AnalyzerClient(socket_path, timeout=1.0) as client:
+            return client.request("ping")["ok"]
+    except (OSError, RuntimeError, ValueError):
+        return False
+
+
+def main():
+    """메인 실행 함수 (serve: 데몬 실행, 그 외: 클라이언트 요청)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Application analyzer daemon and client")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"Unix 소켓 경로 (기본: {DEFAULT_SOCKET})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="데몬 실행 (포그라운드)")
+    serve_parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS,
+                              help="메모리에 유지할 최대 저장소 수")
+
+    for name, help_text in (("analyze", "분석 결과 JSON 출력"), ("summary", "분석 요약 출력"),
+                            ("generate", "Terraform/K8s 파일 생성")):
+        command_parser = subparsers.add_parser(name, help=help_text)
+        command_parser.add_argument("repo_path", help="분석할 저장소 경로")
+        command_parser.add_argument("--ref", help="작업 트리 대신 분석할 git 커밋/브랜치")
+        command_parser.add_argument("--no-cache", action="store_true", help="영구 분석 캐시 사용 안 함")
+        command_parser.add_argument("--max-depth", type=int, help="순회할 최대 디렉토리 깊이")
+        if name == "generate":
+            command_parser.add_argument("--output-dir", default=".", help="생성 위치 (terraform/, k8s/)")
+            command_parser.add_argument("--config", help="생성기 설정 JSON 파일 (PROJECT_NAME, ECR_IMAGE_URI ...)")
+            command_parser.add_argument("--targets", nargs="+", choices=GENERATE_TARGETS,
+                                        default=list(GENERATE_TARGETS))
+
+    subparsers.add_parser("ping", help="데몬 상태 확인")
+    subparsers.add_parser("stats", help="저장소 세션별 분석/재사용 횟수")
+    subparsers.add_parser("stop", help="데몬 종료")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        server = AnalyzerDaemon(args.socket, args.max_sessions)
+        print(f"🛰️ Analyzer daemon listening on {args.socket} (pid {os.getpid()})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        print("👋 Analyzer daemon stopped")
+        return
+
+    params = {}
+    if args.command in ("analyze", "summary", "generate"):
+        params = {"repo": os.path.abspath(args.repo_path),
+                  "options": {"ref": args.ref, "max_depth": args.max_depth, "incremental": not args.no_cache}}
+    if args.command == "generate":
+        config = {}
+        if args.config:
+            with open(args.config) as f:
+                config = json.load(f)
+        params.update({"output_dir": os.path.abspath(args.output_dir), "config": config,
+                       "targets": args.targets})
+
+    try:
+        with AnalyzerClient(args.socket) as client:
+            response = client.request("shutdown" if args.command == "stop" else args.command, **params)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ Analyzer daemon is not running on {args.socket}", file=sys.stderr)
+        sys.exit(2)
+    except (ConnectionError, EOFError):
+        if args.command != "stop":
+            raise
+        # 응답 전에 데몬이 연결을 닫았어도 종료 요청은 처리된 것
+        response = {"result": "shutting down"}
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    result = response["result"]
+    if isinstance(result, str):
+        print(result)
+    else:
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
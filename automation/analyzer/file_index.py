@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Repository File Index
+저장소를 한 번만 순회하여 확장자/파일명별 파일 인덱스를 구축
+(파일 메타데이터는 열 단위 배열에 저장하여 파일 수가 많아도 파일당 수십 바이트만 사용)
+"""
+
+import fnmatch
+import os
+import re
+from array import array
+from bisect import bisect_right
+from stat import S_ISDIR, S_ISREG
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from .ignore_rules import IgnoreMatcher, load_ignore_file
+    from .streaming import read_file_bytes
+except ImportError:
+    from ignore_rules import IgnoreMatcher, load_ignore_file
+    from streaming import read_file_bytes
+
+# 하위로 내려가지 않는 디렉토리 (VCS, 의존성, 빌드 산출물, 분석 캐시)
+DEFAULT_PRUNED_DIRS = frozenset({
+    ".git", ".hg", ".svn",
+    "node_modules", "bower_components",
+    "target", "dist", "build", "out", ".gradle", ".next", ".nuxt",
+    "__pycache__", ".venv", "venv", ".tox", ".mypy_cache", ".pytest_cache",
+    ".idea", ".vscode",
+    ".kdt-cache"
+})
+
+# 저장소 루트에서 읽는 ignore 파일
+GITIGNORE_NAME = ".gitignore"
+DOCKERIGNORE_NAME = ".dockerignore"
+
+# git blob SHA-1 바이너리 길이
+BLOB_SHA_BYTES = 20
+
+
+class FileEntry(NamedTuple):
+    """인덱스에서 조회한 파일 메타데이터 (조회할 때 열 저장소에서 만듦)"""
+    rel_path: str   # 저장소 루트 기준 상대 경로 (POSIX 구분자)
+    path: str       # 절대 경로
+    size: int
+    mtime: float
+    blob_sha: Optional[str] = None  # git 커밋에서 읽은 경우 blob SHA
+
+    @property
+    def name(self) -> str:
+        return self.rel_path.rsplit("/", 1)[-1]
+
+    @property
+    def suffix(self) -> str:
+        return os.path.splitext(self.name)[1]
+
+
+def _name_regex(pattern: str) -> Optional["re.Pattern"]:
+    """fnmatch 파일명 패턴을 NUL로 구분된 이름 버퍼 검색용 정규식으로 변환 (*만 지원, ?/[...]는 None)"""
+    if "?" in pattern or "[" in pattern:
+        return None
+    body = b"[^\0]*".join(re.escape(part.encode("utf-8", "surrogateescape")) for part in pattern.split("*"))
+    # 버퍼 시작 또는 NUL 바로 뒤에서 시작하여 NUL 바로 앞에서 끝나는 이름 하나
+    return re.compile(b"(?<![^\0])" + body + b"\0")
+
+
+class FileColumns:
+    """파일 메타데이터 열 저장소 (상대 경로 정렬 순서)
+
+    디렉토리와 확장자는 테이블에 한 번만 저장하고 파일별로는 번호만 가지며, 파일명은
+    NUL로 구분하여 하나의 바이트 버퍼에 이어 붙인다. 크기/mtime/번호는 array 열이므로
+    FileEntry 튜플과 경로 문자열을 파일마다 유지할 때보다 메모리가 한 자릿수 작다.
+    """
+
+    def __init__(self):
+        self.dirs: List[str] = []             # 디렉토리 상대 경로 ("/"로 끝남, 루트는 "")
+        self.exts: List[str] = []             # 확장자 (".java", 없으면 "")
+        self._dir_ids: Dict[str, int] = {}
+        self._ext_ids: Dict[str, int] = {}
+        self.dir_col = array("I")
+        self.ext_col = array("I")
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.names = bytearray()              # 파일명 + NUL
+        self.name_offsets = array("Q", [0])   # 파일별 이름 시작 위치 (마지막은 버퍼 끝)
+        self.blobs = bytearray()              # git blob SHA (파일당 20바이트, 작업 트리 인덱스는 비어 있음)
+        self._by_ext: Dict[int, array] = {}
+
+    def append(self, rel_dir: str, name: str, size: int, mtime: float, blob_sha: Optional[str] = None):
+        """파일 하나 추가 (상대 경로 순서대로 추가해야 하며, 아니면 sorted() 필요)"""
+        dir_id = self._dir_ids.get(rel_dir)
+        if dir_id is None:
+            dir_id = self._dir_ids[rel_dir] = len(self.dirs)
+            self.dirs.append(rel_dir)
+        ext = os.path.splitext(name)[1]
+        ext_id = self._ext_ids.get(ext)
+        if ext_id is None:
+            ext_id = self._ext_ids[ext] = len(self.exts)
+            self.exts.append(ext)
+
+        self.dir_col.append(dir_id)
+        self.ext_col.append(ext_id)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+        self.names += name.encode("utf-8", "surrogateescape")
+        self.names.append(0)
+        self.name_offsets.append(len(self.names))
+        if blob_sha:
+            self.blobs += bytes.fromhex(blob_sha)
+        if self._by_ext:
+            self._by_ext = {}
+
+    def append_path(self, rel_path: str, size: int, mtime: float, blob_sha: Optional[str] = None):
+        rel_dir, _, name = rel_path.rpartition("/")
+        self.append(f"{rel_dir}/" if rel_dir else "", name, size, mtime, blob_sha)
+
+    def append_row(self, other: "FileColumns", i: int, rel_dir: Optional[str] = None):
+        """다른 열 저장소의 i번째 파일 복사 (rel_dir를 주면 디렉토리 변경)"""
+        self.append(other.dirs[other.dir_col[i]] if rel_dir is None else rel_dir,
+                    other.name(i), other.sizes[i], other.mtimes[i], other.blob_sha(i))
+
+    def __len__(self) -> int:
+        return len(self.dir_col)
+
+    def name(self, i: int) -> str:
+        return self.names[self.name_offsets[i]:self.name_offsets[i + 1] - 1].decode("utf-8", "surrogateescape")
+
+    def rel_path(self, i: int) -> str:
+        return self.dirs[self.dir_col[i]] + self.name(i)
+
+    def blob_sha(self, i: int) -> Optional[str]:
+        if not self.blobs:
+            return None
+        return self.blobs[i * BLOB_SHA_BYTES:(i + 1) * BLOB_SHA_BYTES].hex()
+
+    def entry(self, i: int, root: str) -> FileEntry:
+        rel_path = self.rel_path(i)
+        return FileEntry(rel_path, os.path.join(root, rel_path), self.sizes[i], self.mtimes[i], self.blob_sha(i))
+
+    def lower_bound(self, rel_path: str) -> int:
+        """rel_path 이상인 첫 파일 위치 (이진 탐색)"""
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.rel_path(mid) < rel_path:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, rel_path: str) -> Optional[int]:
+        i = self.lower_bound(rel_path)
+        return i if i < len(self) and self.rel_path(i) == rel_path else None
+
+    def is_sorted(self) -> bool:
+        previous = None
+        for i in range(len(self)):
+            rel_path = self.rel_path(i)
+            if previous is not None and rel_path < previous:
+                return False
+            previous = rel_path
+        return True
+
+    def sorted(self) -> "FileColumns":
+        """상대 경로 순서로 정렬한 새 열 저장소 (순회 순서가 정렬 순서가 아닌 경우)"""
+        result = FileColumns()
+        for i in sorted(range(len(self)), key=self.rel_path):
+            result.append_row(self, i)
+        return result
+
+    def merged(self, changes: Dict[str, Optional[Tuple[int, float]]]) -> "FileColumns":
+        """변경(상대 경로 -> (크기, mtime), 삭제는 None)을 반영한 새 열 저장소 (정렬 순서 유지)"""
+        added = sorted(rel_path for rel_path, stat in changes.items() if stat is not None)
+        result = FileColumns()
+        j = 0
+        for i in range(len(self)):
+            rel_path = self.rel_path(i)
+            while j < len(added) and added[j] < rel_path:
+                result.append_path(added[j], *changes[added[j]])
+                j += 1
+            if rel_path not in changes:
+                result.append_row(self, i)
+        for rel_path in added[j:]:
+            result.append_path(rel_path, *changes[rel_path])
+        return result
+
+    def with_ext(self, ext: str) -> array:
+        """확장자별 파일 위치 (확장자별로 처음 조회할 때 계산)"""
+        ext_id = self._ext_ids.get(ext)
+        if ext_id is None:
+            return array("I")
+        positions = self._by_ext.get(ext_id)
+        if positions is None:
+            if numpy is not None:
+                column = numpy.frombuffer(self.ext_col, dtype=numpy.uint32)
+                positions = array("I", numpy.flatnonzero(column == ext_id).astype(numpy.uint32).tobytes())
+            else:
+                positions = array("I", (i for i, value in enumerate(self.ext_col) if value == ext_id))
+            self._by_ext[ext_id] = positions
+        return positions
+
+    def named(self, pattern: str) -> List[int]:
+        """파일명 패턴(fnmatch)에 맞는 파일 위치 (이름 버퍼를 정규식으로 한 번 검색)"""
+        regex = _name_regex(pattern)
+        if regex is None:
+            return [i for i in range(len(self)) if fnmatch.fnmatchcase(self.name(i), pattern)]
+        return [bisect_right(self.name_offsets, match.start()) - 1 for match in regex.finditer(self.names)]
+
+    def ext_totals(self) -> Dict[str, Tuple[int, int]]:
+        """확장자별 (파일 수, 총 크기)"""
+        if numpy is not None and len(self):
+            column = numpy.frombuffer(self.ext_col, dtype=numpy.uint32)
+            counts = numpy.bincount(column, minlength=len(self.exts))
+            sizes = numpy.bincount(column, weights=numpy.frombuffer(self.sizes, dtype=numpy.int64),
+                                   minlength=len(self.exts))
+            return {ext: (int(counts[i]), int(sizes[i])) for i, ext in enumerate(self.exts) if counts[i]}
+
+        counts = [0] * len(self.exts)
+        sizes = [0] * len(self.exts)
+        for ext_id, size in zip(self.ext_col, self.sizes):
+            counts[ext_id] += 1
+            sizes[ext_id] += size
+        return {ext: (counts[i], sizes[i]) for i, ext in enumerate(self.exts) if counts[i]}
+
+    def nbytes(self) -> int:
+        """열 버퍼 크기 (디렉토리/확장자 테이블 제외)"""
+        columns = (self.dir_col, self.ext_col, self.sizes, self.mtimes, self.name_offsets)
+        return (sum(column.itemsize * len(column) for column in columns)
+                + len(self.names) + len(self.blobs))
+
+
+class FileIndex:
+    """os.scandir 기반 단일 순회 파일 인덱스"""
+
+    def __init__(self, root: str, max_depth: Optional[int] = None,
+                 pruned_dirs: Iterable[str] = DEFAULT_PRUNED_DIRS,
+                 use_ignore_files: bool = True):
+        self.root = os.path.abspath(str(root))
+        self.max_depth = max_depth
+        self.pruned_dirs = frozenset(pruned_dirs)
+        self.use_ignore_files = use_ignore_files
+        self.columns = FileColumns()
+        self.stats: Dict[str, int] = {}
+
+        # 순회한 디렉토리별 mtime (파일 추가/삭제/이름 변경 감지용)과 ignore 규칙 (증분 갱신용)
+        self.dir_mtimes: Dict[str, float] = {}
+        self._matchers: Dict[str, IgnoreMatcher] = {}
+
+    def build(self) -> "FileIndex":
+        """저장소 전체를 한 번 순회하여 인덱스 구축
+
+        제외 대상 디렉토리는 하위로 내려가지 않고 건너뛴다. 디렉토리마다 항목을 정렬하여
+        깊이 우선으로 순회하므로 파일은 상대 경로 정렬 순서대로 수집된다.
+        """
+        columns = FileColumns()
+        stats = {"pruned_dirs": 0, "ignored_files": 0, "depth_limited_dirs": 0}
+        try:
+            dir_mtimes = {self.root: os.stat(self.root).st_mtime}
+        except OSError:
+            dir_mtimes = {}
+        matchers = {}
+
+        matcher = IgnoreMatcher()
+        if self.use_ignore_files:
+            # .dockerignore 패턴은 항상 루트 기준
+            matcher = matcher.child("", load_ignore_file(
+                os.path.join(self.root, DOCKERIGNORE_NAME), always_anchored=True))
+
+        stack = [self._children(self.root, "", 0, matcher, matchers)]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            rel_dir, depth, matcher, entry = item
+            rel_path = f"{rel_dir}{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in self.pruned_dirs or matcher.is_ignored(rel_path, True):
+                        stats["pruned_dirs"] += 1
+                    elif self.max_depth is not None and depth >= self.max_depth:
+                        stats["depth_limited_dirs"] += 1
+                    else:
+                        dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+                        stack.append(self._children(entry.path, rel_path + "/", depth + 1, matcher, matchers))
+                elif entry.is_file():
+                    if matcher.is_ignored(rel_path, False):
+                        stats["ignored_files"] += 1
+                        continue
+                    stat = entry.stat()
+                    columns.append(rel_dir, entry.name, stat.st_size, stat.st_mtime)
+            except OSError:
+                continue
+
+        self._set_columns(columns, stats)
+        self.dir_mtimes = dir_mtimes
+        self._matchers = matchers
+        return self
+
+    def _children(self, dir_path: str, rel_dir: str, depth: int, matcher: IgnoreMatcher,
+                  matchers: Dict[str, IgnoreMatcher]) -> Iterator[tuple]:
+        """디렉토리 항목을 전체 상대 경로 정렬 순서로 (하위 디렉토리는 이름 + "/" 기준, git 트리 순서와 같음)"""
+        try:
+            with os.scandir(dir_path) as it:
+                dir_entries = list(it)
+        except OSError:
+            return iter(())
+
+        # 디렉토리별 .gitignore는 해당 디렉토리 기준으로 적용
+        if self.use_ignore_files and any(e.name == GITIGNORE_NAME for e in dir_entries):
+            matcher = matcher.child(rel_dir, load_ignore_file(
+                os.path.join(dir_path, GITIGNORE_NAME)))
+        matchers[rel_dir] = matcher
+
+        def sort_key(entry: os.DirEntry) -> str:
+            try:
+                return entry.name + "/" if entry.is_dir(follow_symlinks=False) else entry.name
+            except OSError:
+                return entry.name
+
+        dir_entries.sort(key=sort_key)
+        return ((rel_dir, depth, matcher, entry) for entry in dir_entries)
+
+    def update(self, rel_paths: Iterable[str]) -> bool:
+        """변경된 파일 경로만 다시 stat하여 인덱스 갱신 (다시 순회하지 않음)
+
+        제외 디렉토리 하위 경로는 무시한다. 새 디렉토리, 디렉토리 삭제, ignore 파일 변경처럼
+        순회 범위가 바뀌는 경우는 갱신하지 않고 False를 반환하므로 build()로 다시 구축해야 한다.
+        """
+        if not self._matchers:
+            return False
+
+        # 상대 경로 -> (크기, mtime), 인덱스에서 빠지는 파일은 None
+        changes: Dict[str, Optional[Tuple[int, float]]] = {}
+        touched_dirs = set()
+        for rel_path in rel_paths:
+            parts = rel_path.split("/")
+            if any(part in self.pruned_dirs for part in parts[:-1]):
+                continue
+            if parts[-1] in (GITIGNORE_NAME, DOCKERIGNORE_NAME):
+                return False
+            rel_dir = rel_path[:len(rel_path) - len(parts[-1])]
+            matcher = self._matchers.get(rel_dir)
+            if matcher is None:
+                return False
+
+            path = os.path.join(self.root, rel_path)
+            touched_dirs.add(os.path.dirname(path))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # 삭제된 디렉토리면 하위 파일까지 정리해야 하므로 다시 구축
+                if os.path.join(self.root, rel_path) in self.dir_mtimes:
+                    return False
+                changes[rel_path] = None
+                continue
+            if S_ISDIR(stat.st_mode):
+                if parts[-1] in self.pruned_dirs:
+                    continue
+                return False
+            if not S_ISREG(stat.st_mode) or matcher.is_ignored(rel_path, False):
+                changes[rel_path] = None
+                continue
+            changes[rel_path] = (stat.st_size, stat.st_mtime)
+
+        self._set_columns(self.columns.merged(changes),
+                          {key: value for key, value in self.stats.items() if key not in ("files", "index_bytes")})
+        for dir_path in touched_dirs:
+            try:
+                self.dir_mtimes[dir_path] = os.stat(dir_path).st_mtime
+            except OSError:
+                return False
+        return True
+
+    def is_current(self) -> bool:
+        """마지막 구축 이후 트리가 그대로인지 (디렉토리 mtime과 파일 크기/mtime만 다시 확인, 순회 없음)
+
+        파일 추가/삭제/이름 변경은 상위 디렉토리 mtime을, 내용 수정은 파일 mtime을 바꾼다.
+        """
+        if not self.dir_mtimes:
+            return False
+        columns = self.columns
+        try:
+            for path, mtime in self.dir_mtimes.items():
+                if os.stat(path).st_mtime != mtime:
+                    return False
+            for i in range(len(columns)):
+                stat = os.stat(os.path.join(self.root, columns.rel_path(i)))
+                if stat.st_size != columns.sizes[i] or stat.st_mtime != columns.mtimes[i]:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    def _set_columns(self, columns: FileColumns, stats: Dict[str, int]):
+        """수집한 열 저장소로 인덱스 교체"""
+        self.columns = columns
+        self.stats = {"files": len(columns), **stats, "index_bytes": columns.nbytes()}
+
+    def _set_entries(self, entries: Iterable[FileEntry], stats: Dict[str, int]):
+        """FileEntry 목록으로 인덱스 구성 (순회 순서와 무관하게 결과가 동일하도록 정렬)"""
+        columns = FileColumns()
+        for entry in sorted(entries, key=lambda e: e.rel_path):
+            columns.append_path(entry.rel_path, entry.size, entry.mtime, entry.blob_sha)
+        self._set_columns(columns, stats)
+
+    def read_bytes(self, entry: FileEntry) -> bytes:
+        """파일 내용 읽기 (바이너리 파일이면 BinaryFileError)"""
+        return read_file_bytes(entry.path)
+
+    def open(self, entry: FileEntry) -> BinaryIO:
+        """파일 내용 스트림 (스트리밍 파서용)"""
+        return open(entry.path, "rb")
+
+    def close(self):
+        """인덱스가 사용하는 외부 자원 정리"""
+        pass
+
+    def subtree(self, rel_dir: str, exclude: Iterable[str] = ()) -> "FileIndex":
+        """rel_dir 하위 파일만 rel_dir 기준 상대 경로로 담은 인덱스 (다시 순회하지 않음)
+
+        exclude에 있는 하위 디렉토리(중첩된 다른 서비스 등)는 제외한다.
+        """
+        return SubtreeIndex(self, rel_dir, exclude)
+
+    def _entries(self, positions: Iterable[int]) -> List[FileEntry]:
+        return [self.columns.entry(i, self.root) for i in positions]
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        columns = self.columns
+        return (columns.entry(i, self.root) for i in range(len(columns)))
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def get(self, rel_path: str) -> Optional[FileEntry]:
+        """상대 경로로 파일 조회"""
+        i = self.columns.find(rel_path)
+        return None if i is None else self.columns.entry(i, self.root)
+
+    def exists(self, rel_path: str) -> bool:
+        """파일 존재 여부"""
+        return self.columns.find(rel_path) is not None
+
+    def count_with_ext(self, *exts: str) -> int:
+        """확장자별 파일 수 (FileEntry를 만들지 않음)"""
+        return sum(len(self.columns.with_ext(ext)) for ext in set(exts))
+
+    def ext_totals(self) -> Dict[str, Tuple[int, int]]:
+        """확장자별 (파일 수, 총 크기)"""
+        return self.columns.ext_totals()
+
+    def files_with_ext(self, *exts: str) -> List[FileEntry]:
+        """확장자별 파일 목록 (예: ".java", ".py")"""
+        if len(exts) == 1:
+            return self._entries(self.columns.with_ext(exts[0]))
+
+        positions = set()
+        for ext in exts:
+            positions.update(self.columns.with_ext(ext))
+        return self._entries(sorted(positions))
+
+    def files_named(self, pattern: str) -> List[FileEntry]:
+        """파일명 패턴(fnmatch)에 맞는 파일 목록 (예: "application.*")"""
+        return self._entries(self.columns.named(pattern))
+
+
+class SubtreeIndex(FileIndex):
+    """상위 인덱스의 일부를 재사용하는 하위 디렉토리 인덱스 (파일 읽기와 자원은 상위 인덱스가 관리)"""
+
+    def __init__(self, parent: FileIndex, rel_dir: str, exclude: Iterable[str] = ()):
+        rel_dir = rel_dir.strip("/")
+        super().__init__(os.path.join(parent.root, rel_dir) if rel_dir else parent.root,
+                         max_depth=parent.max_depth, pruned_dirs=parent.pruned_dirs,
+                         use_ignore_files=False)
+        self.parent = parent
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        excluded = tuple(f"{d.strip('/')}/" for d in exclude)
+
+        # 정렬된 상위 인덱스에서 prefix로 시작하는 파일은 연속 구간 ("svc/" ~ "svc0" 직전)
+        source = parent.columns
+        start, end = 0, len(source)
+        if prefix:
+            start = source.lower_bound(prefix)
+            end = source.lower_bound(prefix[:-1] + chr(ord("/") + 1))
+
+        columns = FileColumns()
+        for i in range(start, end):
+            # exclude는 상위 인덱스 기준 경로 (파일명에는 "/"가 없으므로 디렉토리만 비교)
+            parent_dir = source.dirs[source.dir_col[i]]
+            if not parent_dir.startswith(excluded):
+                columns.append_row(source, i, parent_dir[len(prefix):])
+        self._set_columns(columns, {"pruned_dirs": 0, "ignored_files": 0, "depth_limited_dirs": 0})
+
+    def build(self) -> "SubtreeIndex":
+        return self
+
+    def is_current(self) -> bool:
+        return self.parent.is_current()
+
+    def read_bytes(self, entry: FileEntry) -> bytes:
+        return self.parent.read_bytes(entry)
+
+    def open(self, entry: FileEntry) -> BinaryIO:
+        return self.parent.open(entry)
+
+    def close(self):
+        # 상위 인덱스의 자원은 상위 인덱스 소유자가 정리
+        pass
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Git Commit Source
+체크아웃 없이 로컬 .git 오브젝트 데이터베이스에서 커밋 트리를 읽어 분석하는 파일 인덱스
+"""
+
+import io
+import subprocess
+import threading
+from typing import BinaryIO, Optional
+
+try:
+    from .file_index import FileColumns, FileIndex, FileEntry, DEFAULT_PRUNED_DIRS
+    from .streaming import BinaryFileError, looks_binary
+except ImportError:
+    from file_index import FileColumns, FileIndex, FileEntry, DEFAULT_PRUNED_DIRS
+    from streaming import BinaryFileError, looks_binary
+
+
+class GitBlobReader:
+    """git cat-file --batch 프로세스 하나로 blob 내용을 스트리밍"""
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._process = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._process = subprocess.Popen(
+            ["git", "-C", self.repo_path, "cat-file", "--batch"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    def read(self, blob_sha: str) -> bytes:
+        """blob SHA로 내용 읽기"""
+        with self._lock:
+            if self._process is None:
+                self._start()
+
+            self._process.stdin.write(f"{blob_sha}\n".encode())
+            self._process.stdin.flush()
+
+            header = self._process.stdout.readline().decode().split()
+            if len(header) != 3:
+                raise FileNotFoundError(f"git object not found: {blob_sha}")
+
+            size = int(header[2])
+            data = self._process.stdout.read(size)
+            self._process.stdout.read(1)  # 내용 뒤의 개행
+            return data
+
+    def close(self):
+        with self._lock:
+            if self._process is not None:
+                self._process.stdin.close()
+                self._process.wait()
+                self._process.stdout.close()
+                self._process = None
+
+
+class GitTreeIndex(FileIndex):
+    """git ls-tree 기반 커밋 트리 인덱스 (작업 트리 체크아웃 불필요)"""
+
+    def __init__(self, root: str, ref: str, max_depth: Optional[int] = None,
+                 pruned_dirs=DEFAULT_PRUNED_DIRS):
+        super().__init__(root, max_depth=max_depth, pruned_dirs=pruned_dirs,
+                         use_ignore_files=False)
+        self.ref = ref
+        self.reader = GitBlobReader(self.root)
+        self.commit = None
+
+    def build(self) -> "GitTreeIndex":
+        """커밋 트리 전체를 한 번에 나열하여 인덱스 구축
+
+        git 명령을 root에서 실행하므로 root 하위 경로만, root 기준 상대 경로로 나열된다.
+        """
+        # 브랜치/태그 ref가 나중에 움직였는지 확인할 수 있도록 커밋 SHA로 고정
+        self.commit = self._resolve()
+        output = subprocess.run(
+            ["git", "-C", self.root, "ls-tree", "-r", "-l", "-z", self.commit],
+            capture_output=True, check=True).stdout
+
+        columns = FileColumns()
+        stats = {"pruned_dirs": 0, "ignored_files": 0, "depth_limited_dirs": 0}
+        pruned = set()
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            meta, rel_path = record.split(b"\t", 1)
+            mode, obj_type, blob_sha, size = meta.split()
+            # 서브모듈(commit)과 심볼릭 링크는 제외
+            if obj_type != b"blob" or mode == b"120000":
+                continue
+
+            rel_path = rel_path.decode("utf-8", "surrogateescape")
+            parts = rel_path.split("/")
+            skipped_dir = next((("/".join(parts[:i + 1])) for i, part in enumerate(parts[:-1])
+                                if part in self.pruned_dirs), None)
+            if skipped_dir:
+                if skipped_dir not in pruned:
+                    pruned.add(skipped_dir)
+                    stats["pruned_dirs"] += 1
+                continue
+            if self.max_depth is not None and len(parts) - 1 > self.max_depth:
+                continue
+
+            columns.append_path(rel_path, int(size), 0.0, blob_sha.decode())
+
+        # ls-tree는 git 트리 순서(바이트 순서, 디렉토리는 이름 + "/")로 나열하므로 보통 이미 정렬되어 있음
+        self._set_columns(columns if columns.is_sorted() else columns.sorted(), stats)
+        return self
+
+    def _resolve(self) -> str:
+        return subprocess.run(
+            ["git", "-C", self.root, "rev-parse", "--verify", f"{self.ref}^{{commit}}"],
+            capture_output=True, text=True, check=True).stdout.strip()
+
+    def is_current(self) -> bool:
+        """ref가 여전히 같은 커밋을 가리키는지"""
+        try:
+            return self.commit is not None and self._resolve() == self.commit
+        except (OSError, subprocess.CalledProcessError):
+            return False
+
+    def read_bytes(self, entry: FileEntry) -> bytes:
+        """blob 내용 읽기 (바이너리 blob이면 BinaryFileError)"""
+        data = self.reader.read(entry.blob_sha)
+        if looks_binary(data):
+            raise BinaryFileError(entry.rel_path)
+        return data
+
+    def open(self, entry: FileEntry) -> BinaryIO:
+        """blob 내용 스트림 (cat-file은 blob을 한 번에 반환하므로 메모리에 읽은 뒤 감쌈)"""
+        return io.BytesIO(self.reader.read(entry.blob_sha))
+    
+    def close(self):
+        self.reader.close()
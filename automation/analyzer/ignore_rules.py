@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Ignore Rules
+.gitignore/.dockerignore 패턴을 해석하여 분석에서 제외할 파일/디렉토리를 판단
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+
+class IgnoreRule:
+    """ignore 파일의 패턴 한 줄"""
+
+    def __init__(self, pattern: str, negated: bool, dir_only: bool, anchored: bool):
+        self.pattern = pattern
+        self.negated = negated
+        self.dir_only = dir_only
+        self.regex = re.compile(_translate(pattern, anchored))
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.match(rel_path) is not None
+
+
+def _translate(pattern: str, anchored: bool) -> str:
+    """gitignore glob 패턴을 정규식으로 변환"""
+    regex = "" if anchored else "(?:.*/)?"
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        if c == "*":
+            regex += "[^/]*"
+        elif c == "?":
+            regex += "[^/]"
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(c)
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                regex += f"[{body}]"
+                i = end
+        elif c == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(c)
+        i += 1
+    # 디렉토리 패턴은 하위 경로 전체에도 적용
+    return regex + "(?:/.*)?$"
+
+
+def parse_ignore_lines(lines: List[str], always_anchored: bool = False) -> List[IgnoreRule]:
+    """ignore 파일 내용을 규칙 목록으로 변환
+
+    .dockerignore는 모든 패턴이 루트 기준이므로 always_anchored=True로 해석한다.
+    """
+    rules = []
+    for raw in lines:
+        line = raw.rstrip("\n").rstrip()
+        if not line or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+
+        # 중간에 '/'가 있거나 '/'로 시작하면 ignore 파일 위치 기준 경로
+        anchored = always_anchored or "/" in line
+        line = line.lstrip("/")
+        rules.append(IgnoreRule(line, negated, dir_only, anchored))
+    return rules
+
+
+def load_ignore_file(path: str, always_anchored: bool = False) -> List[IgnoreRule]:
+    """ignore 파일 읽기 (없거나 읽을 수 없으면 빈 목록)"""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return parse_ignore_lines(f.readlines(), always_anchored)
+    except OSError:
+        return []
+
+
+class IgnoreMatcher:
+    """상위 디렉토리들의 ignore 규칙을 누적하여 판단하는 매처"""
+
+    def __init__(self, layers: Optional[List[Tuple[str, List[IgnoreRule]]]] = None):
+        # (규칙 기준 디렉토리 상대 경로, 규칙 목록) - 바깥쪽부터 순서대로
+        self.layers = layers or []
+
+    def child(self, base_rel_dir: str, rules: List[IgnoreRule]) -> "IgnoreMatcher":
+        """하위 디렉토리의 규칙을 추가한 새 매처"""
+        if not rules:
+            return self
+        return IgnoreMatcher(self.layers + [(base_rel_dir, rules)])
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """마지막으로 일치한 규칙 기준으로 제외 여부 판단"""
+        ignored = False
+        for base, rules in self.layers:
+            if base:
+                if not rel_path.startswith(base):
+                    continue
+                path = rel_path[len(base):]
+            else:
+                path = rel_path
+            for rule in rules:
+                if rule.matches(path, is_dir):
+                    ignored = not rule.negated
+        return ignored
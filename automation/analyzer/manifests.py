@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Manifest Parsers
+pom.xml(iterparse), package.json, package-lock.json(증분 JSON)을 스트리밍으로 파싱하여 의존성 그래프 요약 추출
+"""
+
+import codecs
+import json
+import re
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 스트리밍 읽기 청크 크기
+CHUNK_SIZE = 64 * 1024
+
+# 파싱 결과 캐시 구분용 (파서 출력 형식이 바뀌면 올림)
+PARSER_VERSION = 1
+
+_PROPERTY_REF = re.compile(r"\$\{([^}]+)\}")
+
+
+def _local(tag: str) -> str:
+    """XML 네임스페이스 제거"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _coordinates(elem: ET.Element) -> Dict[str, str]:
+    """dependency/plugin/parent 요소의 groupId, artifactId, version, scope"""
+    coords = {}
+    for child in elem:
+        name = _local(child.tag)
+        if name in ("groupId", "artifactId", "version", "scope", "optional") and child.text:
+            coords[name] = child.text.strip()
+    return coords
+
+
+def parse_pom(stream: BinaryIO) -> Dict:
+    """pom.xml을 iterparse로 한 번 훑어 parent, properties, dependencies, plugins 추출
+
+    처리한 요소는 바로 비워서 큰 pom도 트리 전체를 메모리에 유지하지 않는다.
+    """
+    result = {
+        "parent": None,
+        "properties": {},
+        "dependencies": [],
+        "managed_dependencies": [],
+        "plugins": []
+    }
+    path = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            path.append(_local(elem.tag))
+            continue
+
+        location = tuple(path)
+        path.pop()
+        if location == ("project", "parent"):
+            result["parent"] = _coordinates(elem)
+        elif location[:2] == ("project", "properties") and len(location) == 3:
+            result["properties"][location[2]] = (elem.text or "").strip()
+        elif location == ("project", "dependencies", "dependency"):
+            result["dependencies"].append(_coordinates(elem))
+        elif location == ("project", "dependencyManagement", "dependencies", "dependency"):
+            result["managed_dependencies"].append(_coordinates(elem))
+        elif location == ("project", "build", "plugins", "plugin"):
+            result["plugins"].append(_coordinates(elem))
+        else:
+            if len(location) > 2:
+                continue
+        elem.clear()
+
+    # ${...} 속성 참조 치환
+    properties = result["properties"]
+    for section in ("dependencies", "managed_dependencies", "plugins"):
+        for coords in result[section]:
+            if "version" in coords:
+                coords["version"] = _PROPERTY_REF.sub(lambda m: properties.get(m.group(1), m.group(0)), coords["version"])
+    return result
+
+
+def parse_package_json(stream: BinaryIO) -> Dict:
+    """package.json에서 분석에 쓰는 항목만 추출 (작은 파일이므로 한 번에 로드)"""
+    package = json.load(stream)
+    return {
+        "name": package.get("name"),
+        "dependencies": package.get("dependencies", {}),
+        "dev_dependencies": package.get("devDependencies", {}),
+        "engines": package.get("engines", {})
+    }
+
+
+# 증분 JSON 토크나이저
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_BARE = re.compile(r"[-+0-9.eEa-z]+")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+def _json_tokens(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """JSON 토큰을 청크 단위로 읽으며 생성 (구두점은 문자, 값은 (값,) 튜플)"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    eof = False
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            c = buffer[pos]
+            if c in "{}[],:":
+                pos += 1
+                yield c
+                continue
+
+            match = (_STRING if c == '"' else _BARE).match(buffer, pos)
+            # 토큰이 청크 경계에 걸리면 더 읽은 뒤 다시 시도
+            if match is not None and (match.end() < len(buffer) or eof):
+                token = match.group()
+                pos = match.end()
+                if c == '"':
+                    yield (json.loads(token) if "\\" in token else token[1:-1],)
+                elif token in _LITERALS:
+                    yield (_LITERALS[token],)
+                else:
+                    yield (json.loads(token),)
+                continue
+            if eof:
+                raise ValueError(f"Invalid JSON near: {buffer[pos:pos + 40]!r}")
+        elif eof:
+            return
+
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + decoder.decode(chunk, final=eof)
+        pos = 0
+
+
+def iter_json_events(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[Tuple, str, object]]:
+    """(경로, 이벤트, 값) 이벤트 스트림 (배열 원소 경로는 "item")
+
+    이벤트: start_map, end_map, start_array, end_array, value. 메모리 사용량은 중첩 깊이와 청크 크기에만 비례한다.
+    """
+    path: List = []
+    # 컨테이너별 (map 여부, 다음 문자열이 키인지)
+    frames: List[List[bool]] = []
+    for token in _json_tokens(stream, chunk_size):
+        if token == "{" or token == "[":
+            is_map = token == "{"
+            yield tuple(path), "start_map" if is_map else "start_array", None
+            frames.append([is_map, is_map])
+            path.append(None if is_map else "item")
+        elif token == "}" or token == "]":
+            frames.pop()
+            path.pop()
+            yield tuple(path), "end_map" if token == "}" else "end_array", None
+        elif token == ",":
+            if frames and frames[-1][0]:
+                frames[-1][1] = True
+        elif token == ":":
+            continue
+        elif frames and frames[-1][1]:
+            path[-1] = token[0]
+            frames[-1][1] = False
+        else:
+            yield tuple(path), "value", token[0]
+
+
+def parse_package_lock(stream: BinaryIO) -> Dict:
+    """package-lock.json(v1~v3)을 증분 파싱하여 의존성 그래프 요약 추출
+
+    v2/v3는 "packages"(node_modules 경로별 항목), v1은 중첩 "dependencies"를 사용한다.
+    둘 다 있으면 "packages"를 기준으로 한다.
+    """
+    lock = {"packages": 0, "dev": 0, "optional": 0, "edges": 0, "max_depth": 0}
+    legacy = dict(lock)
+    direct = set()
+    lockfile_version = None
+    has_packages = False
+
+    for path, event, value in iter_json_events(stream):
+        depth = len(path)
+        if depth == 0:
+            continue
+
+        if path[0] == "packages":
+            if depth == 2 and event == "start_map":
+                has_packages = True
+                if path[1]:
+                    lock["packages"] += 1
+                    lock["max_depth"] = max(lock["max_depth"], path[1].count("node_modules/"))
+            elif depth == 3 and event == "value" and value is True and path[2] in ("dev", "optional"):
+                lock[path[2]] += 1
+            elif depth == 4 and event == "value" and path[2] in ("dependencies", "devDependencies"):
+                if path[1] == "":
+                    direct.add(path[3])
+                elif path[2] == "dependencies":
+                    lock["edges"] += 1
+
+        elif path[0] == "dependencies" and not has_packages:
+            # v1: dependencies > 이름 > dependencies > 이름 ... 형태로 중첩
+            if event == "start_map" and depth % 2 == 0 and all(key == "dependencies" for key in path[0::2]):
+                legacy["packages"] += 1
+                legacy["max_depth"] = max(legacy["max_depth"], depth // 2)
+                if depth == 2:
+                    direct.add(path[1])
+            elif event == "value" and depth % 2 == 1 and path[-1] in ("dev", "optional") and value is True:
+                legacy[path[-1]] += 1
+            elif event == "value" and depth % 2 == 0 and path[-2] == "requires":
+                legacy["edges"] += 1
+
+        elif path == ("lockfileVersion",) and event == "value":
+            lockfile_version = value
+
+    summary = lock if has_packages else legacy
+    return {
+        "lockfile_version": lockfile_version,
+        "direct_dependencies": sorted(direct),
+        "packages": summary["packages"],
+        "dev_packages": summary["dev"],
+        "optional_packages": summary["optional"],
+        "runtime_packages": summary["packages"] - summary["dev"],
+        "edges": summary["edges"],
+        "max_depth": summary["max_depth"]
+    }
+
+
+# 파일 이름별 파서
+PARSERS = {
+    "pom.xml": parse_pom,
+    "package.json": parse_package_json,
+    "package-lock.json": parse_package_lock
+}
+
+
+def parser_for(rel_path: str) -> Optional[Callable[[BinaryIO], Dict]]:
+    return PARSERS.get(rel_path.rsplit("/", 1)[-1])
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Packed Result Encoding
+분석 결과용 MessagePack 호환 바이너리 인코딩 (msgpack 패키지가 있으면 사용, 없으면 순수 Python 구현)과
+버퍼를 복사하지 않고 필요한 최상위 필드만 디코딩하는 지연 로딩 매핑
+"""
+
+import mmap
+import struct
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple, Union
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_UINT = {1: struct.Struct(">B"), 2: struct.Struct(">H"), 4: struct.Struct(">I"), 8: struct.Struct(">Q")}
+_INT = {1: struct.Struct(">b"), 2: struct.Struct(">h"), 4: struct.Struct(">i"), 8: struct.Struct(">q")}
+_FLOAT64 = struct.Struct(">d")
+
+
+def _pack_length(out: bytearray, n: int, fix_base: int, fix_max: int, codes: Tuple[int, int, int]):
+    """fix/8/16/32 길이 헤더 (8비트 코드가 없는 형식은 codes[0] = None)"""
+    if n <= fix_max:
+        out.append(fix_base | n)
+    elif codes[0] is not None and n <= 0xFF:
+        out.append(codes[0])
+        out.append(n)
+    elif n <= 0xFFFF:
+        out.append(codes[1])
+        out += _UINT[2].pack(n)
+    else:
+        out.append(codes[2])
+        out += _UINT[4].pack(n)
+
+
+def _pack(obj: Any, out: bytearray):
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        if 0 <= obj <= 0x7F:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xFF)
+        elif obj > 0:
+            for size, code in ((1, 0xCC), (2, 0xCD), (4, 0xCE), (8, 0xCF)):
+                if obj < 1 << (8 * size):
+                    out.append(code)
+                    out += _UINT[size].pack(obj)
+                    break
+            else:
+                raise OverflowError(f"Integer too large to pack: {obj}")
+        else:
+            for size, code in ((1, 0xD0), (2, 0xD1), (4, 0xD2), (8, 0xD3)):
+                if obj >= -(1 << (8 * size - 1)):
+                    out.append(code)
+                    out += _INT[size].pack(obj)
+                    break
+            else:
+                raise OverflowError(f"Integer too large to pack: {obj}")
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += _FLOAT64.pack(obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8", "surrogateescape")
+        _pack_length(out, len(data), 0xA0, 31, (0xD9, 0xDA, 0xDB))
+        out += data
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        _pack_length(out, len(obj), 0, -1, (0xC4, 0xC5, 0xC6))
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        _pack_length(out, len(obj), 0x90, 15, (None, 0xDC, 0xDD))
+        for item in obj:
+            _pack(item, out)
+    elif isinstance(obj, dict):
+        _pack_length(out, len(obj), 0x80, 15, (None, 0xDE, 0xDF))
+        for key, value in obj.items():
+            _pack(key, out)
+            _pack(value, out)
+    else:
+        raise TypeError(f"Cannot pack {type(obj).__name__}")
+
+
+def packb(obj: Any) -> bytes:
+    """dict/list/str/int/float/bool/None/bytes를 MessagePack 바이트로 인코딩"""
+    if msgpack is not None:
+        return msgpack.packb(obj, use_bin_type=True)
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+def _header(buf: memoryview, pos: int) -> Tuple[str, int, int]:
+    """(종류, 길이 또는 값, 내용 시작 위치) 헤더 해석"""
+    code = buf[pos]
+    pos += 1
+    if code <= 0x7F:
+        return "int", code, pos
+    if code >= 0xE0:
+        return "int", code - 0x100, pos
+    if 0xA0 <= code <= 0xBF:
+        return "str", code & 0x1F, pos
+    if 0x90 <= code <= 0x9F:
+        return "array", code & 0x0F, pos
+    if 0x80 <= code <= 0x8F:
+        return "map", code & 0x0F, pos
+    if code == 0xC0:
+        return "value", None, pos
+    if code == 0xC2:
+        return "value", False, pos
+    if code == 0xC3:
+        return "value", True, pos
+    if code == 0xCB:
+        return "value", _FLOAT64.unpack_from(buf, pos)[0], pos + 8
+    if code == 0xCA:
+        return "value", struct.unpack_from(">f", buf, pos)[0], pos + 4
+    if 0xCC <= code <= 0xCF:
+        size = 1 << (code - 0xCC)
+        return "int", _UINT[size].unpack_from(buf, pos)[0], pos + size
+    if 0xD0 <= code <= 0xD3:
+        size = 1 << (code - 0xD0)
+        return "int", _INT[size].unpack_from(buf, pos)[0], pos + size
+
+    kinds = {0xD9: ("str", 1), 0xDA: ("str", 2), 0xDB: ("str", 4),
+             0xC4: ("bin", 1), 0xC5: ("bin", 2), 0xC6: ("bin", 4),
+             0xDC: ("array", 2), 0xDD: ("array", 4), 0xDE: ("map", 2), 0xDF: ("map", 4)}
+    if code not in kinds:
+        raise ValueError(f"Unsupported MessagePack type 0x{code:02x} at {pos - 1}")
+    kind, size = kinds[code]
+    return kind, _UINT[size].unpack_from(buf, pos)[0], pos + size
+
+
+def _unpack(buf: memoryview, pos: int) -> Tuple[Any, int]:
+    kind, n, pos = _header(buf, pos)
+    if kind == "int" or kind == "value":
+        return n, pos
+    if kind == "str":
+        return str(buf[pos:pos + n], "utf-8", "surrogateescape"), pos + n
+    if kind == "bin":
+        return bytes(buf[pos:pos + n]), pos + n
+    if kind == "array":
+        items = []
+        for _ in range(n):
+            item, pos = _unpack(buf, pos)
+            items.append(item)
+        return items, pos
+    result = {}
+    for _ in range(n):
+        key, pos = _unpack(buf, pos)
+        # 결과마다 반복되는 필드 이름은 하나의 문자열 객체를 공유
+        if isinstance(key, str):
+            key = sys.intern(key)
+        result[key], pos = _unpack(buf, pos)
+    return result, pos
+
+
+def _skip(buf: memoryview, pos: int) -> int:
+    """값을 만들지 않고 다음 값 위치로 이동"""
+    kind, n, pos = _header(buf, pos)
+    if kind == "str" or kind == "bin":
+        return pos + n
+    if kind == "array":
+        for _ in range(n):
+            pos = _skip(buf, pos)
+    elif kind == "map":
+        for _ in range(2 * n):
+            pos = _skip(buf, pos)
+    return pos
+
+
+def unpackb(buffer: Buffer) -> Any:
+    """MessagePack 바이트 디코딩 (배열은 list)"""
+    if msgpack is not None:
+        return msgpack.unpackb(buffer, raw=False, strict_map_key=False)
+    value, _ = _unpack(memoryview(buffer), 0)
+    return value
+
+
+def iter_unpack(buffer: Buffer) -> Iterator[Any]:
+    """이어 붙인 MessagePack 값들을 차례로 디코딩 (배치 결과 스트림 등)"""
+    buf = memoryview(buffer)
+    pos = 0
+    while pos < len(buf):
+        value, pos = _unpack(buf, pos)
+        yield value
+
+
+class PackedMapping(Mapping):
+    """최상위가 map인 MessagePack 버퍼의 지연 디코딩 뷰
+
+    생성 시 키와 값 위치만 색인하고 (값은 건너뜀), 필드를 조회할 때 해당 부분만 디코딩한다.
+    버퍼(bytes, mmap)를 복사하지 않으므로 캐시된 결과에서 필드 몇 개만 읽을 때 전체 디코딩 비용이 없다.
+    """
+
+    def __init__(self, buffer: Buffer):
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        kind, n, pos = _header(self._view, 0)
+        if kind != "map":
+            raise ValueError("Packed buffer does not contain a map")
+        self._offsets: Dict[str, int] = {}
+        for _ in range(n):
+            key, pos = _unpack(self._view, pos)
+            self._offsets[key] = pos
+            pos = _skip(self._view, pos)
+        self._decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._decoded:
+            self._decoded[key] = _unpack(self._view, self._offsets[key])[0]
+        return self._decoded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def to_dict(self) -> Dict:
+        return {key: self[key] for key in self._offsets}
+
+    def release(self):
+        """버퍼 참조 해제 (mmap을 닫기 전에 호출)"""
+        self._view.release()
+
+
+def load_packed(path: str) -> PackedMapping:
+    """파일을 mmap으로 열어 복사 없이 지연 디코딩 (빈 파일이면 ValueError)"""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return PackedMapping(buffer)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Detector Profiler
+감지기별 실행 시간(wall/CPU)과 파일 방문 수, 읽은 바이트, 캐시 히트, 패턴 매칭 수를 기록하는 계측기
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+# 계측 항목 (span마다 0으로 시작)
+COUNTERS = ("files_visited", "bytes_read", "cache_hits", "regex_matches")
+
+# 비활성 상태에서 공유하는 빈 컨텍스트 (호출마다 객체를 만들지 않음)
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """활성 span 하나 (중첩 시 자식 시간을 빼서 자체 시간 계산)"""
+
+    __slots__ = ("profiler", "name", "counters", "child_wall", "wall_start", "cpu_start")
+
+    def __init__(self, profiler: "DetectorProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.child_wall = 0.0
+
+    def __enter__(self):
+        self.profiler._stack.append(self)
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.process_time() - self.cpu_start
+        self.profiler._stack.pop()
+        self.profiler._record(self, wall, cpu)
+        return False
+
+
+class DetectorProfiler:
+    """감지기 계측기 (enabled=False면 span/count가 즉시 반환되어 오버헤드가 거의 없음)
+
+    카운터는 가장 안쪽 span에만 더해지고, 시간은 전체(wall_ms)와 자식 span을 뺀 자체 시간(self_wall_ms)을 함께 기록한다.
+    trace=True면 Chrome trace-event 형식 기록도 보관한다.
+    """
+
+    def __init__(self, enabled: bool = False, trace: bool = False):
+        self.enabled = enabled
+        self.trace = trace
+        self.reset()
+
+    def reset(self):
+        """기록 초기화 (분석마다 호출)"""
+        self._stack: List[_Span] = []
+        self._spans: Dict[str, Dict] = {}
+        self._events: List[Dict] = []
+        self._origin = time.perf_counter()
+
+    def span(self, name: str):
+        """name 구간 계측 컨텍스트"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def count(self, counter: str, n: int = 1):
+        """현재 span의 카운터 증가"""
+        if self.enabled and self._stack:
+            self._stack[-1].counters[counter] += n
+
+    def _record(self, span: _Span, wall: float, cpu: float):
+        if self._stack:
+            self._stack[-1].child_wall += wall
+
+        stats = self._spans.get(span.name)
+        if stats is None:
+            stats = self._spans[span.name] = {"calls": 0, "wall_ms": 0.0, "self_wall_ms": 0.0,
+                                              "cpu_ms": 0.0, **dict.fromkeys(COUNTERS, 0)}
+        stats["calls"] += 1
+        stats["wall_ms"] += wall * 1000
+        stats["self_wall_ms"] += (wall - span.child_wall) * 1000
+        stats["cpu_ms"] += cpu * 1000
+        for counter, n in span.counters.items():
+            stats[counter] += n
+
+        if self.trace:
+            self._events.append({
+                "name": span.name,
+                "cat": "analyzer",
+                "ph": "X",
+                "ts": round((span.wall_start - self._origin) * 1e6, 1),
+                "dur": round(wall * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": dict(span.counters)
+            })
+
+    def report(self) -> Optional[Dict]:
+        """span별 계측 결과 (analysis_result["_perf"]용, 비활성 상태면 None)"""
+        if not self.enabled:
+            return None
+        spans = {}
+        for name, stats in self._spans.items():
+            spans[name] = {key: round(value, 3) if isinstance(value, float) else value
+                           for key, value in stats.items()}
+        return {"spans": spans}
+
+    def write_chrome_trace(self, path: str):
+        """chrome://tracing / Perfetto에서 열 수 있는 trace-event JSON 저장"""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, f)
+
+    def format_table(self) -> str:
+        """CLI 출력용 표 (자체 시간 내림차순)"""
+        rows = sorted(self._spans.items(), key=lambda item: item[1]["self_wall_ms"], reverse=True)
+        lines = [f"{'span':<24}{'calls':>6}{'wall ms':>10}{'self ms':>10}{'cpu ms':>10}"
+                 f"{'files':>8}{'bytes':>12}{'hits':>7}{'matches':>9}"]
+        for name, s in rows:
+            lines.append(f"{name:<24}{s['calls']:>6}{s['wall_ms']:>10.1f}{s['self_wall_ms']:>10.1f}"
+                         f"{s['cpu_ms']:>10.1f}{s['files_visited']:>8}{s['bytes_read']:>12}"
+                         f"{s['cache_hits']:>7}{s['regex_matches']:>9}")
+        return "\n".join(lines)
@@ -100,6 +100,9 @@ class AnalysisReportGenerator:
 ### 🏷️ 빌드 설정
 {self._format_build_config()}
 
+### ⚡ 분석 캐시
+{self._format_cache_stats()}
+
 ---
 
 ## 💡 최적화 권장사항
@@ -224,6 +227,32 @@ class AnalysisReportGenerator:
         
         return '\n'.join(result)
     
+    def _format_cache_stats(self) -> str:
+        """분석기 파일 캐시 통계 포맷팅"""
+        cache = self.analysis_result.get('_cache')
+        if not cache:
+            return "- 캐시 통계 없음"
+        
+        lookups = cache['hits'] + cache['misses']
+        hit_rate = (cache['hits'] / lookups * 100) if lookups else 0.0
+        
+        result = [
+            f"- **캐시 히트**: {cache['hits']}회",
+            f"- **캐시 미스**: {cache['misses']}회",
+            f"- **히트율**: {hit_rate:.1f}%",
+            f"- **캐시 크기**: {cache['bytes']:,} bytes ({cache['entries']}개 파일)"
+        ]
+        
+        incremental = cache.get('incremental')
+        if incremental:
+            if incremental['aggregate_hit']:
+                result.append("- **증분 분석**: 변경 없음 (이전 분석 결과 재사용)")
+            else:
+                result.append(f"- **증분 분석**: {incremental['files_reused']}개 재사용, "
+                              f"{incremental['files_rescanned']}개 재분석")
+        
+        return '\n'.join(result)
+    
     def _generate_recommendations(self) -> str:
         """최적화 권장사항 생성"""
         recommendations = []
@@ -312,6 +341,7 @@ class AnalysisReportGenerator:
                 "memory_limit": self.analysis_result['resources']['memory_limit'],
                 "estimated_cost": self._calculate_total_cost()
             },
+            "analyzer_cache": self.analysis_result.get('_cache'),
             "recommendations": {
                 "terraform_modules": self._get_required_modules(),
                 "k8s_resources": self._get_required_k8s_resources(),
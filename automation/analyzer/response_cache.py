@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Model Response Cache
+모델 ID, 프롬프트, 호출 파라미터의 해시를 키로 Bedrock 응답을 메모리(LRU)와 디스크(SQLite, TTL/용량 제한)에
+저장하여 같은 입력으로는 네트워크를 다시 호출하지 않는 응답 캐시
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+# 기본 위치 (<cache_dir>/responses.sqlite)
+RESPONSE_DB_NAME = "responses.sqlite"
+
+# 디스크 캐시 유효 기간 (초)과 최대 크기 (초과 시 가장 오래 사용하지 않은 응답부터 삭제)
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 메모리 캐시 최대 응답 수
+DEFAULT_MEMORY_ENTRIES = 128
+
+
+def response_key(model_id: str, body: Dict) -> str:
+    """모델 ID와 요청 본문(프롬프트, max_tokens 등 파라미터)의 SHA-256 (키 순서와 무관)"""
+    canonical = json.dumps({"model": model_id, "body": body}, sort_keys=True,
+                           separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """모델 응답 캐시 (메모리 LRU + 디스크 SQLite)
+
+    bypass=True이면 캐시를 읽지 않고 항상 호출하되, 새 응답은 저장하여 다음 실행에서 사용한다.
+    같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 호출하고 나머지는 그 결과를 사용한다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 bypass: bool = False):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.bypass = bypass
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Lock] = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+        self.conn = None
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                self.conn = sqlite3.connect(os.path.join(cache_dir, RESPONSE_DB_NAME), check_same_thread=False)
+                self.conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    response TEXT NOT NULL
+                )""")
+                self.conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️ Response cache disk layer disabled: {e}")
+                self.conn = None
+
+    def get_or_call(self, model_id: str, body: Dict, call: Callable[[], Dict]) -> Tuple[Dict, bool]:
+        """(응답, 캐시 적중 여부) 반환, 캐시에 없으면 call()로 호출하여 저장 (호출이 예외를 내면 저장하지 않음)"""
+        key = response_key(model_id, body)
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                if not self.bypass:
+                    cached = self.get(key)
+                    if cached is not None:
+                        return cached, True
+                with self._lock:
+                    self.stats["misses"] += 1
+                response = call()
+                self.put(key, model_id, response)
+                return response, False
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """메모리, 디스크 순으로 조회 (디스크에서 찾으면 메모리에도 올림)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._memory[key]
+
+            if self.conn is None:
+                return None
+            row = self.conn.execute("SELECT created, response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[0] > self.ttl:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                self.stats["expired"] += 1
+                return None
+            self.conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            response = json.loads(row[1])
+            self._remember(key, response)
+            self.stats["disk_hits"] += 1
+            return response
+
+    def put(self, key: str, model_id: str, response: Dict):
+        with self._lock:
+            self._remember(key, response)
+            if self.conn is None:
+                return
+            data = json.dumps(response)
+            now = time.time()
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                              (key, model_id, now, now, len(data), data))
+            self._evict(now)
+            self.conn.commit()
+
+    def _remember(self, key: str, response: Dict):
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, now: float):
+        """만료된 응답 삭제 후 최대 크기를 넘으면 가장 오래 사용하지 않은 응답부터 삭제"""
+        expired = self.conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,)).rowcount
+        self.stats["expired"] += expired
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.conn is not None:
+                self.conn.execute("DELETE FROM responses")
+                self.conn.commit()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
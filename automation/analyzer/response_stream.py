@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Streaming Model Response
+Bedrock invoke_model_with_response_stream 이벤트에서 텍스트를 꺼내고, 응답 JSON의 최상위 필드
+(app_type, resources, database ...)를 완성되는 즉시 하나씩 돌려주는 증분 JSON 파서
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 최상위 값이 이 길이를 넘으면 잘못된 응답으로 보고 파싱 중단 (닫히지 않는 문자열 등, 최종 파싱은 전체 응답으로)
+MAX_FIELD_CHARS = 256 * 1024
+
+
+class IncrementalJSONParser:
+    """텍스트 조각을 받으며 최상위 JSON 객체의 필드를 완성 순서대로 반환
+
+    첫 '{' 이전의 텍스트(설명, 코드 펜스 등)는 무시하고, 최상위 객체가 닫히면 이후 텍스트도 무시한다.
+    값은 현재 필드만 버퍼에 보관하므로 응답 전체를 다시 훑지 않는다.
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._state = "start"
+        self._key = None
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """텍스트 조각 처리 후 이번에 완성된 (필드, 값) 목록 반환"""
+        completed = []
+        for ch in text:
+            if self.done:
+                break
+            state = self._state
+            if state == "start":
+                if ch == "{":
+                    self._state = "key_or_end"
+            elif state == "key_or_end":
+                if ch == '"':
+                    self._begin("key", ch)
+                elif ch == "}":
+                    self.done = True
+            elif state == "key":
+                if self._scan_string(ch):
+                    try:
+                        self._key = json.loads("".join(self._buffer))
+                    except ValueError:
+                        self._key = None
+                    self._state = "colon"
+            elif state == "colon":
+                if ch == ":":
+                    self._state = "value_start"
+            elif state == "value_start":
+                if not ch.isspace():
+                    self._begin("value", ch)
+                    if ch in "{[":
+                        self._depth = 1
+                    elif ch != '"':
+                        self._state = "scalar"
+            elif state == "value":
+                if self._in_string:
+                    if self._scan_string(ch) and self._depth == 0:
+                        self._complete(completed)
+                else:
+                    self._buffer.append(ch)
+                    if ch == '"':
+                        self._in_string = True
+                    elif ch in "{[":
+                        self._depth += 1
+                    elif ch in "}]":
+                        self._depth -= 1
+                        if self._depth == 0:
+                            self._complete(completed)
+            elif state == "scalar":
+                # 숫자/true/false/null은 다음 구분자에서 끝남
+                if ch in ",}" or ch.isspace():
+                    self._complete(completed)
+                    if ch == "}":
+                        self.done = True
+                else:
+                    self._buffer.append(ch)
+
+            if len(self._buffer) > MAX_FIELD_CHARS:
+                self._buffer = []
+                self.done = True
+        return completed
+
+    def _begin(self, state: str, ch: str):
+        self._state = state
+        self._buffer = [ch]
+        self._depth = 0
+        self._in_string = ch == '"'
+        self._escape = False
+
+    def _scan_string(self, ch: str) -> bool:
+        """문자열 안의 문자 추가 (문자열이 닫히면 True)"""
+        self._buffer.append(ch)
+        if self._escape:
+            self._escape = False
+        elif ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+            return True
+        return False
+
+    def _complete(self, completed: List[Tuple[str, Any]]):
+        try:
+            value = json.loads("".join(self._buffer))
+        except ValueError:
+            pass
+        else:
+            if self._key is not None:
+                self.fields[self._key] = value
+                completed.append((self._key, value))
+        self._buffer = []
+        self._key = None
+        self._state = "key_or_end"
+
+
+def stream_response(events: Iterable[Dict], on_text: Optional[Callable[[str], None]] = None) -> Dict:
+    """응답 스트림 이벤트를 읽어 invoke_model 응답 본문과 같은 형식으로 반환 (텍스트 조각마다 on_text 호출)"""
+    parts = []
+    stop_reason = None
+    usage = {}
+    for event in events:
+        chunk = event.get("chunk")
+        if chunk is None:
+            # 스트림 중 오류 이벤트 (throttlingException, modelStreamErrorException ...)
+            if event:
+                name, detail = next(iter(event.items()))
+                raise RuntimeError(f"{name}: {(detail or {}).get('message', '')}")
+            continue
+
+        data = json.loads(chunk["bytes"])
+        if data.get("type") == "content_block_delta" and data["delta"].get("type") == "text_delta":
+            text = data["delta"]["text"]
+            parts.append(text)
+            if on_text:
+                on_text(text)
+        elif data.get("type") == "message_delta":
+            stop_reason = data.get("delta", {}).get("stop_reason", stop_reason)
+            usage.update(data.get("usage", {}))
+        elif data.get("type") == "message_start":
+            usage.update(data.get("message", {}).get("usage", {}))
+
+    return {
+        "content": [{"type": "text", "text": "".join(parts)}],
+        "stop_reason": stop_reason,
+        "usage": usage
+    }
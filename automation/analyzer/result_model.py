@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Typed Analysis Result
+분석 결과 dict를 slots 데이터클래스와 문자열 enum으로 표현하는 간결한 모델 (dict 형식과 상호 변환,
+JSON/MessagePack 직렬화)
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    from .packed import PackedMapping, Buffer, packb, unpackb
+except ImportError:
+    from packed import PackedMapping, Buffer, packb, unpackb
+
+
+class _StrEnum(str, Enum):
+    """문자열과 같게 비교되고 JSON/f-string에서 값 그대로 출력되는 enum"""
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, spec: str) -> str:
+        return format(self.value, spec)
+
+
+class AppType(_StrEnum):
+    JAVA_MAVEN = "java-maven"
+    JAVA_GRADLE = "java-gradle"
+    NODEJS = "nodejs"
+    PYTHON = "python"
+    GOLANG = "golang"
+    RUST = "rust"
+    UNKNOWN = "unknown"
+
+
+class Framework(_StrEnum):
+    SPRING_BOOT = "spring-boot"
+    SPRING = "spring"
+    JAVA = "java"
+    REACT = "react"
+    VUE = "vue"
+    ANGULAR = "angular"
+    EXPRESS = "express"
+    NEXTJS = "nextjs"
+    NODEJS = "nodejs"
+    DJANGO = "django"
+    FLASK = "flask"
+    FASTAPI = "fastapi"
+    PYTHON = "python"
+    UNKNOWN = "unknown"
+
+
+def _member(enum_cls, value: Optional[str]):
+    """enum 멤버 (새 감지기가 목록에 없는 값을 내면 문자열 그대로 유지)"""
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
+
+
+def _text(value: Optional[str]) -> Optional[str]:
+    """결과마다 반복되는 짧은 값("512Mi", "mysql" 등)은 하나의 문자열 객체 공유"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class DatabaseRequirement:
+    required: bool = False
+    type: Optional[str] = None
+    estimated_size: str = "small"
+    orm: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DatabaseRequirement":
+        return cls(data.get("required", False), _text(data.get("type")),
+                   _text(data.get("estimated_size", "small")), _text(data.get("orm")))
+
+    def to_dict(self) -> Dict:
+        data = {"required": self.required, "type": self.type, "estimated_size": self.estimated_size}
+        if self.orm is not None:
+            data["orm"] = self.orm
+        return data
+
+
+@dataclass(slots=True)
+class ResourceProfile:
+    cpu_request: str
+    cpu_limit: str
+    memory_request: str
+    memory_limit: str
+    replicas: int
+    runtime_env: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ResourceProfile":
+        return cls(_text(data["cpu_request"]), _text(data["cpu_limit"]), _text(data["memory_request"]),
+                   _text(data["memory_limit"]), data["replicas"], data.get("runtime_env"))
+
+    def to_dict(self) -> Dict:
+        data = {"cpu_request": self.cpu_request, "cpu_limit": self.cpu_limit,
+                "memory_request": self.memory_request, "memory_limit": self.memory_limit,
+                "replicas": self.replicas}
+        if self.runtime_env is not None:
+            data["runtime_env"] = dict(self.runtime_env)
+        return data
+
+
+@dataclass(slots=True)
+class ExternalDependencies:
+    external_services: Tuple[str, ...] = ()
+    third_party_apis: Tuple[str, ...] = ()
+    security_requirements: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ExternalDependencies":
+        return cls(*(tuple(map(_text, data.get(name, ())))
+                     for name in ("external_services", "third_party_apis", "security_requirements")))
+
+    def to_dict(self) -> Dict:
+        return {"external_services": list(self.external_services),
+                "third_party_apis": list(self.third_party_apis),
+                "security_requirements": list(self.security_requirements)}
+
+
+@dataclass(slots=True)
+class BuildConfig:
+    build_tool: Optional[str] = None
+    java_version: Optional[str] = None
+    node_version: Optional[str] = None
+    docker_required: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BuildConfig":
+        return cls(_text(data.get("build_tool")), _text(data.get("java_version")),
+                   _text(data.get("node_version")), data.get("docker_required", False))
+
+    def to_dict(self) -> Dict:
+        return {"build_tool": self.build_tool, "java_version": self.java_version,
+                "node_version": self.node_version, "docker_required": self.docker_required}
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """ApplicationAnalyzer.analyze() 결과
+
+    dependency_graph는 매니페스트 종류별 요약이라 dict로 유지한다. 감지 필드 외의 키
+    (_cache, _index 같은 메타 정보, 멀티 서비스의 path 등)는 extra에 원래 이름 그대로 보관한다.
+    """
+    app_type: Union[AppType, str]
+    framework: Union[Framework, str]
+    database: DatabaseRequirement
+    resources: ResourceProfile
+    ports: Tuple[int, ...]
+    environment: Tuple[str, ...]
+    dependencies: ExternalDependencies
+    dependency_graph: Dict[str, Any]
+    build_config: BuildConfig
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AnalysisResult":
+        known = cls.__dataclass_fields__
+        return cls(
+            app_type=_member(AppType, data["app_type"]),
+            framework=_member(Framework, data["framework"]),
+            database=DatabaseRequirement.from_dict(data["database"]),
+            resources=ResourceProfile.from_dict(data["resources"]),
+            ports=tuple(data["ports"]),
+            environment=tuple(map(_text, data["environment"])),
+            dependencies=ExternalDependencies.from_dict(data["dependencies"]),
+            dependency_graph=data["dependency_graph"],
+            build_config=BuildConfig.from_dict(data["build_config"]),
+            extra={key: value for key, value in data.items() if key not in known})
+
+    def to_dict(self) -> Dict:
+        """생성기/리포트가 사용하는 기존 dict 형식 (enum은 문자열 값)"""
+        data = {
+            "app_type": str(self.app_type),
+            "framework": str(self.framework),
+            "database": self.database.to_dict(),
+            "resources": self.resources.to_dict(),
+            "ports": list(self.ports),
+            "environment": list(self.environment),
+            "dependencies": self.dependencies.to_dict(),
+            "dependency_graph": self.dependency_graph,
+            "build_config": self.build_config.to_dict()
+        }
+        data.update(self.extra)
+        return data
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_bytes(self) -> bytes:
+        """MessagePack 인코딩"""
+        return packb(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, buffer: Buffer) -> "AnalysisResult":
+        return cls.from_dict(unpackb(buffer))
+
+    @classmethod
+    def from_packed(cls, packed: PackedMapping, include_extra: bool = False) -> "AnalysisResult":
+        """지연 디코딩 뷰에서 감지 필드만 디코딩 (_perf 같은 큰 메타 정보는 필요할 때만)"""
+        data = {name: packed[name] for name in cls.__dataclass_fields__ if name in packed}
+        if include_extra:
+            data.update({key: packed[key] for key in packed if key not in data})
+        return cls.from_dict(data)
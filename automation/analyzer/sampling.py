@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Budgeted Sampling
+시간/바이트 예산 안에서 확장자·디렉토리별 층화 무작위 순서로 파일을 스캔하고, 스캔하지 못한 파일의 합계를
+파일 크기 기반 비율 추정량과 신뢰구간으로 외삽
+"""
+
+import math
+import random
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# 95% 신뢰구간 z 값
+Z_95 = 1.96
+
+# 표본 순서 시드 (실행마다 같은 파일을 먼저 스캔하여 파일 캐시를 재사용)
+SAMPLING_SEED = 0
+
+# 층을 나누는 디렉토리 깊이
+STRATUM_DIR_DEPTH = 2
+
+# 표본이 하나도 없을 때 사용할 바이트당 라인 수 (평균 32바이트/줄)
+DEFAULT_LINES_PER_BYTE = 1 / 32
+
+
+def stratum_of(rel_path: str) -> Tuple[str, str]:
+    """(확장자, 상위 디렉토리) 층"""
+    parts = rel_path.split("/")
+    name = parts[-1]
+    dot = name.rfind(".")
+    ext = name[dot:] if dot > 0 else ""
+    return ext, "/".join(parts[:-1][:STRATUM_DIR_DEPTH])
+
+
+def stratified_order(items: Sequence, key=lambda item: item.rel_path, seed: int = SAMPLING_SEED) -> List:
+    """층화 무작위 순서
+
+    각 층 안에서 섞은 뒤 층 내 순위 비율((순위 + 난수) / 층 크기) 순으로 합치므로,
+    어느 지점에서 잘라도 각 층이 크기에 비례하여 표본에 포함된다.
+    """
+    rng = random.Random(seed)
+    strata = defaultdict(list)
+    for item in items:
+        strata[stratum_of(key(item))].append(item)
+
+    ordered = []
+    for stratum in sorted(strata):
+        members = strata[stratum]
+        rng.shuffle(members)
+        size = len(members)
+        ordered.extend(((rank + rng.random()) / size, item) for rank, item in enumerate(members))
+    ordered.sort(key=lambda pair: pair[0])
+    return [item for _, item in ordered]
+
+
+def _variance(values: List[float]) -> Optional[float]:
+    if len(values) < 2:
+        return None
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+
+def estimate_total(units: Iterable[Tuple[Hashable, int, Optional[float]]]) -> Dict:
+    """층화 비율 추정량으로 모집단 합계 추정
+
+    units는 (층, 파일 크기, 측정값 또는 None) 목록이다. 파일 크기는 인덱스에서 모든 파일에 대해 알려져 있으므로
+    층마다 측정값/크기 비율을 구해 스캔하지 못한 파일 크기에 곱한다. 표본이 없는 층은 전체 비율을 사용하고
+    분산도 표본 하나로 본 것처럼 크게 잡는다.
+    """
+    strata = defaultdict(list)
+    for stratum, size, value in units:
+        strata[stratum].append((size, value))
+
+    sampled = [(x, y) for members in strata.values() for x, y in members if y is not None]
+    sample_x = sum(x for x, _ in sampled)
+    pooled_ratio = sum(y for _, y in sampled) / sample_x if sample_x else DEFAULT_LINES_PER_BYTE
+    pooled_var = _variance([y - pooled_ratio * x for x, y in sampled])
+    if pooled_var is None:
+        mean_x = sum(x for members in strata.values() for x, _ in members) / max(1, sum(map(len, strata.values())))
+        pooled_var = (pooled_ratio * mean_x) ** 2
+
+    known = 0.0
+    total = 0.0
+    variance = 0.0
+    for members in strata.values():
+        population = len(members)
+        measured = [(x, y) for x, y in members if y is not None]
+        n = len(measured)
+        measured_y = sum(y for _, y in measured)
+        known += measured_y
+        if n == population:
+            total += measured_y
+            continue
+
+        measured_x = sum(x for x, _ in measured)
+        ratio = measured_y / measured_x if measured_x else pooled_ratio
+        unmeasured_x = sum(x for x, _ in members) - measured_x
+        total += measured_y + ratio * unmeasured_x
+
+        residual_var = _variance([y - ratio * x for x, y in measured])
+        if residual_var is None:
+            residual_var = pooled_var
+        n = max(1, n)
+        variance += population ** 2 * (1 - n / population) * residual_var / n
+
+    margin = Z_95 * math.sqrt(variance)
+    return {
+        "value": round(total),
+        "low": round(max(known, total - margin)),
+        "high": round(total + margin),
+        "confidence": 0.95
+    }
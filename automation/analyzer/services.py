@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Multi-Service Discovery
+모노레포에서 빌드 루트(pom.xml, package.json, requirements.txt, go.mod ...)를 한 번의 순회로 찾고
+서비스별로 독립된 하위 인덱스를 만들어 동시에 분석
+"""
+
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Container, Dict, List, Optional
+
+try:
+    from .file_index import FileIndex
+    from .git_source import GitTreeIndex
+    from .analysis_cache import CACHE_DIR_NAME
+    from .code_analyzer import ApplicationAnalyzer
+except ImportError:
+    from file_index import FileIndex
+    from git_source import GitTreeIndex
+    from analysis_cache import CACHE_DIR_NAME
+    from code_analyzer import ApplicationAnalyzer
+
+# 빌드 루트를 나타내는 파일과 빌드 도구
+SERVICE_MARKERS = {
+    "pom.xml": "maven",
+    "build.gradle": "gradle",
+    "build.gradle.kts": "gradle",
+    "package.json": "npm",
+    "requirements.txt": "pip",
+    "pyproject.toml": "pip",
+    "go.mod": "go",
+    "Cargo.toml": "cargo"
+}
+
+# 서비스 이름에 쓸 수 없는 문자 (Kubernetes 리소스 이름 규칙)
+_INVALID_NAME_CHARS = re.compile(r"[^a-z0-9-]+")
+
+
+def service_name(rel_dir: str, repo_name: str) -> str:
+    """서비스 디렉토리 경로를 DNS-1123 라벨 형식 이름으로 변환 (루트는 저장소 이름)"""
+    name = _INVALID_NAME_CHARS.sub("-", (rel_dir or repo_name).lower()).strip("-")
+    return name[:63].rstrip("-") or "app"
+
+
+def unique_service_name(rel_dir: str, repo_name: str, taken: Container[str]) -> str:
+    """service_name이 이미 쓰인 이름과 겹치면 (api_v1/api-v1, services/api/services-api 등) 경로 해시를 붙여 구분"""
+    name = base = service_name(rel_dir, repo_name)
+    if name in taken:
+        suffix = hashlib.sha1(rel_dir.encode("utf-8", "surrogateescape")).hexdigest()[:6]
+        name = base = f"{base[:56].rstrip('-')}-{suffix}"
+        count = 2
+        while name in taken:
+            name = f"{base[:60]}-{count}"
+            count += 1
+    return name
+
+
+def discover_services(index: FileIndex) -> Dict[str, List[str]]:
+    """빌드 루트 디렉토리별 빌드 도구 목록 (인덱스를 한 번 훑어 marker 파일 위치 수집)"""
+    services = {}
+    for marker, build_tool in SERVICE_MARKERS.items():
+        for entry in index.files_named(marker):
+            rel_dir = entry.rel_path[:-len(marker)].rstrip("/")
+            tools = services.setdefault(rel_dir, [])
+            if build_tool not in tools:
+                tools.append(build_tool)
+    return dict(sorted(services.items()))
+
+
+class MultiServiceAnalyzer:
+    """저장소의 모든 서비스를 각자의 인덱스/캐시/리소스 프로파일로 분석"""
+
+    def __init__(self, repo_path: str, cache_dir: Optional[str] = None, incremental: bool = True,
+                 max_depth: Optional[int] = None, ref: Optional[str] = None,
+                 workers: Optional[int] = None, **analyzer_options):
+        self.repo_path = Path(repo_path)
+        self.ref = ref
+        self.max_depth = max_depth
+
+        # 서비스별 영구 캐시는 <cache_dir>/services/<서비스> 에 따로 두어 SQLite 쓰기 잠금이 겹치지 않게 함
+        self.cache_dir = cache_dir or str(self.repo_path / CACHE_DIR_NAME)
+        self.incremental = incremental
+        self.workers = workers
+
+        # 서비스별 ApplicationAnalyzer에 그대로 전달 (max_file_size, jobs, budget_* 등)
+        self.analyzer_options = analyzer_options
+        self.services = {}
+        self.analysis_result = {}
+
+    def _build_index(self) -> FileIndex:
+        if self.ref:
+            return GitTreeIndex(self.repo_path, self.ref, max_depth=self.max_depth).build()
+        return FileIndex(self.repo_path, max_depth=self.max_depth).build()
+
+    def analyze(self) -> Dict:
+        """서비스 탐색 후 서비스별 분석을 동시에 실행"""
+        print(f"🔍 Discovering services: {self.repo_path}" + (f" @ {self.ref}" if self.ref else ""))
+
+        index = self._build_index()
+        try:
+            build_roots = discover_services(index)
+            repo_name = self.repo_path.resolve().name
+
+            analyzers = {}
+            self.services = {}
+            for rel_dir, build_tools in build_roots.items():
+                # 중첩된 서비스(app/frontend 등)는 상위 서비스 분석에서 제외하여 결과가 섞이지 않게 함
+                nested = [other for other in build_roots
+                          if other != rel_dir and (not rel_dir or other.startswith(rel_dir + "/"))]
+                name = unique_service_name(rel_dir, repo_name, self.services)
+                self.services[name] = {"path": rel_dir or ".", "build_tools": build_tools}
+                analyzers[name] = ApplicationAnalyzer(
+                    index.root if not rel_dir else os.path.join(index.root, rel_dir),
+                    cache_dir=os.path.join(self.cache_dir, "services", name),
+                    incremental=self.incremental,
+                    max_depth=self.max_depth,
+                    ref=self.ref,
+                    file_index=index.subtree(rel_dir, exclude=nested),
+                    **self.analyzer_options)
+
+            print(f"🧩 Found {len(analyzers)} service(s): {', '.join(analyzers) or '-'}")
+
+            # 서비스 분석은 대부분 파일 I/O와 git/프로세스 대기이므로 스레드로 동시에 실행
+            results = {}
+            if analyzers:
+                workers = self.workers or min(len(analyzers), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                    futures = {name: executor.submit(analyzer.analyze) for name, analyzer in analyzers.items()}
+                    for name, future in futures.items():
+                        results[name] = {**self.services[name], **future.result()}
+        finally:
+            index.close()
+
+        self.analysis_result = {
+            "services": results,
+            "database": self._shared_database(results),
+            "_index": dict(index.stats)
+        }
+        return self.analysis_result
+
+    @staticmethod
+    def _shared_database(results: Dict[str, Dict]) -> Dict:
+        """클러스터에 하나 만드는 RDS 요구사항 (데이터베이스가 필요한 첫 서비스 기준)"""
+        for name, result in results.items():
+            database = result.get("database", {})
+            if database.get("required"):
+                return {**database, "service": name}
+        return {"required": False}
+
+    def generate_summary(self) -> str:
+        """서비스별 분석 결과 요약"""
+        if not self.analysis_result:
+            self.analyze()
+
+        summary = "\n🔍 Multi-Service Analysis Summary\n================================\n"
+        for name, result in self.analysis_result["services"].items():
+            resources = result["resources"]
+            summary += (f"\n📦 {name} ({result['path']}, {', '.join(result['build_tools'])})\n"
+                        f"   🚀 Framework: {result['framework']}\n"
+                        f"   🔌 Ports: {', '.join(map(str, result['ports']))}\n"
+                        f"   💾 Memory: {resources['memory_request']} / {resources['memory_limit']}, "
+                        f"CPU: {resources['cpu_request']} / {resources['cpu_limit']}, "
+                        f"Replicas: {resources['replicas']}\n")
+
+        database = self.analysis_result["database"]
+        if database["required"]:
+            summary += f"\n🗄️  RDS {database.get('type', 'mysql').upper()} database (used by {database['service']})\n"
+        return summary
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Monorepo multi-service analyzer")
+    parser.add_argument("repo_path", help="분석할 저장소 경로")
+    parser.add_argument("--no-cache", action="store_true", help="영구 분석 캐시 사용 안 함")
+    parser.add_argument("--cache-dir", help=f"영구 분석 캐시 위치 (기본: <repo_path>/{CACHE_DIR_NAME})")
+    parser.add_argument("--ref", help="작업 트리 대신 분석할 git 커밋/브랜치 (체크아웃 불필요)")
+    parser.add_argument("--workers", type=int, help="동시에 분석할 서비스 수 (기본: min(서비스 수, CPU 수))")
+    parser.add_argument("--max-depth", type=int, help="순회할 최대 디렉토리 깊이 (0 = 루트만)")
+    parser.add_argument("--output", default="analysis_result.json", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    analyzer = MultiServiceAnalyzer(args.repo_path, cache_dir=args.cache_dir,
+                                    incremental=not args.no_cache,
+                                    max_depth=args.max_depth,
+                                    ref=args.ref,
+                                    workers=args.workers)
+    result = analyzer.analyze()
+
+    print(analyzer.generate_summary())
+
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    print(f"\n📄 Detailed analysis saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Streaming File Reader
+바이너리 파일 감지 및 고정 크기 청크 단위 라인 수 계산 (파일 크기와 무관하게 메모리 일정)
+"""
+
+import hashlib
+from typing import Tuple, Union
+
+# 바이너리 여부를 판단할 앞부분 크기
+SNIFF_BYTES = 8192
+
+# 스트리밍 라인 수 계산 청크 크기
+CHUNK_SIZE = 1024 * 1024
+
+
+class BinaryFileError(ValueError):
+    """텍스트가 아닌 파일"""
+
+
+def looks_binary(head: bytes) -> bool:
+    """앞부분에 NUL 바이트가 있으면 바이너리로 판단"""
+    return b"\0" in head[:SNIFF_BYTES]
+
+
+def blob_digest(data: bytes) -> str:
+    """git blob SHA와 동일한 내용 해시 (작업 트리와 커밋 분석이 캐시를 공유)"""
+    digest = hashlib.sha1(f"blob {len(data)}\0".encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def count_lines(data: Union[bytes, str]) -> int:
+    """개행 문자 수 기준 라인 수 (마지막 줄에 개행이 없어도 한 줄로 계산)"""
+    newline = b"\n" if isinstance(data, bytes) else "\n"
+    lines = data.count(newline)
+    if data and not data.endswith(newline):
+        lines += 1
+    return lines
+
+
+def read_file_bytes(path: str) -> bytes:
+    """앞부분으로 바이너리 여부를 먼저 확인한 뒤 파일 전체 읽기"""
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+        if looks_binary(head):
+            raise BinaryFileError(path)
+        return head + f.read()
+
+
+def stream_file_stats(path: str, chunk_size: int = CHUNK_SIZE) -> Tuple[str, int]:
+    """파일을 청크 단위로 읽으며 (git blob SHA, 라인 수) 계산
+
+    디코딩이나 줄 목록 생성 없이 b"\\n"만 세므로 메모리 사용량은 청크 크기로 고정된다.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    lines = 0
+    last_byte = None
+
+    with open(path, "rb", buffering=0) as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        digest = hashlib.sha1(f"blob {size}\0".encode())
+
+        first = True
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            if first:
+                if buffer.find(b"\0", 0, min(n, SNIFF_BYTES)) != -1:
+                    raise BinaryFileError(path)
+                first = False
+            lines += buffer.count(b"\n", 0, n)
+            digest.update(view[:n])
+            last_byte = buffer[n - 1]
+
+    if last_byte is not None and last_byte != ord("\n"):
+        lines += 1
+    return digest.hexdigest(), lines
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Filesystem Watcher
+inotify(리눅스, ctypes) 또는 stat 폴링으로 인덱스된 디렉토리를 감시하고, 저장이 몰리면 묶어서(debounce)
+변경된 파일만 ApplicationAnalyzer.refresh()로 반영하여 결과 필드가 실제로 바뀐 경우에만 알림
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from .file_index import FileIndex
+except ImportError:
+    from file_index import FileIndex
+
+# 마지막 이벤트 후 이 시간 동안 조용하면 변경 묶음을 처리 (초)
+DEFAULT_DEBOUNCE = 0.2
+
+# inotify를 쓸 수 없을 때의 폴링 간격 (초)
+POLL_INTERVAL = 1.0
+
+# inotify 이벤트 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+_TREE_CHANGES = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_EVENT = struct.Struct("iIII")
+
+
+def _load_libc():
+    """inotify 함수가 있는 libc (리눅스가 아니거나 없으면 None)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class InotifyWatcher:
+    """인덱스에 포함된 디렉토리마다 inotify watch 등록"""
+
+    def __init__(self, index: FileIndex):
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError("inotify is not available")
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        self.watch(index)
+
+    def watch(self, index: FileIndex):
+        """인덱스를 다시 구축한 뒤 감시 대상 디렉토리 재등록"""
+        for wd in self._dirs:
+            self._libc.inotify_rm_watch(self.fd, wd)
+        self._dirs = {}
+        self.pruned_dirs = index.pruned_dirs
+        for dir_path in index.dir_mtimes:
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dir_path), WATCH_MASK)
+            if wd < 0:
+                # watch 수 한도(fs.inotify.max_user_watches) 초과 등
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {dir_path}")
+            rel_dir = os.path.relpath(dir_path, index.root)
+            self._dirs[wd] = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+    def read(self, timeout: Optional[float]) -> Tuple[Set[str], bool]:
+        """timeout 안에 도착한 이벤트의 (변경 파일 상대 경로, 다시 순회 필요 여부)"""
+        changed = set()
+        rescan = False
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed, rescan
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed, rescan
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0"))
+            offset += _EVENT.size + length
+
+            if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF):
+                rescan = True
+            elif mask & IN_IGNORED or wd not in self._dirs:
+                continue
+            elif mask & IN_ISDIR:
+                # 새 디렉토리/디렉토리 삭제는 감시 대상과 인덱스 범위를 바꿈 (제외 디렉토리는 무시)
+                if mask & _TREE_CHANGES and name not in self.pruned_dirs:
+                    rescan = True
+            elif name:
+                changed.add(self._dirs[wd] + name)
+        return changed, rescan
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """인덱스 디렉토리 mtime과 파일 크기/mtime을 주기적으로 비교 (inotify를 쓸 수 없을 때)"""
+
+    def __init__(self, index: FileIndex, interval: float = POLL_INTERVAL):
+        self.interval = interval
+        self.watch(index)
+
+    def watch(self, index: FileIndex):
+        self.root = index.root
+        self.pruned_dirs = index.pruned_dirs
+        self._dirs = dict(index.dir_mtimes)
+        self._files = {entry.rel_path: (entry.size, entry.mtime) for entry in index}
+
+    def _rel_dir(self, dir_path: str) -> str:
+        rel_dir = os.path.relpath(dir_path, self.root)
+        return "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+    def _poll(self) -> Tuple[Set[str], bool]:
+        changed = set()
+        for dir_path, mtime in list(self._dirs.items()):
+            try:
+                if os.stat(dir_path).st_mtime == mtime:
+                    continue
+                self._dirs[dir_path] = os.stat(dir_path).st_mtime
+                names = os.listdir(dir_path)
+            except OSError:
+                return changed, True
+
+            # 디렉토리 목록이 바뀌었으면 새로 생긴/사라진 파일 찾기
+            rel_dir = self._rel_dir(dir_path)
+            for name in names:
+                child = os.path.join(dir_path, name)
+                if os.path.isdir(child):
+                    if name not in self.pruned_dirs and child not in self._dirs:
+                        return changed, True
+                elif rel_dir + name not in self._files:
+                    changed.add(rel_dir + name)
+            present = set(names)
+            changed.update(rel_path for rel_path in self._files
+                           if rel_path.startswith(rel_dir) and "/" not in rel_path[len(rel_dir):]
+                           and rel_path[len(rel_dir):] not in present)
+
+        for rel_path, (size, mtime) in self._files.items():
+            try:
+                stat = os.stat(os.path.join(self.root, rel_path))
+            except OSError:
+                changed.add(rel_path)
+                continue
+            if stat.st_size != size or stat.st_mtime != mtime:
+                changed.add(rel_path)
+
+        for rel_path in changed:
+            try:
+                stat = os.stat(os.path.join(self.root, rel_path))
+                self._files[rel_path] = (stat.st_size, stat.st_mtime)
+            except OSError:
+                self._files.pop(rel_path, None)
+        return changed, False
+
+    def read(self, timeout: Optional[float]) -> Tuple[Set[str], bool]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed, rescan = self._poll()
+            if changed or rescan:
+                return changed, rescan
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed, rescan
+            wait = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+
+    def close(self):
+        pass
+
+
+def create_watcher(index: FileIndex, poll_interval: float = POLL_INTERVAL):
+    """가능하면 inotify, 아니면 폴링 감시"""
+    try:
+        return InotifyWatcher(index)
+    except OSError as e:
+        print(f"⚠️ inotify unavailable ({e}), polling every {poll_interval}s")
+        return PollingWatcher(index, poll_interval)
+
+
+def wait_for_changes(watcher, debounce: float = DEFAULT_DEBOUNCE) -> Tuple[Set[str], bool]:
+    """첫 변경까지 기다린 뒤 debounce 동안 이어지는 변경을 한 묶음으로 모음"""
+    changed, rescan = set(), False
+    # 제외 디렉토리, 해제된 watch 등 무시되는 이벤트만 온 경우는 계속 대기
+    while not changed and not rescan:
+        changed, rescan = watcher.read(None)
+    while True:
+        more, more_rescan = watcher.read(debounce)
+        if not more and not more_rescan:
+            return changed, rescan
+        changed |= more
+        rescan = rescan or more_rescan
+
+
+def derived_fields(result: Dict) -> Dict:
+    """비교 대상 결과 필드 (캐시/인덱스/계측 메타 정보 제외)"""
+    return {field: value for field, value in result.items() if not field.startswith("_")}
+
+
+def watch(analyzer, on_change: Callable[[Dict, List[str]], None],
+          debounce: float = DEFAULT_DEBOUNCE, poll_interval: float = POLL_INTERVAL):
+    """저장소를 감시하며 결과 필드가 바뀔 때마다 on_change(결과, 바뀐 필드 목록) 호출 (Ctrl+C로 종료)"""
+    result = analyzer.analyze()
+    last = derived_fields(result)
+    on_change(result, list(last))
+
+    watcher = create_watcher(analyzer.file_index, poll_interval)
+    watched_index = analyzer.file_index
+    print(f"👀 Watching {analyzer.file_index.root} (Ctrl+C to stop)")
+    try:
+        while True:
+            changed, rescan = wait_for_changes(watcher, debounce)
+            start = time.perf_counter()
+            result = analyzer.analyze() if rescan else analyzer.refresh(changed)
+
+            # 전체 분석으로 인덱스가 다시 구축되었으면 감시 대상 재등록
+            if analyzer.file_index is not watched_index:
+                watched_index = analyzer.file_index
+                watcher.watch(watched_index)
+
+            fields = derived_fields(result)
+            updated = [field for field in fields if fields[field] != last.get(field)]
+            elapsed = (time.perf_counter() - start) * 1000
+            what = "rescan" if rescan else f"{len(changed)} file(s)"
+            if updated:
+                last = fields
+                print(f"♻️ {what} changed → {', '.join(updated)} ({elapsed:.1f} ms)")
+                on_change(result, updated)
+            else:
+                print(f"💤 {what} changed, no derived field changed ({elapsed:.1f} ms)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        analyzer.close()
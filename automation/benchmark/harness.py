@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Analyzer Benchmark Harness
+합성 저장소에서 ApplicationAnalyzer.analyze()와 감지기별 시간을 cold/warm 캐시, 직렬/병렬 모드로 측정하고
+JSON 이력 파일에 기록하며 이전 기록 대비 느려진 항목을 표시
+"""
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzer.code_analyzer import ApplicationAnalyzer
+from analyzer.profiler import DetectorProfiler
+from benchmark.synthetic_repo import LAYOUTS, SIZES, SyntheticRepoGenerator
+
+DEFAULT_HISTORY = "benchmark_history.json"
+DEFAULT_WORKDIR = os.path.join("/tmp", "kdt-bench")
+
+# 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_THRESHOLD = 0.10
+
+# 이보다 짧은 구간은 잡음이 커서 비교하지 않음
+MIN_COMPARE_MS = 5.0
+
+
+def _git_commit() -> Optional[str]:
+    """현재 코드 커밋 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(["git", "-C", os.path.dirname(os.path.abspath(__file__)), "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _scenario_key(scenario: Dict) -> str:
+    return f"{scenario['layout']}-{scenario['size']}-nm{scenario['node_modules_ratio']}"
+
+
+class BenchmarkHarness:
+    """합성 저장소 하나에 대한 벤치마크 실행기"""
+
+    def __init__(self, layout: str, size: str, node_modules_ratio: float = 0.0,
+                 workdir: str = DEFAULT_WORKDIR, repeat: int = 3, jobs: int = 0):
+        self.scenario = {"layout": layout, "size": size, "node_modules_ratio": node_modules_ratio}
+        self.repo_path = os.path.join(workdir, _scenario_key(self.scenario))
+        self.cache_dir = os.path.join(workdir, _scenario_key(self.scenario) + ".cache")
+        self.generator = SyntheticRepoGenerator(layout, SIZES[size], node_modules_ratio)
+        self.repeat = max(1, repeat)
+        self.parallel_jobs = jobs or os.cpu_count() or 1
+
+    def prepare(self):
+        """합성 저장소 생성 (이미 있으면 재사용)"""
+        start = time.perf_counter()
+        if self.generator.generate(self.repo_path):
+            print(f"🏗️ Generated {self.repo_path} in {time.perf_counter() - start:.1f}s")
+        else:
+            print(f"♻️ Reusing {self.repo_path}")
+
+    def _analyze_once(self, jobs: int) -> Dict:
+        """분석 한 번 실행: 전체 시간과 감지기별 자체 시간"""
+        profiler = DetectorProfiler(enabled=True)
+        analyzer = ApplicationAnalyzer(self.repo_path, cache_dir=self.cache_dir, jobs=jobs, profiler=profiler)
+        result = analyzer.analyze()
+        perf = result["_perf"]
+        return {
+            "wall_ms": perf["total"]["wall_ms"],
+            "cpu_ms": perf["total"]["cpu_ms"],
+            "spans": {name: stats["self_wall_ms"] for name, stats in perf["spans"].items()},
+            "files_rescanned": result["_cache"]["incremental"]["files_rescanned"]
+        }
+
+    def _measure(self, jobs: int, warm: bool) -> Dict:
+        """repeat번 측정 후 중앙값 (cold는 매번 영구 캐시 삭제, warm은 한 번 채운 뒤 측정)"""
+        runs = []
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        if warm:
+            self._analyze_once(jobs)
+        for _ in range(self.repeat):
+            if not warm:
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+            runs.append(self._analyze_once(jobs))
+
+        span_names = sorted({name for run in runs for name in run["spans"]})
+        return {
+            "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 3),
+            "cpu_ms": round(statistics.median(run["cpu_ms"] for run in runs), 3),
+            "runs_ms": [run["wall_ms"] for run in runs],
+            "files_rescanned": runs[-1]["files_rescanned"],
+            "spans": {name: round(statistics.median(run["spans"].get(name, 0.0) for run in runs), 3)
+                      for name in span_names}
+        }
+
+    def run(self, modes: List[str]) -> Dict:
+        """모드별 측정 (serial/cold, serial/warm, parallel/cold, parallel/warm)"""
+        self.prepare()
+        results = {}
+        for mode in modes:
+            execution, cache = mode.split("/")
+            jobs = 1 if execution == "serial" else self.parallel_jobs
+            print(f"⏱️ {_scenario_key(self.scenario)} {mode} (jobs={jobs}, repeat={self.repeat})")
+            results[mode] = self._measure(jobs, warm=(cache == "warm"))
+            print(f"   median {results[mode]['wall_ms']:.1f} ms")
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "scenario": self.scenario,
+            "parallel_jobs": self.parallel_jobs,
+            "repeat": self.repeat,
+            "results": results
+        }
+
+
+def load_history(path: str) -> List[Dict]:
+    """이력 파일 읽기 (없으면 빈 목록)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def append_history(path: str, record: Dict):
+    history = load_history(path)
+    history.append(record)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2)
+
+
+def compare_records(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """두 기록의 모드별 전체/감지기 시간 비교 (threshold 이상 느려진 항목 목록)"""
+    regressions = []
+    for mode, result in current["results"].items():
+        base = baseline["results"].get(mode)
+        if base is None:
+            continue
+        metrics = [("total", base["wall_ms"], result["wall_ms"])]
+        metrics += [(name, base["spans"].get(name), ms) for name, ms in result["spans"].items()]
+        for name, before, after in metrics:
+            if before is None or max(before, after) < MIN_COMPARE_MS:
+                continue
+            change = (after - before) / before if before else float("inf")
+            if change > threshold:
+                regressions.append({"mode": mode, "metric": name, "before_ms": before,
+                                    "after_ms": after, "change": round(change, 3)})
+    return regressions
+
+
+def compare_history(history: List[Dict], threshold: float = DEFAULT_THRESHOLD,
+                    baseline_commit: Optional[str] = None) -> int:
+    """마지막 기록을 같은 시나리오의 이전 기록(또는 지정 커밋)과 비교하여 출력 (회귀 수 반환)"""
+    if not history:
+        print("⚠️ Benchmark history is empty")
+        return 0
+
+    current = history[-1]
+    key = _scenario_key(current["scenario"])
+    candidates = [r for r in history[:-1] if _scenario_key(r["scenario"]) == key
+                  and (baseline_commit is None or r.get("commit") == baseline_commit)]
+    if not candidates:
+        print(f"⚠️ No baseline for {key}" + (f" @ {baseline_commit}" if baseline_commit else ""))
+        return 0
+
+    baseline = candidates[-1]
+    print(f"📊 {key}: {baseline.get('commit')} ({baseline['timestamp']}) → {current.get('commit')} ({current['timestamp']})")
+    for mode, result in current["results"].items():
+        base = baseline["results"].get(mode)
+        if base:
+            change = (result["wall_ms"] - base["wall_ms"]) / base["wall_ms"] * 100 if base["wall_ms"] else 0.0
+            print(f"   {mode:<16}{base['wall_ms']:>10.1f} ms → {result['wall_ms']:>10.1f} ms ({change:+.1f}%)")
+
+    regressions = compare_records(baseline, current, threshold)
+    for r in regressions:
+        print(f"🐢 {r['mode']} {r['metric']}: {r['before_ms']:.1f} ms → {r['after_ms']:.1f} ms (+{r['change'] * 100:.1f}%)")
+    if not regressions:
+        print(f"✅ No slowdowns beyond {threshold * 100:.0f}%")
+    return len(regressions)
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ApplicationAnalyzer benchmark harness")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="합성 저장소 벤치마크 실행 후 이력에 기록")
+    run_parser.add_argument("--layout", choices=LAYOUTS, nargs="+", default=["spring"])
+    run_parser.add_argument("--size", choices=list(SIZES), nargs="+", default=["1k"])
+    run_parser.add_argument("--node-modules", type=float, default=0.0, help="node_modules 잡음 파일 비율")
+    run_parser.add_argument("--modes", nargs="+",
+                            default=["serial/cold", "serial/warm", "parallel/cold", "parallel/warm"],
+                            choices=["serial/cold", "serial/warm", "parallel/cold", "parallel/warm"])
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--jobs", type=int, default=0, help="병렬 모드 프로세스 수 (0 = CPU 수)")
+    run_parser.add_argument("--workdir", default=DEFAULT_WORKDIR, help="합성 저장소 생성 위치")
+    run_parser.add_argument("--history", default=DEFAULT_HISTORY)
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = subparsers.add_parser("compare", help="마지막 기록을 이전 기록과 비교")
+    compare_parser.add_argument("--history", default=DEFAULT_HISTORY)
+    compare_parser.add_argument("--baseline", help="비교할 기준 커밋 (기본: 같은 시나리오의 직전 기록)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        regressions = 0
+        for layout in args.layout:
+            for size in args.size:
+                harness = BenchmarkHarness(layout, size, args.node_modules, args.workdir, args.repeat, args.jobs)
+                append_history(args.history, harness.run(args.modes))
+                regressions += compare_history(load_history(args.history), args.threshold)
+        print(f"\n📄 Benchmark history saved to: {args.history}")
+    else:
+        regressions = compare_history(load_history(args.history), args.threshold, args.baseline)
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
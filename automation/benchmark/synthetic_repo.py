@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Synthetic Repository Generator
+app/, skyline_system_demo/ 구조를 본뜬 Spring Boot / Node / Python 합성 저장소를 원하는 파일 수만큼 생성
+"""
+
+import json
+import os
+import random
+from typing import Dict
+
+# 벤치마크 규모 프리셋 (총 파일 수)
+SIZES = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000
+}
+
+LAYOUTS = ("spring", "node", "python")
+
+# 디렉토리 하나에 넣을 최대 소스 파일 수
+FILES_PER_DIR = 50
+
+# 생성 파라미터 기록 파일 (같은 파라미터면 재생성하지 않음)
+MANIFEST_NAME = ".kdt-bench.json"
+
+SPRING_POM = """<?xml version="1.0" encoding="UTF-8"?>
+<project>
+    <modelVersion>4.0.0</modelVersion>
+    <parent>
+        <groupId>org.springframework.boot</groupId>
+        <artifactId>spring-boot-starter-parent</artifactId>
+        <version>3.1.5</version>
+    </parent>
+    <groupId>com.example</groupId>
+    <artifactId>skyline</artifactId>
+    <properties>
+        <java.version>17</java.version>
+    </properties>
+    <dependencies>
+        <dependency>
+            <groupId>org.springframework.boot</groupId>
+            <artifactId>spring-boot-starter-data-jpa</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>com.mysql</groupId>
+            <artifactId>mysql-connector-j</artifactId>
+        </dependency>
+    </dependencies>
+</project>
+"""
+
+SPRING_APPLICATION_YML = """spring:
+  application:
+    name: skyline
+  datasource:
+    url: jdbc:mysql://${DB_HOST:localhost}:${DB_PORT:3306}/${DB_NAME:skyline}
+    username: ${DB_USER:skyline_user}
+    password: ${DB_PASSWORD:changeme}
+  data:
+    redis:
+      host: ${REDIS_HOST:localhost}
+server:
+  port: 8080
+"""
+
+SPRING_MAIN = """package com.example.skyline;
+
+import org.springframework.boot.SpringApplication;
+import org.springframework.boot.autoconfigure.SpringBootApplication;
+
+@SpringBootApplication
+public class SkylineApplication {
+    public static void main(String[] args) {
+        SpringApplication.run(SkylineApplication.class, args);
+    }
+}
+"""
+
+JAVA_TEMPLATES = {
+    "controller": """package com.example.skyline.{pkg};
+
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.*;
+
+@RestController
+@RequestMapping("/api/{name}")
+public class {cls} {{
+{body}}}
+""",
+    "service": """package com.example.skyline.{pkg};
+
+import org.springframework.stereotype.Service;
+
+@Service
+public class {cls} {{
+{body}}}
+""",
+    "repository": """package com.example.skyline.{pkg};
+
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.stereotype.Repository;
+
+@Repository
+public interface {cls} extends JpaRepository<Object, Long> {{
+{body}}}
+""",
+    "entity": """package com.example.skyline.{pkg};
+
+import jakarta.persistence.*;
+
+@Entity
+public class {cls} {{
+{body}}}
+"""
+}
+
+JAVA_METHOD = """    public String method{i}(String value) {{
+        return value + "{i}";
+    }}
+
+"""
+
+NODE_PACKAGE_JSON = {
+    "name": "skyline-frontend",
+    "version": "1.0.0",
+    "dependencies": {"react": "^18.2.0", "axios": "^1.6.0"},
+    "devDependencies": {"typescript": "^5.2.2", "vite": "^5.0.0"},
+    "engines": {"node": ">=18"}
+}
+
+NODE_SERVER_PACKAGE_JSON = {
+    "name": "skyline-api",
+    "version": "1.0.0",
+    "dependencies": {"express": "^4.18.2", "redis": "^4.6.0", "mysql2": "^3.6.0"},
+    "engines": {"node": ">=18"}
+}
+
+TS_TEMPLATE = """import axios from 'axios';
+
+export interface {cls}Props {{
+  id: number;
+  name: string;
+}}
+
+{body}"""
+
+TS_FUNCTION = """export async function fetch{cls}{i}(id: number) {{
+  const response = await axios.get(`/api/{name}/${{id}}`);
+  return response.data;
+}}
+
+"""
+
+JS_TEMPLATE = """const express = require('express');
+const router = express.Router();
+
+{body}module.exports = router;
+"""
+
+JS_ROUTE = """router.get('/{name}/{i}', async (req, res) => {{
+  res.json({{ id: {i}, cache: process.env.REDIS_URL }});
+}});
+
+"""
+
+PYTHON_REQUIREMENTS = """flask==3.0.0
+sqlalchemy==2.0.23
+redis==5.0.1
+gunicorn==21.2.0
+"""
+
+PY_TEMPLATE = """from flask import Blueprint, jsonify
+
+bp = Blueprint("{name}", __name__)
+
+{body}"""
+
+PY_FUNCTION = """@bp.route("/{name}/{i}")
+def handler_{i}():
+    return jsonify({{"id": {i}, "name": "{name}"}})
+
+
+"""
+
+DOCKERFILE = """FROM eclipse-temurin:17-jre
+COPY target/app.jar /app.jar
+EXPOSE {port}
+ENTRYPOINT ["java", "-jar", "/app.jar"]
+"""
+
+NOISE_TEMPLATE = """'use strict';
+module.exports = function noise{i}(a, b) {{
+  return a + b + {i};
+}};
+"""
+
+
+def _write(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def _method_block(template: str, rng: random.Random, **fields) -> str:
+    """파일 크기가 고르지 않도록 1~8개의 함수를 이어 붙임"""
+    return "".join(template.format(i=i, **fields) for i in range(rng.randint(1, 8)))
+
+
+class SyntheticRepoGenerator:
+    """합성 저장소 생성기
+
+    files는 node_modules 잡음 파일을 포함한 총 파일 수이며, node_modules 비율만큼은
+    분석기가 잘라내야 하는 의존성 디렉토리에 생성된다.
+    """
+
+    def __init__(self, layout: str = "spring", files: int = SIZES["1k"],
+                 node_modules_ratio: float = 0.0, seed: int = 0):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout} (choose from {', '.join(LAYOUTS)})")
+        self.layout = layout
+        self.files = files
+        self.node_modules_ratio = node_modules_ratio
+        self.seed = seed
+
+    def params(self) -> Dict:
+        return {
+            "layout": self.layout,
+            "files": self.files,
+            "node_modules_ratio": self.node_modules_ratio,
+            "seed": self.seed
+        }
+
+    def generate(self, root: str) -> bool:
+        """root에 저장소 생성 (같은 파라미터로 이미 생성되어 있으면 False)"""
+        manifest_path = os.path.join(root, MANIFEST_NAME)
+        try:
+            with open(manifest_path) as f:
+                if json.load(f) == self.params():
+                    return False
+        except (OSError, ValueError):
+            pass
+
+        if os.path.isdir(root) and os.listdir(root):
+            raise FileExistsError(f"{root} is not empty and was not generated with these parameters")
+
+        rng = random.Random(self.seed)
+        noise_files = int(self.files * self.node_modules_ratio)
+        source_files = max(0, self.files - noise_files)
+
+        written = getattr(self, f"_generate_{self.layout}")(root, source_files, rng)
+        self._generate_noise(root, noise_files)
+
+        # 나머지는 문서/정적 파일로 채움 (스캔 대상이 아닌 파일)
+        for i in range(max(0, source_files - written)):
+            _write(os.path.join(root, "docs", f"d{i // FILES_PER_DIR}", f"note{i}.md"), f"# Note {i}\n")
+
+        _write(manifest_path, json.dumps(self.params()))
+        return True
+
+    def _fill(self, root: str, subdir: str, count: int, make_file) -> int:
+        """count개의 소스 파일을 FILES_PER_DIR개씩 하위 디렉토리에 나누어 생성"""
+        for i in range(count):
+            rel_path, content = make_file(i)
+            _write(os.path.join(root, subdir, f"m{i // FILES_PER_DIR}", rel_path), content)
+        return count
+
+    def _generate_spring(self, root: str, count: int, rng: random.Random) -> int:
+        """app/ 형태: Maven Spring Boot 백엔드 + React/TypeScript 프론트엔드"""
+        base = os.path.join(root, "src", "main")
+        _write(os.path.join(root, "pom.xml"), SPRING_POM)
+        _write(os.path.join(root, "Dockerfile"), DOCKERFILE.format(port=8080))
+        _write(os.path.join(base, "resources", "application.yml"), SPRING_APPLICATION_YML)
+        _write(os.path.join(base, "java", "com", "example", "skyline", "SkylineApplication.java"), SPRING_MAIN)
+        _write(os.path.join(root, "frontend", "package.json"), json.dumps(NODE_PACKAGE_JSON, indent=2))
+        fixed = 5
+
+        kinds = list(JAVA_TEMPLATES)
+        java_count = max(0, count - fixed) * 2 // 3
+        ts_count = max(0, count - fixed - java_count)
+
+        def java_file(i):
+            kind = kinds[i % len(kinds)]
+            cls = f"{kind.capitalize()}{i}"
+            body = _method_block(JAVA_METHOD, rng)
+            content = JAVA_TEMPLATES[kind].format(pkg=f"{kind}.m{i // FILES_PER_DIR}", name=f"r{i}", cls=cls, body=body)
+            return os.path.join(kind, f"{cls}.java"), content
+
+        def ts_file(i):
+            cls = f"Page{i}"
+            body = _method_block(TS_FUNCTION, rng, cls=cls, name=f"r{i}")
+            return f"{cls}.ts", TS_TEMPLATE.format(cls=cls, body=body)
+
+        written = self._fill(root, os.path.join("src", "main", "java", "com", "example", "skyline"), java_count, java_file)
+        written += self._fill(root, os.path.join("frontend", "src"), ts_count, ts_file)
+        return fixed + written
+
+    def _generate_node(self, root: str, count: int, rng: random.Random) -> int:
+        """Express API 서버 + TypeScript 클라이언트"""
+        _write(os.path.join(root, "package.json"), json.dumps(NODE_SERVER_PACKAGE_JSON, indent=2))
+        _write(os.path.join(root, "Dockerfile"), DOCKERFILE.format(port=3000))
+        fixed = 2
+
+        js_count = max(0, count - fixed) // 2
+        ts_count = max(0, count - fixed - js_count)
+
+        def js_file(i):
+            return f"route{i}.js", JS_TEMPLATE.format(body=_method_block(JS_ROUTE, rng, name=f"r{i}"))
+
+        def ts_file(i):
+            cls = f"Client{i}"
+            return f"{cls}.ts", TS_TEMPLATE.format(cls=cls, body=_method_block(TS_FUNCTION, rng, cls=cls, name=f"r{i}"))
+
+        written = self._fill(root, os.path.join("src", "routes"), js_count, js_file)
+        written += self._fill(root, os.path.join("client", "src"), ts_count, ts_file)
+        return fixed + written
+
+    def _generate_python(self, root: str, count: int, rng: random.Random) -> int:
+        """Flask 애플리케이션 패키지"""
+        _write(os.path.join(root, "requirements.txt"), PYTHON_REQUIREMENTS)
+        _write(os.path.join(root, "Dockerfile"), DOCKERFILE.format(port=5000))
+        fixed = 2
+
+        def py_file(i):
+            return f"views{i}.py", PY_TEMPLATE.format(name=f"r{i}", body=_method_block(PY_FUNCTION, rng, name=f"r{i}"))
+
+        return fixed + self._fill(root, "app", max(0, count - fixed), py_file)
+
+    def _generate_noise(self, root: str, count: int):
+        """node_modules 잡음 (분석기가 순회하지 않아야 하는 파일)"""
+        for i in range(count):
+            path = os.path.join(root, "node_modules", f"pkg{i // FILES_PER_DIR}", "lib", f"index{i}.js")
+            _write(path, NOISE_TEMPLATE.format(i=i))
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Synthetic repository generator for analyzer benchmarks")
+    parser.add_argument("root", help="생성할 저장소 경로")
+    parser.add_argument("--layout", choices=LAYOUTS, default="spring")
+    parser.add_argument("--size", choices=list(SIZES), default="1k", help="총 파일 수 프리셋")
+    parser.add_argument("--node-modules", type=float, default=0.0,
+                        help="node_modules 잡음 파일 비율 (0.0 ~ 1.0)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = SyntheticRepoGenerator(args.layout, SIZES[args.size], args.node_modules, args.seed)
+    if generator.generate(args.root):
+        print(f"✅ Generated {args.layout} repository with {SIZES[args.size]} files: {args.root}")
+    else:
+        print(f"♻️ Reusing existing repository: {args.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,9 @@ class KubernetesGenerator:
         self.namespace = config.get('K8S_NAMESPACE', 'skyline')
         self.image_uri = config.get('ECR_IMAGE_URI', 'nginx:latest')
         self.domain = config.get('DOMAIN_NAME', 'example.com')
+        
+        # 서비스별 노드 그룹에 배치할 때의 service 라벨 (멀티 서비스 생성 시에만 설정)
+        self.node_group = None
     
     def generate_all(self, output_dir: str = "k8s") -> Dict[str, str]:
         """모든 K8s 매니페스트 생성"""
@@ -33,6 +36,16 @@ class KubernetesGenerator:
         
         # 기본 매니페스트들
         generated_files["namespace.yaml"] = self._generate_namespace(output_path)
+        if 'services' in self.analysis_result:
+            generated_files.update(self._generate_services(output_path))
+        else:
+            generated_files.update(self._generate_app_manifests(output_path))
+        
+        return generated_files
+    
+    def _generate_app_manifests(self, output_path: Path) -> Dict[str, str]:
+        """애플리케이션 하나의 Deployment, Service, Ingress, ConfigMap (필요 시 Secret, HPA)"""
+        generated_files = {}
         generated_files["deployment.yaml"] = self._generate_deployment(output_path)
         generated_files["service.yaml"] = self._generate_service(output_path)
         generated_files["ingress.yaml"] = self._generate_ingress(output_path)
@@ -48,6 +61,29 @@ class KubernetesGenerator:
         
         return generated_files
     
+    def _generate_services(self, output_path: Path) -> Dict[str, str]:
+        """멀티 서비스 분석 결과: 서비스별 디렉토리에 각자의 리소스 프로파일로 매니페스트 생성"""
+        generated_files = {}
+        for name, result in self.analysis_result['services'].items():
+            generator = KubernetesGenerator(result, self._service_config(name))
+            generator.node_group = name
+            service_path = output_path / name
+            service_path.mkdir(parents=True, exist_ok=True)
+            for file_name, filepath in generator._generate_app_manifests(service_path).items():
+                generated_files[f"{name}/{file_name}"] = filepath
+        return generated_files
+    
+    def _service_config(self, name: str) -> Dict:
+        """서비스별 설정 (이미지는 ECR_IMAGE_URI_<서비스> 가 있으면 사용, 도메인은 <서비스>.<도메인>)"""
+        key = name.upper().replace('-', '_')
+        return {
+            **self.config,
+            'PROJECT_NAME': f"{self.app_name}-{name}",
+            'K8S_NAMESPACE': self.namespace,
+            'ECR_IMAGE_URI': self.config.get(f'ECR_IMAGE_URI_{key}', self.image_uri),
+            'DOMAIN_NAME': f"{name}.{self.domain}"
+        }
+    
     def _generate_namespace(self, output_path: Path) -> str:
         """네임스페이스 생성"""
         content = f"""apiVersion: v1
@@ -73,6 +109,9 @@ metadata:
         # 환경변수 설정
         env_vars = self._generate_env_vars()
         
+        # 서비스별 노드 그룹 (Terraform의 node group service 라벨)
+        node_selector = f"\n      nodeSelector:\n        service: {self.node_group}" if self.node_group else ""
+        
         content = f"""apiVersion: apps/v1
 kind: Deployment
 metadata:
@@ -92,7 +131,7 @@ spec:
       labels:
         app: {self.app_name}
         version: v1
-    spec:
+    spec:{node_selector}
       containers:
       - name: {self.app_name}
         image: {self.image_uri}
@@ -340,6 +379,9 @@ spec:
             ('APP_NAME', self.app_name)
         ]
         
+        # 런타임 힙 설정 (JAVA_TOOL_OPTIONS / NODE_OPTIONS)
+        app_env_vars.extend(self.analysis_result['resources'].get('runtime_env', {}).items())
+        
         for env_name, env_value in app_env_vars:
             env_vars.append(f"""
         - name: {env_name}
@@ -7,9 +7,12 @@ Dynamic Terraform Code Generator
 import json
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
+# 노드 인스턴스 타입 (작은 것부터)
+INSTANCE_TYPES = ["t3.micro", "t3.small", "t3.medium"]
+
 class TerraformGenerator:
     """Terraform 코드 생성기"""
     
@@ -17,6 +20,9 @@ class TerraformGenerator:
         self.analysis_result = analysis_result
         self.config = config
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # 멀티 서비스 분석 결과면 서비스별 노드 그룹 생성 (없으면 단일 노드 그룹)
+        self.services = analysis_result.get('services')
     
     def generate_all(self, output_dir: str = "terraform") -> Dict[str, str]:
         """모든 Terraform 파일 생성"""
@@ -44,7 +50,7 @@ class TerraformGenerator:
         """메인 Terraform 파일 생성"""
         content = f'''# Generated by Amazon Q Terraform Generator
 # Timestamp: {self.timestamp}
-# Application: {self.analysis_result['framework']}
+# Application: {self._application_label()}
 
 terraform {{
   required_version = ">= 1.0"
@@ -83,10 +89,7 @@ module "eks" {{
   vpc_id              = module.vpc.vpc_id
   private_subnet_ids  = module.vpc.private_subnet_ids
   
-  node_instance_type = var.node_instance_type
-  node_desired_size  = {self.analysis_result['resources']['replicas']}
-  node_max_size      = {self.analysis_result['resources']['replicas'] + 2}
-  node_min_size      = {max(1, self.analysis_result['resources']['replicas'] - 1)}
+{self._node_group_arguments()}
 }}
 '''
 
@@ -122,7 +125,7 @@ module "rds" {{
     def _generate_variables_tf(self, output_path: Path) -> str:
         """변수 파일 생성"""
         content = f'''# Terraform Variables
-# Generated for {self.analysis_result['framework']} application
+# Generated for {self._application_label()} application
 
 variable "aws_region" {{
   description = "AWS region"
@@ -254,9 +257,41 @@ output "rds_port" {
         
         return str(filepath)
     
-    def _get_node_instance_type(self) -> str:
-        """노드 인스턴스 타입 결정"""
-        memory_limit = self.analysis_result['resources']['memory_limit']
+    def _application_label(self) -> str:
+        """파일 헤더에 표시할 프레임워크 (멀티 서비스면 서비스별 프레임워크 목록)"""
+        if self.services is None:
+            return self.analysis_result['framework']
+        return ', '.join(sorted({result['framework'] for result in self.services.values()}))
+    
+    def _node_group_arguments(self) -> str:
+        """eks 모듈에 넘길 노드 그룹 크기 (서비스별 replicas와 메모리 한도 기준)"""
+        if self.services is None:
+            replicas = self.analysis_result['resources']['replicas']
+            return f'''  node_instance_type = var.node_instance_type
+  node_desired_size  = {replicas}
+  node_max_size      = {replicas + 2}
+  node_min_size      = {max(1, replicas - 1)}'''
+        
+        node_groups = []
+        for name, result in self.services.items():
+            replicas = result['resources']['replicas']
+            node_groups.append(f'''    "{name}" = {{
+      instance_type = "{self._get_node_instance_type(result['resources'])}"
+      desired_size  = {replicas}
+      max_size      = {replicas + 2}
+      min_size      = {max(1, replicas - 1)}
+    }}''')
+        return "  node_groups = {\n" + "\n".join(node_groups) + "\n  }"
+    
+    def _get_node_instance_type(self, resources: Optional[Dict] = None) -> str:
+        """노드 인스턴스 타입 결정 (멀티 서비스면 메모리 한도가 가장 큰 서비스 기준)"""
+        if resources is None:
+            if self.services is None:
+                resources = self.analysis_result['resources']
+            else:
+                return max((self._get_node_instance_type(result['resources']) for result in self.services.values()),
+                           key=INSTANCE_TYPES.index, default=INSTANCE_TYPES[0])
+        memory_limit = resources['memory_limit']
         
         if memory_limit == "2Gi":
             return "t3.medium"
@@ -402,6 +437,44 @@ resource "aws_route_table_association" "private" {
         
         files = {}
         
+        if self.services is None:
+            node_group_name = "${var.project_name}-${var.environment}-nodes"
+            node_group = f'''# EKS Node Group
+resource "aws_eks_node_group" "main" {{
+  cluster_name    = aws_eks_cluster.main.name
+  node_group_name = "{node_group_name}"
+  node_role_arn   = aws_iam_role.node.arn
+  subnet_ids      = var.private_subnet_ids
+  instance_types  = [var.node_instance_type]
+
+  scaling_config {{
+    desired_size = var.node_desired_size
+    max_size     = var.node_max_size
+    min_size     = var.node_min_size
+  }}'''
+        else:
+            # 서비스별 노드 그룹 (service 라벨로 각 서비스 Deployment의 nodeSelector와 연결)
+            node_group_name = "${var.project_name}-${var.environment}-${each.key}-nodes"
+            node_group = f'''# EKS Node Groups (per service)
+resource "aws_eks_node_group" "service" {{
+  for_each = var.node_groups
+
+  cluster_name    = aws_eks_cluster.main.name
+  node_group_name = "{node_group_name}"
+  node_role_arn   = aws_iam_role.node.arn
+  subnet_ids      = var.private_subnet_ids
+  instance_types  = [each.value.instance_type]
+
+  scaling_config {{
+    desired_size = each.value.desired_size
+    max_size     = each.value.max_size
+    min_size     = each.value.min_size
+  }}
+
+  labels = {{
+    service = each.key
+  }}'''
+        
         # EKS main.tf (간단 버전)
         main_content = f'''# EKS Cluster
 resource "aws_eks_cluster" "main" {{
@@ -423,19 +496,7 @@ resource "aws_eks_cluster" "main" {{
   }}
 }}
 
-# EKS Node Group
-resource "aws_eks_node_group" "main" {{
-  cluster_name    = aws_eks_cluster.main.name
-  node_group_name = "${{var.project_name}}-${{var.environment}}-nodes"
-  node_role_arn   = aws_iam_role.node.arn
-  subnet_ids      = var.private_subnet_ids
-  instance_types  = [var.node_instance_type]
-
-  scaling_config {{
-    desired_size = var.node_desired_size
-    max_size     = var.node_max_size
-    min_size     = var.node_min_size
-  }}
+{node_group}
 
   depends_on = [
     aws_iam_role_policy_attachment.node_AmazonEKSWorkerNodePolicy,
@@ -444,7 +505,7 @@ resource "aws_eks_node_group" "main" {{
   ]
 
   tags = {{
-    Name        = "${{var.project_name}}-${{var.environment}}-nodes"
+    Name        = "{node_group_name}"
     Environment = var.environment
   }}
 }}
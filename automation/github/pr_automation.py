@@ -43,9 +43,9 @@ class GitHubPRAutomation:
     
     def _create_branch(self):
         """새 브랜치 생성"""
-        subprocess.run(["git", "checkout", "dev"], check=True)
-        subprocess.run(["git", "pull", "origin", "dev"], check=True)
-        subprocess.run(["git", "checkout", "-b", self.branch_name], check=True)
+        # dev를 체크아웃/풀하지 않고 최신 dev 커밋에서 바로 브랜치 생성
+        subprocess.run(["git", "fetch", "origin", "dev"], check=True)
+        subprocess.run(["git", "checkout", "-b", self.branch_name, "FETCH_HEAD"], check=True)
         print(f"✅ Created branch: {self.branch_name}")
     
     def _organize_terraform_files(self):
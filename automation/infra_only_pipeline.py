@@ -119,9 +119,9 @@ def create_infrastructure_pr(analysis_result, terraform_files):
     subprocess.run(["git", "config", "--global", "user.email", "ai@amazonq.aws"], check=True)
     
     # 브랜치 생성
-    subprocess.run(["git", "checkout", "dev"], check=True)
-    subprocess.run(["git", "pull", "origin", "dev"], check=True)
-    subprocess.run(["git", "checkout", "-b", branch_name], check=True)
+    # dev를 체크아웃/풀하지 않고 최신 dev 커밋에서 바로 브랜치 생성
+    subprocess.run(["git", "fetch", "origin", "dev"], check=True)
+    subprocess.run(["git", "checkout", "-b", branch_name, "FETCH_HEAD"], check=True)
     
     # Terraform 파일 정리
     os.makedirs("terraform", exist_ok=True)